@@ -19,12 +19,25 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
+    op.create_table('cfps',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('conference_name', sa.String(length=255), nullable=False),
+        sa.Column('submission_deadline', sa.DateTime(), nullable=False),
+        sa.Column('conference_start_date', sa.DateTime(), nullable=False),
+        sa.Column('conference_end_date', sa.DateTime(), nullable=False),
+        sa.Column('location', sa.String(length=255), nullable=True),
+        sa.Column('is_virtual', sa.Boolean(), nullable=True),
+        sa.Column('topics', sa.Text(), nullable=True),
+        sa.Column('submission_url', sa.String(length=512), nullable=True),
+        sa.Column('source', sa.String(length=100), nullable=False),
+        sa.Column('source_url', sa.String(length=512), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_cfps_id'), 'cfps', ['id'], unique=False)
 
 
 def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
+    op.drop_index(op.f('ix_cfps_id'), table_name='cfps')
+    op.drop_table('cfps')
@@ -0,0 +1,30 @@
+"""Add dedup key and provenance to CFPs
+
+Revision ID: 3c9d2f1a7b54
+Revises: a1bcb7ebcc51
+Create Date: 2026-10-19 09:12:44.318207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c9d2f1a7b54'
+down_revision: Union[str, None] = 'a1bcb7ebcc51'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('cfps', sa.Column('dedup_key', sa.String(length=255), nullable=True))
+    op.add_column('cfps', sa.Column('provenance', sa.JSON(), nullable=True))
+    op.create_index(op.f('ix_cfps_dedup_key'), 'cfps', ['dedup_key'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_cfps_dedup_key'), table_name='cfps')
+    op.drop_column('cfps', 'provenance')
+    op.drop_column('cfps', 'dedup_key')
@@ -0,0 +1,26 @@
+"""Add content hash to CFPs
+
+Revision ID: 5e8a4b0c2d91
+Revises: 3c9d2f1a7b54
+Create Date: 2026-10-19 10:02:17.524913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e8a4b0c2d91'
+down_revision: Union[str, None] = '3c9d2f1a7b54'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('cfps', sa.Column('content_hash', sa.String(length=32), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('cfps', 'content_hash')
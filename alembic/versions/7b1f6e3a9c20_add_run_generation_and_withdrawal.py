@@ -0,0 +1,51 @@
+"""Add ingestion runs, run generation and withdrawal to CFPs
+
+Revision ID: 7b1f6e3a9c20
+Revises: 5e8a4b0c2d91
+Create Date: 2026-10-19 10:41:05.918264
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b1f6e3a9c20'
+down_revision: Union[str, None] = '5e8a4b0c2d91'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('ingestion_runs',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('started_at', sa.DateTime(), nullable=True),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+        sa.Column('inserted', sa.Integer(), nullable=True),
+        sa.Column('updated', sa.Integer(), nullable=True),
+        sa.Column('unchanged', sa.Integer(), nullable=True),
+        sa.Column('withdrawn', sa.Integer(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_ingestion_runs_id'), 'ingestion_runs', ['id'], unique=False)
+    op.add_column('cfps', sa.Column('seen_generation', sa.Integer(), nullable=True))
+    op.add_column('cfps', sa.Column('withdrawn_at', sa.DateTime(), nullable=True))
+    op.create_index('ix_cfps_active_created_at', 'cfps', ['created_at'], unique=False,
+                    postgresql_where=sa.text('withdrawn_at IS NULL'),
+                    sqlite_where=sa.text('withdrawn_at IS NULL'))
+    op.create_index('ix_cfps_active_submission_deadline', 'cfps', ['submission_deadline'], unique=False,
+                    postgresql_where=sa.text('withdrawn_at IS NULL'),
+                    sqlite_where=sa.text('withdrawn_at IS NULL'))
+    op.create_index('ix_cfps_source', 'cfps', ['source'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_cfps_source', table_name='cfps')
+    op.drop_index('ix_cfps_active_submission_deadline', table_name='cfps')
+    op.drop_index('ix_cfps_active_created_at', table_name='cfps')
+    op.drop_column('cfps', 'withdrawn_at')
+    op.drop_column('cfps', 'seen_generation')
+    op.drop_index(op.f('ix_ingestion_runs_id'), table_name='ingestion_runs')
+    op.drop_table('ingestion_runs')
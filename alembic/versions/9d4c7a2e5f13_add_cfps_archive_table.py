@@ -0,0 +1,50 @@
+"""Add cfps_archive table
+
+Revision ID: 9d4c7a2e5f13
+Revises: 7b1f6e3a9c20
+Create Date: 2026-10-19 11:20:39.402817
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d4c7a2e5f13'
+down_revision: Union[str, None] = '7b1f6e3a9c20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('cfps_archive',
+        sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('conference_name', sa.String(length=255), nullable=False),
+        sa.Column('submission_deadline', sa.DateTime(), nullable=True),
+        sa.Column('conference_start_date', sa.DateTime(), nullable=True),
+        sa.Column('conference_end_date', sa.DateTime(), nullable=True),
+        sa.Column('location', sa.String(length=255), nullable=True),
+        sa.Column('is_virtual', sa.Boolean(), nullable=True),
+        sa.Column('topics', sa.Text(), nullable=True),
+        sa.Column('submission_url', sa.String(length=512), nullable=False),
+        sa.Column('source', sa.String(length=100), nullable=False),
+        sa.Column('source_url', sa.String(length=512), nullable=True),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.Column('dedup_key', sa.String(length=255), nullable=True),
+        sa.Column('provenance', sa.JSON(), nullable=True),
+        sa.Column('content_hash', sa.String(length=32), nullable=True),
+        sa.Column('seen_generation', sa.Integer(), nullable=True),
+        sa.Column('withdrawn_at', sa.DateTime(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.Column('archived_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_cfps_archive_dedup_key'), 'cfps_archive', ['dedup_key'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_cfps_archive_dedup_key'), table_name='cfps_archive')
+    op.drop_table('cfps_archive')
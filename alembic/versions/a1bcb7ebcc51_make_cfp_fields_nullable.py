@@ -9,7 +9,7 @@ from typing import Sequence, Union
 
 from alembic import op
 import sqlalchemy as sa
-from sqlalchemy.dialects import postgresql
+
 
 # revision identifiers, used by Alembic.
 revision: str = 'a1bcb7ebcc51'
@@ -19,34 +19,33 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    op.alter_column('cfps', 'submission_deadline',
-               existing_type=postgresql.TIMESTAMP(),
-               nullable=True)
-    op.alter_column('cfps', 'conference_start_date',
-               existing_type=postgresql.TIMESTAMP(),
-               nullable=True)
-    op.alter_column('cfps', 'conference_end_date',
-               existing_type=postgresql.TIMESTAMP(),
-               nullable=True)
-    op.alter_column('cfps', 'submission_url',
-               existing_type=sa.VARCHAR(length=512),
-               nullable=False)
-    # ### end Alembic commands ###
+    # Batch mode recreates the table on SQLite, which cannot alter columns
+    with op.batch_alter_table('cfps') as batch_op:
+        batch_op.alter_column('submission_deadline',
+                   existing_type=sa.DateTime(),
+                   nullable=True)
+        batch_op.alter_column('conference_start_date',
+                   existing_type=sa.DateTime(),
+                   nullable=True)
+        batch_op.alter_column('conference_end_date',
+                   existing_type=sa.DateTime(),
+                   nullable=True)
+        batch_op.alter_column('submission_url',
+                   existing_type=sa.VARCHAR(length=512),
+                   nullable=False)
 
 
 def downgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    op.alter_column('cfps', 'submission_url',
-               existing_type=sa.VARCHAR(length=512),
-               nullable=True)
-    op.alter_column('cfps', 'conference_end_date',
-               existing_type=postgresql.TIMESTAMP(),
-               nullable=False)
-    op.alter_column('cfps', 'conference_start_date',
-               existing_type=postgresql.TIMESTAMP(),
-               nullable=False)
-    op.alter_column('cfps', 'submission_deadline',
-               existing_type=postgresql.TIMESTAMP(),
-               nullable=False)
-    # ### end Alembic commands ###
+    with op.batch_alter_table('cfps') as batch_op:
+        batch_op.alter_column('submission_url',
+                   existing_type=sa.VARCHAR(length=512),
+                   nullable=True)
+        batch_op.alter_column('conference_end_date',
+                   existing_type=sa.DateTime(),
+                   nullable=False)
+        batch_op.alter_column('conference_start_date',
+                   existing_type=sa.DateTime(),
+                   nullable=False)
+        batch_op.alter_column('submission_deadline',
+                   existing_type=sa.DateTime(),
+                   nullable=False)
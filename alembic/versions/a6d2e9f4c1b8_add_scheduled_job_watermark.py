@@ -0,0 +1,26 @@
+"""Add watermark to scheduled_jobs
+
+Revision ID: a6d2e9f4c1b8
+Revises: f3a8c1d5b7e2
+Create Date: 2026-10-19 19:36:12.508371
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6d2e9f4c1b8'
+down_revision: Union[str, None] = 'f3a8c1d5b7e2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('scheduled_jobs', sa.Column('watermark', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('scheduled_jobs', 'watermark')
@@ -0,0 +1,32 @@
+"""Add dataset_version counter
+
+Revision ID: b2e7d4f8a6c3
+Revises: 9d4c7a2e5f13
+Create Date: 2026-10-19 14:02:11.518330
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2e7d4f8a6c3'
+down_revision: Union[str, None] = '9d4c7a2e5f13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    dataset_version = op.create_table('dataset_version',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.bulk_insert(dataset_version, [{'id': 1, 'version': 1}])
+
+
+def downgrade() -> None:
+    op.drop_table('dataset_version')
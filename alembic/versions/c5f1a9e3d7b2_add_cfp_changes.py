@@ -0,0 +1,31 @@
+"""Add cfp_changes log
+
+Revision ID: c5f1a9e3d7b2
+Revises: b2e7d4f8a6c3
+Create Date: 2026-10-19 14:31:47.204615
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5f1a9e3d7b2'
+down_revision: Union[str, None] = 'b2e7d4f8a6c3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('cfp_changes',
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.Column('cfp_id', sa.Integer(), nullable=False),
+        sa.Column('kind', sa.String(length=10), nullable=False),
+        sa.PrimaryKeyConstraint('version', 'cfp_id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('cfp_changes')
@@ -0,0 +1,40 @@
+"""Add source_polls table
+
+Revision ID: e4b8f2a1c6d9
+Revises: d7a3c6e1f8b4
+Create Date: 2026-10-19 17:41:26.318054
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4b8f2a1c6d9'
+down_revision: Union[str, None] = 'd7a3c6e1f8b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('source_polls',
+        sa.Column('key', sa.String(length=150), nullable=False),
+        sa.Column('source', sa.String(length=100), nullable=False),
+        sa.Column('interval_seconds', sa.Integer(), nullable=False),
+        sa.Column('next_poll_at', sa.DateTime(), nullable=False),
+        sa.Column('last_polled_at', sa.DateTime(), nullable=True),
+        sa.Column('last_changed_at', sa.DateTime(), nullable=True),
+        sa.Column('polls', sa.Integer(), nullable=False),
+        sa.Column('changed_polls', sa.Integer(), nullable=False),
+        sa.Column('records_digest', sa.String(length=32), nullable=True),
+        sa.Column('payload_digest', sa.String(length=32), nullable=True),
+        sa.PrimaryKeyConstraint('key')
+    )
+    op.create_index(op.f('ix_source_polls_source'), 'source_polls', ['source'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_source_polls_source'), table_name='source_polls')
+    op.drop_table('source_polls')
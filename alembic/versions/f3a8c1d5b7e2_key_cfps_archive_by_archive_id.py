@@ -0,0 +1,90 @@
+"""Key cfps_archive by its own id and archive each dedup_key once
+
+Revision ID: f3a8c1d5b7e2
+Revises: e4b8f2a1c6d9
+Create Date: 2026-10-19 18:52:07.144930
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a8c1d5b7e2'
+down_revision: Union[str, None] = 'e4b8f2a1c6d9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = (
+    "id, conference_name, submission_deadline, conference_start_date, conference_end_date, "
+    "location, is_virtual, topics, submission_url, source, source_url, description, dedup_key, "
+    "provenance, content_hash, seen_generation, withdrawn_at, created_at, updated_at, archived_at"
+)
+
+
+def _create_archive_table(name: str, surrogate_key: bool) -> None:
+    if surrogate_key:
+        key_columns = [
+            sa.Column('archive_id', sa.Integer(), nullable=False),
+            sa.Column('id', sa.Integer(), nullable=False),
+        ]
+    else:
+        key_columns = [sa.Column('id', sa.Integer(), autoincrement=False, nullable=False)]
+    op.create_table(name,
+        *key_columns,
+        sa.Column('conference_name', sa.String(length=255), nullable=False),
+        sa.Column('submission_deadline', sa.DateTime(), nullable=True),
+        sa.Column('conference_start_date', sa.DateTime(), nullable=True),
+        sa.Column('conference_end_date', sa.DateTime(), nullable=True),
+        sa.Column('location', sa.String(length=255), nullable=True),
+        sa.Column('is_virtual', sa.Boolean(), nullable=True),
+        sa.Column('topics', sa.Text(), nullable=True),
+        sa.Column('submission_url', sa.String(length=512), nullable=False),
+        sa.Column('source', sa.String(length=100), nullable=False),
+        sa.Column('source_url', sa.String(length=512), nullable=True),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.Column('dedup_key', sa.String(length=255), nullable=True),
+        sa.Column('provenance', sa.JSON(), nullable=True),
+        sa.Column('content_hash', sa.String(length=32), nullable=True),
+        sa.Column('seen_generation', sa.Integer(), nullable=True),
+        sa.Column('withdrawn_at', sa.DateTime(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.Column('archived_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('archive_id' if surrogate_key else 'id')
+    )
+
+
+def upgrade() -> None:
+    # The primary key changes, which SQLite cannot ALTER; copy into a new table.
+    # Events archived more than once keep their most recently archived row.
+    _create_archive_table('cfps_archive_new', surrogate_key=True)
+    op.execute(
+        f"INSERT INTO cfps_archive_new ({COLUMNS}) SELECT {COLUMNS} FROM cfps_archive AS archived "
+        "WHERE dedup_key IS NULL OR NOT EXISTS (SELECT 1 FROM cfps_archive AS later "
+        "WHERE later.dedup_key = archived.dedup_key AND (later.archived_at > archived.archived_at "
+        "OR (later.archived_at = archived.archived_at AND later.id > archived.id))) "
+        "ORDER BY archived_at, id"
+    )
+    op.drop_index('ix_cfps_archive_dedup_key', table_name='cfps_archive')
+    op.drop_table('cfps_archive')
+    op.rename_table('cfps_archive_new', 'cfps_archive')
+    op.create_index(op.f('ix_cfps_archive_id'), 'cfps_archive', ['id'], unique=False)
+    op.create_index(op.f('ix_cfps_archive_dedup_key'), 'cfps_archive', ['dedup_key'], unique=True)
+
+
+def downgrade() -> None:
+    # The original cfps ids may repeat in the archive; keep the latest row of each
+    _create_archive_table('cfps_archive_old', surrogate_key=False)
+    op.execute(
+        f"INSERT INTO cfps_archive_old ({COLUMNS}) SELECT {COLUMNS} FROM cfps_archive AS archived "
+        "WHERE NOT EXISTS (SELECT 1 FROM cfps_archive AS later "
+        "WHERE later.id = archived.id AND later.archive_id > archived.archive_id)"
+    )
+    op.drop_index(op.f('ix_cfps_archive_dedup_key'), table_name='cfps_archive')
+    op.drop_index(op.f('ix_cfps_archive_id'), table_name='cfps_archive')
+    op.drop_table('cfps_archive')
+    op.rename_table('cfps_archive_old', 'cfps_archive')
+    op.create_index(op.f('ix_cfps_archive_dedup_key'), 'cfps_archive', ['dedup_key'], unique=False)
@@ -0,0 +1,118 @@
+"""Benchmark hot-path CFP queries before and after archiving expired rows.
+
+Fills a database with CFPs of which 90% ended long ago, times the API list
+query and the notification query, archives the expired rows and times the
+same queries again.
+
+Usage: python benchmarks/bench_archival.py [--rows 200000] [--database-url sqlite:///bench.db]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from src.cfp_tracker.models.cfp import Base, CFP
+from src.cfp_tracker.notifications.service import NotificationService
+from src.cfp_tracker.storage.archival import archive_expired_cfps
+from src.cfp_tracker.storage.queries import list_cfps
+
+TOPICS = ["python", "javascript", "data", "devops", "security", "go", "rust"]
+
+
+def populate(session, rows: int, history_ratio: float):
+    rng = random.Random(7)
+    now = datetime.utcnow()
+    batch = []
+    for i in range(rows):
+        if rng.random() < history_ratio:
+            start = now - timedelta(days=rng.randint(60, 3650))
+        else:
+            start = now + timedelta(days=rng.randint(1, 365))
+        batch.append({
+            "conference_name": f"Conference {i}",
+            "submission_deadline": start - timedelta(days=rng.randint(30, 120)),
+            "conference_start_date": start,
+            "conference_end_date": start + timedelta(days=2),
+            "location": "Somewhere",
+            "is_virtual": False,
+            "topics": [rng.choice(TOPICS)],
+            "submission_url": f"https://example.com/{i}/cfp",
+            "source": "tech-conferences",
+            "source_url": f"https://example.com/{i}",
+            "dedup_key": f"conference {i}|{start.year}",
+            # Everything was ingested recently, as after a fresh backfill
+            "created_at": now - timedelta(hours=rng.randint(0, 48)),
+            "updated_at": now,
+        })
+        if len(batch) == 10_000:
+            session.execute(insert(CFP), batch)
+            batch = []
+    if batch:
+        session.execute(insert(CFP), batch)
+    session.commit()
+
+
+def time_queries(session, repeat: int):
+    now = datetime.utcnow()
+    queries = {
+        "list_open": lambda: list_cfps(session, deadline_from=now, limit=100),
+        "list_topic": lambda: list_cfps(session, topic="python", deadline_from=now, limit=100),
+        "notify_new": lambda: NotificationService(session).get_new_cfps(hours=24),
+    }
+    results = {}
+    for name, query in queries.items():
+        query()  # warm up caches
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            query()
+            samples.append((time.perf_counter() - start) * 1000)
+            session.expunge_all()
+        results[name] = (statistics.median(samples), max(samples))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--history-ratio", type=float, default=0.9)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--database-url", help="Defaults to a temporary SQLite file")
+    args = parser.parse_args()
+
+    url = args.database_url or f"sqlite:///{tempfile.mkdtemp()}/bench_archival.db"
+    engine = create_engine(url)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    session = Session()
+
+    print(f"Populating {args.rows} CFPs ({args.history_ratio:.0%} history) in {engine.url.get_backend_name()}")
+    populate(session, args.rows, args.history_ratio)
+
+    before = time_queries(session, args.repeat)
+    start = time.perf_counter()
+    archived = archive_expired_cfps(session, older_than_days=30, batch_size=5_000)
+    archive_seconds = time.perf_counter() - start
+    after = time_queries(session, args.repeat)
+
+    print(f"Archived {archived} rows in {archive_seconds:.1f}s")
+    print(f"{'query':<12} {'before p50 ms':>14} {'after p50 ms':>13} {'before max':>11} {'after max':>10}")
+    for name in before:
+        print(f"{name:<12} {before[name][0]:>14.2f} {after[name][0]:>13.2f} {before[name][1]:>11.2f} {after[name][1]:>10.2f}")
+
+    session.close()
+    Base.metadata.drop_all(engine)
+
+
+if __name__ == "__main__":
+    main()
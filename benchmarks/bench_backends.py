@@ -0,0 +1,142 @@
+"""Compare ingest and query throughput of the SQLite and Postgres backends.
+
+For each database and size, creates a fresh schema through the app's engine
+setup (so SQLite runs with WAL and the tuned pragmas), then stores synthetic
+CFPs with store_cfps three times: inserting everything, finding everything
+unchanged, and with a tenth of the rows changed. Finally runs a mix of list
+queries from several threads at once and reports queries/s and latencies.
+
+Usage: python benchmarks/bench_backends.py [--sizes 10000,100000]
+           [--database-url sqlite:///bench.db --database-url postgresql://...]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import sessionmaker
+
+from src.cfp_tracker.models.cfp import Base, CFPSchema
+from src.cfp_tracker.storage.cfp_store import store_cfps
+from src.cfp_tracker.storage.database import create_database_engine
+from src.cfp_tracker.storage.queries import list_cfps
+
+TOPICS = ["python", "javascript", "data", "devops", "security", "go", "rust", "ux", "testing", "java"]
+SOURCES = ["tech-conferences", "github_events", "dev.events", "Call4Papers"]
+DEFAULT_SIZES = "10000,100000"
+
+
+def synthetic_cfps(rows: int, changed_every: int = 0):
+    """The same CFPs on every call; every changed_every-th one gets a new description"""
+    rng = random.Random(23)
+    now = datetime(2026, 1, 1)
+    cfps = []
+    for i in range(rows):
+        deadline = now + timedelta(days=rng.randint(1, 365), minutes=rng.randint(0, 1440))
+        cfps.append(CFPSchema(
+            conference_name=f"Conference {i}",
+            submission_deadline=deadline,
+            conference_start_date=deadline + timedelta(days=60),
+            conference_end_date=deadline + timedelta(days=62),
+            location="Berlin, Germany",
+            topics=rng.sample(TOPICS, rng.randint(1, 3)),
+            submission_url=f"https://example.com/{i}/cfp",
+            source=rng.choice(SOURCES),
+            source_url=f"https://example.com/{i}",
+            description="Changed" if changed_every and i % changed_every == 0 else None,
+            dedup_key=f"conference {i}|{deadline.year}",
+        ))
+    return cfps
+
+
+def ingest(Session, cfps, generation: int) -> dict:
+    db = Session()
+    try:
+        start = time.perf_counter()
+        stats = store_cfps(db, cfps, generation=generation)
+        db.commit()
+        seconds = time.perf_counter() - start
+    finally:
+        db.close()
+    return {**stats, "rows_per_sec": len(cfps) / seconds}
+
+
+def query_mix(Session, queries: int, threads: int) -> dict:
+    """Run list queries from several threads; each thread uses its own session"""
+    now = datetime(2026, 1, 1)
+    shapes = [
+        dict(deadline_from=now),
+        dict(topic="python", deadline_from=now),
+        dict(deadline_from=now, deadline_to=now + timedelta(days=30)),
+        dict(source="dev.events", topic="rust"),
+        dict(deadline_from=now, offset=900),
+    ]
+
+    def run(count: int):
+        db = Session()
+        samples = []
+        try:
+            for i in range(count):
+                start = time.perf_counter()
+                list_cfps(db, limit=100, **shapes[i % len(shapes)])
+                samples.append((time.perf_counter() - start) * 1000)
+                # Release the read transaction, as a request would
+                db.rollback()
+        finally:
+            db.close()
+        return samples
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        samples = [ms for result in pool.map(run, [queries // threads] * threads) for ms in result]
+    seconds = time.perf_counter() - start
+    samples.sort()
+    return {
+        "queries_per_sec": len(samples) / seconds,
+        "p50_ms": statistics.median(samples),
+        "p95_ms": samples[int(len(samples) * 0.95)],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="Comma-separated CFP counts")
+    parser.add_argument("--database-url", action="append",
+                        help="Database to benchmark; repeat to compare (default: a temporary SQLite file)")
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=4)
+    args = parser.parse_args()
+
+    urls = args.database_url or [f"sqlite:///{tempfile.mkdtemp()}/bench_backends.db"]
+    print(f"{'database':<10} {'rows':>7} {'insert/s':>9} {'unchanged/s':>12} {'update/s':>9} "
+          f"{'queries/s':>10} {'p50 ms':>7} {'p95 ms':>7}")
+    for url in urls:
+        for size in [int(size) for size in args.sizes.split(",")]:
+            engine = create_database_engine(url, "bench")
+            Base.metadata.drop_all(engine)
+            Base.metadata.create_all(engine)
+            Session = sessionmaker(bind=engine)
+            try:
+                cfps = synthetic_cfps(size)
+                inserted = ingest(Session, cfps, 1)
+                unchanged = ingest(Session, cfps, 2)
+                updated = ingest(Session, synthetic_cfps(size, changed_every=10), 3)
+                queries = query_mix(Session, args.queries, args.threads)
+            finally:
+                Base.metadata.drop_all(engine)
+                engine.dispose()
+            print(f"{make_url(url).get_backend_name():<10} {size:>7} {inserted['rows_per_sec']:>9.0f} "
+                  f"{unchanged['rows_per_sec']:>12.0f} {updated['rows_per_sec']:>9.0f} "
+                  f"{queries['queries_per_sec']:>10.0f} {queries['p50_ms']:>7.2f} {queries['p95_ms']:>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
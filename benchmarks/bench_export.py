@@ -0,0 +1,154 @@
+"""Benchmark the streaming CFP export against loading every row through the ORM.
+
+Fills a database with CFPs once, then exports it in a fresh child process per
+mode, so each peak RSS is measured alone: NDJSON, CSV and Parquet (when pyarrow
+is installed) through the streaming export, and a naive baseline that loads
+all rows with query(CFP).all() before encoding them as NDJSON. Output is
+written to a temporary file; reports rows/s, output size and peak RSS.
+
+Usage: python benchmarks/bench_export.py [--rows 1000000] [--database-url sqlite:///bench.db]
+"""
+import argparse
+import json
+import logging
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from src.cfp_tracker.models.cfp import Base, CFP
+from src.cfp_tracker.storage.export import EXPORT_COLUMNS, iter_cfp_batches, iter_csv, iter_ndjson, write_parquet
+
+TOPICS = ["python", "javascript", "data", "devops", "security", "go", "rust", "ux", "testing", "java"]
+SOURCES = ["tech-conferences", "github_events", "dev.events", "Call4Papers"]
+MODES = ["naive", "ndjson", "csv", "parquet"]
+INSERT_BATCH = 10_000
+
+
+def populate(session, rows: int):
+    rng = random.Random(17)
+    now = datetime.utcnow()
+    for batch_start in range(0, rows, INSERT_BATCH):
+        batch = []
+        for i in range(batch_start, min(rows, batch_start + INSERT_BATCH)):
+            deadline = now + timedelta(days=rng.randint(-365, 365), minutes=rng.randint(0, 1440))
+            batch.append({
+                "conference_name": f"Conference {i}",
+                "submission_deadline": deadline,
+                "conference_start_date": deadline + timedelta(days=60),
+                "conference_end_date": deadline + timedelta(days=62),
+                "location": "Berlin, Germany",
+                "is_virtual": False,
+                "topics": rng.sample(TOPICS, rng.randint(1, 3)),
+                "submission_url": f"https://example.com/{i}/cfp",
+                "source": rng.choice(SOURCES),
+                "source_url": f"https://example.com/{i}",
+                "dedup_key": f"conference {i}|{deadline.year}",
+                "created_at": now,
+                "updated_at": now,
+            })
+        session.execute(insert(CFP), batch)
+        session.commit()
+
+
+def peak_rss_mib() -> float:
+    # ru_maxrss is in KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def export_naive(session, output) -> int:
+    cfps = session.query(CFP).all()
+    for cfp in cfps:
+        row = {name: getattr(cfp, name) for name in EXPORT_COLUMNS}
+        output.write((json.dumps(row, default=str) + "\n").encode("utf-8"))
+    return len(cfps)
+
+
+def run_single(args, mode: str) -> dict:
+    """Export once in this process and report its cost"""
+    session = sessionmaker(bind=create_engine(args.database_url))()
+    path = os.path.join(tempfile.mkdtemp(), f"export.{mode}")
+    baseline_rss = peak_rss_mib()
+    start = time.perf_counter()
+    if mode == "parquet":
+        rows = write_parquet(iter_cfp_batches(session, batch_size=args.batch_size), path)
+    else:
+        with open(path, "wb") as output:
+            if mode == "naive":
+                rows = export_naive(session, output)
+            else:
+                rows = 0
+                encode = iter_ndjson if mode == "ndjson" else iter_csv
+
+                def counted(batches):
+                    nonlocal rows
+                    for batch in batches:
+                        rows += len(batch)
+                        yield batch
+
+                for chunk in encode(counted(iter_cfp_batches(session, batch_size=args.batch_size))):
+                    output.write(chunk)
+    elapsed = time.perf_counter() - start
+    result = {
+        "mode": mode,
+        "rows": rows,
+        "seconds": round(elapsed, 2),
+        "rows_per_second": round(rows / elapsed) if elapsed else 0,
+        "output_mib": round(os.path.getsize(path) / 1024 / 1024, 1),
+        "peak_rss_mib": round(peak_rss_mib(), 1),
+        "startup_rss_mib": round(baseline_rss, 1),
+    }
+    os.remove(path)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--modes", default=",".join(MODES))
+    parser.add_argument("--database-url", help="Defaults to a temporary SQLite file")
+    parser.add_argument("--single", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single is not None:
+        logging.disable(logging.CRITICAL)
+        print(json.dumps(run_single(args, args.single)))
+        return
+
+    args.database_url = args.database_url or f"sqlite:///{tempfile.mkdtemp()}/bench_export.db"
+    engine = create_engine(args.database_url)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    start = time.perf_counter()
+    populate(sessionmaker(bind=engine)(), args.rows)
+    print(f"Inserted {args.rows} CFPs in {time.perf_counter() - start:.1f}s")
+
+    print(f"{'mode':<8} {'rows':>9} {'seconds':>8} {'rows/s':>9} {'output MiB':>11} {'peak RSS MiB':>13}")
+    for mode in args.modes.split(","):
+        if mode == "parquet":
+            try:
+                import pyarrow  # noqa: F401
+            except ImportError:
+                print(f"{mode:<8} skipped, pyarrow is not installed")
+                continue
+        output = subprocess.check_output([
+            sys.executable, os.path.abspath(__file__), "--single", mode,
+            "--database-url", args.database_url, "--batch-size", str(args.batch_size),
+        ], text=True)
+        result = json.loads(output.strip().splitlines()[-1])
+        print(f"{mode:<8} {result['rows']:>9} {result['seconds']:>8} {result['rows_per_second']:>9} "
+              f"{result['output_mib']:>11} {result['peak_rss_mib']:>13}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+"""End-to-end ingestion benchmark against local stub sources.
+
+Starts the stub server (benchmarks/stub_server.py) as a separate process
+serving synthetic payloads of a given size, or the payloads of a recorded
+snapshot run, points CFPIngestionManager at it and runs fetch, resolution
+and storage against SQLite or Postgres. Each size runs in its own process
+so peak RSS is measured per size. Every size is ingested twice: the first
+pass inserts everything, the second finds everything unchanged.
+
+Reports records/sec, peak RSS, DB round trips and per-stage timings, and
+saves them as JSON under benchmarks/results/ so runs of different commits
+can be compared with --compare.
+
+Usage: python benchmarks/bench_ingestion.py [--sizes 1000,10000,100000] [--latency 0.05]
+           [--database-url postgresql://...] [--snapshot-dir snapshots/] [--compare old.json]
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(REPO_ROOT)
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.stub_server import point_adapters_at
+from src.cfp_tracker.ingestion.manager import CFPIngestionManager
+from src.cfp_tracker.ingestion.pipeline import store_resolved_cfps
+from src.cfp_tracker.ingestion.resolution import resolve_duplicates
+from src.cfp_tracker.models.cfp import Base
+
+DEFAULT_SIZES = "1000,10000,100000"
+RESULTS_DIR = os.path.join(REPO_ROOT, "benchmarks", "results")
+
+
+def start_stub_server(args, size: int):
+    """Launch the stub server process; returns it with its base URL once it is serving"""
+    command = [
+        sys.executable, os.path.join(REPO_ROOT, "benchmarks", "stub_server.py"), "--port", "0",
+        "--latency", str(args.latency), "--jitter", str(args.jitter),
+    ]
+    if args.snapshot_dir:
+        command += ["--snapshot-dir", args.snapshot_dir]
+        if args.run_id:
+            command += ["--run-id", args.run_id]
+    else:
+        command += ["--cfps", str(size)]
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+    # The server prints its address once payloads are rendered and it listens
+    line = process.stdout.readline()
+    if " at " not in line:
+        process.kill()
+        raise RuntimeError(f"Stub server failed to start: {line!r}")
+    return process, line.strip().rsplit(" at ", 1)[1]
+
+
+class RoundTripCounter:
+    """Counts statements sent to the database; an executemany counts once"""
+
+    def __init__(self, engine):
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+
+async def ingest_once(manager, Session, counter: RoundTripCounter) -> dict:
+    timings = {}
+    start = time.perf_counter()
+    cfps = await manager.fetch_all_cfps()
+    timings["fetch"] = time.perf_counter() - start
+
+    stage = time.perf_counter()
+    resolved = resolve_duplicates(cfps)
+    timings["resolve"] = time.perf_counter() - stage
+
+    stage = time.perf_counter()
+    round_trips = counter.count
+    db = Session()
+    try:
+        stats = store_resolved_cfps(db, manager, resolved)
+    finally:
+        db.close()
+    timings["store"] = time.perf_counter() - stage
+    total = time.perf_counter() - start
+
+    return {
+        "fetched": len(cfps),
+        "resolved": len(resolved),
+        "stats": stats,
+        "stage_seconds": {name: round(seconds, 4) for name, seconds in timings.items()},
+        "total_seconds": round(total, 4),
+        "records_per_sec": round(len(cfps) / total, 1) if total else None,
+        "db_round_trips": counter.count - round_trips,
+    }
+
+
+async def run_single(args, size: int) -> dict:
+    """Benchmark one size in this process against a fresh schema"""
+    url = args.database_url or f"sqlite:///{tempfile.mkdtemp()}/bench_ingestion.db"
+    engine = create_engine(url)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    counter = RoundTripCounter(engine)
+
+    process, base_url = start_stub_server(args, size)
+    try:
+        manager = CFPIngestionManager()
+        # Recording the benchmark's own payloads would only add noise
+        manager.snapshot_store = None
+        point_adapters_at(manager, base_url, recorded=bool(args.snapshot_dir))
+
+        passes = []
+        for _ in range(args.passes):
+            passes.append(await ingest_once(manager, Session, counter))
+    finally:
+        process.terminate()
+        process.wait()
+        Base.metadata.drop_all(engine)
+        engine.dispose()
+
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        peak_rss //= 1024
+    return {
+        "size": size if not args.snapshot_dir else None,
+        "peak_rss_mb": round(peak_rss / 1024, 1),
+        "passes": passes,
+    }
+
+
+def child_command(args, size: int) -> list:
+    command = [
+        sys.executable, os.path.abspath(__file__), "--single", str(size),
+        "--latency", str(args.latency), "--jitter", str(args.jitter), "--passes", str(args.passes),
+    ]
+    for flag, value in (("--database-url", args.database_url), ("--snapshot-dir", args.snapshot_dir),
+                        ("--run-id", args.run_id)):
+        if value:
+            command += [flag, value]
+    return command
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, text=True, stderr=subprocess.DEVNULL
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def print_results(results: list):
+    print(f"{'size':>9} {'pass':>5} {'fetched':>8} {'rec/s':>9} {'fetch s':>8} {'resolve s':>10} "
+          f"{'store s':>8} {'round trips':>12} {'rss MB':>7}")
+    for result in results:
+        for number, run in enumerate(result["passes"], 1):
+            stages = run["stage_seconds"]
+            print(f"{str(result['size'] or 'recorded'):>9} {number:>5} {run['fetched']:>8} "
+                  f"{run['records_per_sec'] or 0:>9.0f} {stages['fetch']:>8.2f} {stages['resolve']:>10.2f} "
+                  f"{stages['store']:>8.2f} {run['db_round_trips']:>12} {result['peak_rss_mb']:>7.0f}")
+
+
+def compare(results: list, baseline_path: str):
+    """Print records/sec of each size and pass relative to a saved run"""
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    previous = {(r["size"], i): run for r in baseline["results"] for i, run in enumerate(r["passes"])}
+    print(f"\nCompared with {baseline['commit']} ({baseline_path}):")
+    for result in results:
+        for i, run in enumerate(result["passes"]):
+            old = previous.get((result["size"], i))
+            if not old or not old["records_per_sec"] or not run["records_per_sec"]:
+                continue
+            change = run["records_per_sec"] / old["records_per_sec"] - 1
+            print(f"  size {result['size'] or 'recorded'} pass {i + 1}: "
+                  f"{old['records_per_sec']:.0f} -> {run['records_per_sec']:.0f} rec/s ({change:+.1%}), "
+                  f"round trips {old['db_round_trips']} -> {run['db_round_trips']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default=DEFAULT_SIZES,
+                        help="Comma-separated CFP counts served by the stub (1000000 works but is slow)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Stub response latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--passes", type=int, default=2)
+    parser.add_argument("--database-url", help="Defaults to a temporary SQLite file per size")
+    parser.add_argument("--snapshot-dir", help="Serve a recorded snapshot run instead of synthetic payloads")
+    parser.add_argument("--run-id", help="Recorded run to serve (default: latest)")
+    parser.add_argument("--output", help="Results file (default: benchmarks/results/ingestion-<commit>-<time>.json)")
+    parser.add_argument("--compare", help="Results file of an earlier run to compare with")
+    parser.add_argument("--single", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single is not None:
+        logging.disable(logging.CRITICAL)
+        print(json.dumps(asyncio.run(run_single(args, args.single))))
+        return
+
+    sizes = [0] if args.snapshot_dir else [int(size) for size in args.sizes.split(",")]
+    results = []
+    for size in sizes:
+        print(f"Benchmarking {'recorded payloads' if args.snapshot_dir else f'{size} CFPs'}...", flush=True)
+        output = subprocess.check_output(child_command(args, size), text=True)
+        results.append(json.loads(output.strip().splitlines()[-1]))
+
+    commit = git_commit()
+    report = {
+        "commit": commit,
+        "timestamp": datetime.utcnow().isoformat(),
+        "database": (args.database_url or "sqlite").split(":", 1)[0],
+        "latency": args.latency,
+        "jitter": args.jitter,
+        "results": results,
+    }
+    output_path = args.output or os.path.join(
+        RESULTS_DIR, f"ingestion-{commit}-{datetime.utcnow().strftime('%Y%m%dT%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    with open(output_path, "w") as f:
+        json.dump(report, f, indent=2)
+
+    print_results(results)
+    print(f"\nSaved results to {output_path}")
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Benchmark the in-memory read model of open CFPs against the database query.
+
+Fills a database with open CFPs, builds the read model from it, checks that
+both paths return the same rows for a set of list queries, then reports
+p50 latencies of each path and the memory the read model uses per 10k CFPs.
+
+Usage: python benchmarks/bench_read_model.py [--rows 10000] [--database-url sqlite:///bench.db]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from src.cfp_tracker.models.cfp import Base, CFP
+from src.cfp_tracker.storage.queries import list_cfps
+from src.cfp_tracker.storage.read_model import OpenCFPReadModel
+
+TOPICS = ["python", "javascript", "data", "devops", "security", "go", "rust", "ux", "testing", "java"]
+SOURCES = ["tech-conferences", "github_events", "dev.events", "Call4Papers"]
+
+
+def populate(session, rows: int):
+    rng = random.Random(11)
+    now = datetime.utcnow()
+    batch = []
+    for i in range(rows):
+        deadline = now + timedelta(days=rng.randint(1, 365), minutes=rng.randint(0, 1440))
+        batch.append({
+            "conference_name": f"Conference {i}",
+            "submission_deadline": deadline,
+            "conference_start_date": deadline + timedelta(days=60),
+            "conference_end_date": deadline + timedelta(days=62),
+            "location": "Berlin, Germany",
+            "is_virtual": False,
+            "topics": rng.sample(TOPICS, rng.randint(1, 3)),
+            "submission_url": f"https://example.com/{i}/cfp",
+            "source": rng.choice(SOURCES),
+            "source_url": f"https://example.com/{i}",
+            "dedup_key": f"conference {i}|{deadline.year}",
+            "created_at": now,
+            "updated_at": now,
+        })
+    session.execute(insert(CFP), batch)
+    session.commit()
+
+
+def median_us(query, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        query()
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--database-url", help="Defaults to a temporary SQLite file")
+    args = parser.parse_args()
+
+    url = args.database_url or f"sqlite:///{tempfile.mkdtemp()}/bench_read_model.db"
+    engine = create_engine(url)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    populate(session, args.rows)
+
+    model = OpenCFPReadModel()
+    start = time.perf_counter()
+    model.refresh(session)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    now = datetime.utcnow()
+    queries = {
+        "open": dict(deadline_from=now),
+        "open_topic": dict(topic="python", deadline_from=now),
+        "window_30d": dict(deadline_from=now, deadline_to=now + timedelta(days=30)),
+        "source_topic": dict(source="dev.events", topic="rust", deadline_from=now),
+        "deep_page": dict(deadline_from=now, offset=900),
+    }
+    print(f"{'query':<14} {'db p50 us':>10} {'model p50 us':>13} {'speedup':>8}")
+    for name, filters in queries.items():
+        assert model.can_serve(filters["deadline_from"])
+        expected = list_cfps(session, limit=100, **filters)
+        actual = model.query(limit=100, **filters)
+        assert [r["id"] for r in expected] == [r["id"] for r in actual], f"{name}: read model disagrees with DB"
+        db_us = median_us(lambda: list_cfps(session, limit=100, **filters), args.repeat)
+        model_us = median_us(lambda: model.query(limit=100, **filters), args.repeat)
+        print(f"{name:<14} {db_us:>10.0f} {model_us:>13.1f} {db_us / model_us:>7.0f}x")
+
+    stats = model.stats()
+    print(f"\nBuilt {stats['cfps']} CFPs in {build_ms:.0f}ms; "
+          f"{stats['memory_bytes'] / 1024 / 1024:.1f} MiB, "
+          f"{stats['memory_bytes_per_10k_cfps'] / 1024 / 1024:.1f} MiB per 10k CFPs")
+
+    session.close()
+    Base.metadata.drop_all(engine)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""Benchmark streaming the events README against fetching it whole.
+
+Serves a developers-conferences-agenda style README of each size from the
+stub server in a separate process, then fetches and parses it two ways:
+the former path, the contents API's JSON with the file base64-encoded,
+decoded and split in memory before parsing, and the adapter's streaming
+path, the raw media type read in chunks and parsed line by line. Also
+times the parser alone over lines already in memory. Correctness is
+covered by test_markdown_events.py.
+
+Reports MB/s and the peak of Python allocations (tracemalloc) per path.
+The parsed records are part of every peak: the adapter returns them as one
+list, so streaming only removes the copies of the file from the peak.
+
+Usage: python benchmarks/bench_readme_parser.py [--sizes-mb 1,5,20]
+"""
+import argparse
+import asyncio
+import base64
+import json
+import logging
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(REPO_ROOT)
+
+import aiohttp
+
+from benchmarks.stub_server import StubSourceServer, render_agenda_readme, synthetic_events
+from src.cfp_tracker.ingestion.github_events_adapter import GitHubEventsAdapter
+from src.cfp_tracker.ingestion.markdown_events import iter_markdown_events
+
+# Average size of a rendered README entry, to pick the event count for a size
+BYTES_PER_EVENT = 250
+
+
+async def serve_readme(size_mb: float):
+    """Child process: serve a README of about size_mb until killed"""
+    server = StubSourceServer(cfps=8)
+    server.github_files["README.md"] = render_agenda_readme(
+        synthetic_events(int(size_mb * 2**20 / BYTES_PER_EVENT), seed=3)
+    )
+    base_url = await server.start()
+    print(f"Stub README server at {base_url}", flush=True)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+def start_readme_server(size_mb: float):
+    process = subprocess.Popen(
+        [sys.executable, os.path.abspath(__file__), "--serve", str(size_mb)], stdout=subprocess.PIPE, text=True
+    )
+    line = process.stdout.readline()
+    if " at " not in line:
+        process.kill()
+        raise RuntimeError(f"README server failed to start: {line!r}")
+    return process, line.strip().rsplit(" at ", 1)[1]
+
+
+async def fetch_buffered(url: str) -> int:
+    """The former path: whole JSON body, base64 decoded, split, then parsed"""
+    async with aiohttp.ClientSession() as session:
+        async with session.get(url, headers={"Accept": "application/vnd.github.v3+json"}) as response:
+            body = await response.text()
+    content = base64.b64decode(json.loads(body)["content"]).decode("utf-8")
+    return len(list(iter_markdown_events(content.splitlines())))
+
+
+async def fetch_streamed(url: str) -> int:
+    adapter = GitHubEventsAdapter()
+    async with adapter._client_session() as session:
+        return len(await adapter._fetch_markdown_events(session, url, "README.md"))
+
+
+def measure(run):
+    """Events, seconds and peak traced bytes of a path; timed without tracing, which slows it"""
+    start = time.perf_counter()
+    events = run()
+    seconds = time.perf_counter() - start
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return events, seconds, peak
+
+
+def bench_size(size_mb: float):
+    process, base_url = start_readme_server(size_mb)
+    url = f"{base_url}/repos/o/r/contents/README.md"
+    try:
+        readme = asyncio.run(_raw(url))
+        size = len(readme.encode("utf-8"))
+        lines = readme.splitlines()
+        del readme
+        results = [
+            ("parser only", measure(lambda: len(list(iter_markdown_events(lines))))),
+            ("buffered", measure(lambda: asyncio.run(fetch_buffered(url)))),
+            ("streamed", measure(lambda: asyncio.run(fetch_streamed(url)))),
+        ]
+    finally:
+        process.kill()
+        process.wait()
+
+    for path, (events, seconds, peak) in results:
+        print(
+            f"{size / 2**20:6.1f} MB  {path:<12} {events:>7} events  {size / 2**20 / seconds:7.1f} MB/s  "
+            f"peak {peak / 2**20:7.1f} MB"
+        )
+
+
+async def _raw(url: str) -> str:
+    async with aiohttp.ClientSession() as session:
+        async with session.get(url, headers={"Accept": "application/vnd.github.raw+json"}) as response:
+            return await response.text()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes-mb", default="1,5,20", help="Comma-separated README sizes in MB")
+    parser.add_argument("--serve", type=float, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    if args.serve is not None:
+        asyncio.run(serve_readme(args.serve))
+        return
+    for size_mb in (float(size) for size in args.sizes_mb.split(",")):
+        bench_size(size_mb)
+
+
+if __name__ == "__main__":
+    main()
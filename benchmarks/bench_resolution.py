@@ -0,0 +1,69 @@
+"""Benchmark cross-source duplicate resolution at increasing input sizes.
+
+Generates synthetic CFPs where every event is reported by up to three
+sources with slightly different names, and reports the time per record so
+near-linear scaling can be checked up to 1M records.
+
+Usage: python benchmarks/bench_resolution.py [--sizes 1000 10000 100000 1000000]
+"""
+import argparse
+import random
+import sys
+import os
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.cfp_tracker.ingestion.resolution import resolve_duplicates
+from src.cfp_tracker.models.cfp import CFPSchema
+
+WORDS = [
+    "py", "js", "data", "cloud", "rust", "go", "devops", "security", "ml", "web",
+    "mobile", "api", "kube", "edge", "react", "vue", "java", "scala", "infra", "ops",
+]
+SOURCES = ["tech-conferences", "github_events", "dev.events"]
+
+
+def generate(size: int, seed: int = 42):
+    rng = random.Random(seed)
+    cfps = []
+    event = 0
+    base = datetime(2025, 1, 1)
+    while len(cfps) < size:
+        name = f"{rng.choice(WORDS).title()}{rng.choice(WORDS).title()} Ed{event}"
+        start = base + timedelta(days=rng.randrange(0, 730))
+        for source in rng.sample(SOURCES, rng.randint(1, 3)):
+            variant = name if rng.random() < 0.5 else f"{name} {start.year}"
+            cfps.append(CFPSchema(
+                conference_name=variant,
+                submission_deadline=start - timedelta(days=60),
+                conference_start_date=start + timedelta(days=rng.randint(0, 1)),
+                conference_end_date=start + timedelta(days=2),
+                location="Somewhere",
+                submission_url=f"https://example.com/{event}/cfp",
+                source=source,
+                source_url=f"https://example.com/{event}",
+            ))
+            if len(cfps) >= size:
+                break
+        event += 1
+    return cfps, event
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    print(f"{'records':>10} {'events':>10} {'resolved':>10} {'seconds':>9} {'us/record':>10}")
+    for size in args.sizes:
+        cfps, events = generate(size)
+        start = time.perf_counter()
+        resolved = resolve_duplicates(cfps)
+        elapsed = time.perf_counter() - start
+        print(f"{size:>10} {events:>10} {len(resolved):>10} {elapsed:>9.2f} {elapsed / size * 1e6:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""Load test the API in production mode with a growing number of workers.
+
+Starts the production server (run.py --production) once per worker count
+against a database filled with CFPs, drives it with a fixed number of
+concurrent keep-alive clients for a fixed time, and reports requests/sec
+and latency percentiles for each worker count. Scaling is bounded by the
+cores of the machine: expect gains up to roughly one worker per core.
+
+Usage: python benchmarks/bench_server.py [--workers 1,2,4] [--concurrency 64] [--duration 10]
+"""
+import argparse
+import asyncio
+import os
+import random
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(REPO_ROOT)
+
+import aiohttp
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from src.cfp_tracker.models.cfp import Base, CFP
+
+TOPICS = ["python", "javascript", "data", "devops", "security", "go", "rust", "ux", "testing", "java"]
+SOURCES = ["tech-conferences", "github_events", "dev.events", "Call4Papers"]
+
+# Mix of requests each client cycles through
+PATHS = [
+    "/api/v1/cfps?limit=50",
+    "/api/v1/cfps?open_only=true&topic=python&limit=20",
+    "/api/v1/cfps?source=github_events&limit=20&offset=40",
+    "/health",
+]
+
+
+def populate(url: str, rows: int):
+    engine = create_engine(url)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    rng = random.Random(5)
+    now = datetime.utcnow()
+    batch = []
+    for i in range(rows):
+        deadline = now + timedelta(days=rng.randint(-60, 300))
+        batch.append({
+            "conference_name": f"Conference {i}",
+            "submission_deadline": deadline,
+            "conference_start_date": deadline + timedelta(days=60),
+            "conference_end_date": deadline + timedelta(days=62),
+            "location": "Berlin, Germany",
+            "is_virtual": False,
+            "topics": rng.sample(TOPICS, rng.randint(1, 3)),
+            "submission_url": f"https://example.com/{i}/cfp",
+            "source": rng.choice(SOURCES),
+            "source_url": f"https://example.com/{i}",
+            "dedup_key": f"conference {i}|{deadline.year}",
+            "created_at": now,
+            "updated_at": now,
+        })
+    session.execute(insert(CFP), batch)
+    session.commit()
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(workers: int, port: int, database_url: str) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "DATABASE_URL": database_url,
+        "API_HOST": "127.0.0.1",
+        "API_PORT": str(port),
+        "API_WORKERS": str(workers),
+        "API_ACCESS_LOG": "false",
+    }
+    env.pop("PROMETHEUS_MULTIPROC_DIR", None)
+    return subprocess.Popen(
+        [sys.executable, "-c", "from src.cfp_tracker.server import serve; "
+         f"serve('src.cfp_tracker.api.app:app', production=True, port={port})"],
+        cwd=REPO_ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        start_new_session=True
+    )
+
+
+async def wait_ready(base_url: str, timeout: float = 30):
+    deadline = time.monotonic() + timeout
+    async with aiohttp.ClientSession() as session:
+        while time.monotonic() < deadline:
+            try:
+                async with session.get(f"{base_url}/health") as response:
+                    if response.status == 200:
+                        return
+            except aiohttp.ClientError:
+                pass
+            await asyncio.sleep(0.2)
+    raise RuntimeError(f"Server at {base_url} did not start")
+
+
+async def drive(base_url: str, concurrency: int, duration: float, warmup: float) -> dict:
+    """Run concurrent clients and collect latencies after the warmup"""
+    latencies = []
+    errors = 0
+    start = time.monotonic()
+    measure_from = start + warmup
+    stop_at = measure_from + duration
+    connector = aiohttp.TCPConnector(limit=concurrency)
+
+    async with aiohttp.ClientSession(connector=connector) as session:
+        async def client(number: int):
+            nonlocal errors
+            i = number
+            while time.monotonic() < stop_at:
+                path = PATHS[i % len(PATHS)]
+                i += 1
+                sent = time.monotonic()
+                try:
+                    async with session.get(base_url + path) as response:
+                        await response.read()
+                        ok = response.status == 200
+                except aiohttp.ClientError:
+                    ok = False
+                if sent >= measure_from:
+                    if ok:
+                        latencies.append(time.monotonic() - sent)
+                    else:
+                        errors += 1
+
+        await asyncio.gather(*(client(n) for n in range(concurrency)))
+
+    latencies.sort()
+    return {
+        "requests_per_second": round(len(latencies) / duration),
+        "p50_ms": round(statistics.median(latencies) * 1000, 1) if latencies else None,
+        "p99_ms": round(latencies[int(len(latencies) * 0.99)] * 1000, 1) if latencies else None,
+        "errors": errors,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", default="1,2,4", help="Comma-separated worker counts")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--warmup", type=float, default=2)
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--database-url", help="Defaults to a temporary SQLite file")
+    args = parser.parse_args()
+
+    database_url = args.database_url or f"sqlite:///{tempfile.mkdtemp()}/bench_server.db"
+    populate(database_url, args.rows)
+    print(f"{os.cpu_count()} CPUs, {args.concurrency} concurrent clients, {args.duration}s per run")
+    print(f"{'workers':>7} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8} {'errors':>7}")
+
+    for workers in [int(count) for count in args.workers.split(",")]:
+        port = free_port()
+        server = start_server(workers, port, database_url)
+        try:
+            base_url = f"http://127.0.0.1:{port}"
+            asyncio.run(wait_ready(base_url))
+            result = asyncio.run(drive(base_url, args.concurrency, args.duration, args.warmup))
+        finally:
+            os.killpg(server.pid, signal.SIGTERM)
+            server.wait()
+        print(f"{workers:>7} {result['requests_per_second']:>8} {result['p50_ms']:>8} "
+              f"{result['p99_ms']:>8} {result['errors']:>7}")
+
+
+if __name__ == "__main__":
+    main()
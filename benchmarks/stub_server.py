@@ -0,0 +1,363 @@
+"""Local stub server that impersonates every CFP source.
+
+Serves synthetic payloads in the formats the adapters expect (confs.tech
+category JSON, the GitHub contents API, the dev.events HTML table and the
+paginated Call4Papers API) and can inject faults: added latency, transient
+503s, connection resets and hung requests. Used by the benchmarks and to
+exercise adapter retries and circuit breaking without touching the real
+sources.
+
+Usage: python benchmarks/stub_server.py [--port 8765] [--cfps 10000] [--error-rate 0.2] ...
+"""
+import argparse
+import asyncio
+import base64
+import json
+import os
+import random
+import sys
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from aiohttp import web
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+CATEGORIES = [
+    "python", "javascript", "java", "dotnet", "cpp", "rust",
+    "go", "php", "ruby", "scala", "kotlin", "swift", "android",
+    "ios", "data", "devops", "security", "testing", "ux", "accessibility"
+]
+CITIES = [("Berlin", "Germany"), ("Austin", "U.S.A."), ("Lyon", "France"), ("Online", "Online")]
+
+
+class FaultProfile:
+    """Faults injected into stub responses
+
+    Args:
+        latency: Seconds added to every response
+        jitter: Extra random latency of up to this many seconds
+        error_rate: Probability of answering 503
+        reset_rate: Probability of dropping the connection
+        hang_rate: Probability of never answering within any sane timeout
+        fail_first: Number of initial requests per path answered with 503
+    """
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0,
+                 reset_rate: float = 0.0, hang_rate: float = 0.0, fail_first: int = 0):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.reset_rate = reset_rate
+        self.hang_rate = hang_rate
+        self.fail_first = fail_first
+
+
+def synthetic_events(count: int, seed: int = 1) -> List[Dict]:
+    """Generate source-neutral synthetic conference records"""
+    rng = random.Random(seed)
+    base = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    events = []
+    for i in range(count):
+        start = base + timedelta(days=rng.randint(7, 400))
+        city, country = rng.choice(CITIES)
+        events.append({
+            "index": i,
+            "name": f"Stub Conf N{i}",
+            "start": start,
+            "end": start + timedelta(days=rng.randint(0, 3)),
+            "deadline": start - timedelta(days=rng.randint(20, 120)),
+            "city": city,
+            "country": country,
+            "online": city == "Online",
+            "category": CATEGORIES[i % len(CATEGORIES)],
+            "url": f"https://stub.example/{i}",
+        })
+    return events
+
+
+def render_agenda_readme(events: List[Dict]) -> str:
+    """developers-conferences-agenda style README: year and month sections of list items with CFP badges"""
+    lines = ["# Developers Conferences Agenda", ""]
+    year = month = None
+    for e in sorted(events, key=lambda e: (e["start"], e["index"])):
+        if e["start"].year != year:
+            year, month = e["start"].year, None
+            lines += [f"## {year}", ""]
+        if e["start"].month != month:
+            month = e["start"].month
+            lines += ["", f"### {e['start'].strftime('%B')}", ""]
+        days = e["start"].strftime("%d") if e["end"] == e["start"] else f"{e['start']:%d}-{e['end']:%d}"
+        until = e["deadline"].strftime("%d-%B-%Y")
+        lines.append(
+            f"* {days}: [{e['name']}]({e['url']}) - {e['city']} ({e['country']}) "
+            f"<a href=\"{e['url']}/cfp\"><img alt=\"CFP {e['name']}\" "
+            f"src=\"https://img.shields.io/static/v1?label=CFP&message=until%20{until}&color=green\"></a>"
+        )
+    return "\n".join(lines) + "\n"
+
+
+# (source, status, body) of recorded payloads by path and sorted query parameters
+RecordedPayloads = Dict[Tuple[str, Tuple[Tuple[str, str], ...]], Tuple[str, int, str]]
+
+
+def _recorded_key(path: str, query) -> Tuple[str, Tuple[Tuple[str, str], ...]]:
+    """Key of a recorded payload: its path and query parameters, in any order"""
+    return path, tuple(sorted(query))
+
+
+class StubSourceServer:
+    """aiohttp application serving synthetic or recorded source payloads
+
+    Synthetic payloads are rendered once per size so the server itself does
+    not dominate benchmark timings. Recorded payloads come from a run of the
+    snapshot store and are served by URL path and query, whatever host
+    recorded them; a request the run never made gets a 404.
+    """
+
+    def __init__(self, cfps: int = 1000, faults: Optional[FaultProfile] = None,
+                 faults_by_source: Optional[Dict[str, FaultProfile]] = None, seed: int = 1,
+                 recorded: Optional[RecordedPayloads] = None,
+                 call4papers_pagination: str = "pages", call4papers_max_page_size: int = 50):
+        self.faults = faults or FaultProfile()
+        # "pages" reports total_pages, "cursor" returns next_cursor
+        self.call4papers_pagination = call4papers_pagination
+        self.call4papers_max_page_size = call4papers_max_page_size
+        self.faults_by_source = faults_by_source or {}
+        self.rng = random.Random(seed)
+        self.request_counts: Dict[str, int] = {}
+        self.recorded = recorded
+        self.app = web.Application()
+        if recorded is not None:
+            self.app.router.add_get("/{tail:.*}", self.recorded_payload)
+        else:
+            self._render(synthetic_events(cfps, seed))
+            self.app.router.add_get("/conferences/{year}/{category}.json", self.confstech)
+            self.app.router.add_get("/repos/{owner}/{repo}/contents/{path:.*}", self.github_contents)
+            self.app.router.add_get("/conferences", self.dev_events)
+            self.app.router.add_get("/api/v1/cfp", self.call4papers)
+        self._runner: Optional[web.AppRunner] = None
+        self._stopping: Optional[asyncio.Event] = None
+
+    @classmethod
+    def from_snapshot(cls, snapshot_dir: str, run_id: Optional[str] = None, **kwargs) -> "StubSourceServer":
+        """Serve the payloads of a recorded run (the latest one by default)"""
+        from src.cfp_tracker.ingestion.snapshots import SnapshotStore
+
+        store = SnapshotStore(snapshot_dir)
+        run = store.load_run(run_id or store.list_runs()[-1])
+        recorded = {}
+        for entry in run.entries:
+            body = store.get(entry["digest"]).decode("utf-8")
+            parts = urlsplit(entry["url"])
+            query = parse_qsl(parts.query) + [(name, str(value)) for name, value in (entry["params"] or {}).items()]
+            recorded[_recorded_key(parts.path, query)] = (entry["source"], entry["status"], body)
+        return cls(recorded=recorded, **kwargs)
+
+    def _render(self, events: List[Dict]):
+        # Split the records evenly across the four sources
+        shares = [events[i::4] for i in range(4)]
+        confstech, github, dev_events, call4papers = shares
+
+        self.confstech_payloads = {category: [] for category in CATEGORIES}
+        for e in confstech:
+            self.confstech_payloads[e["category"]].append({
+                "name": e["name"], "url": e["url"],
+                "startDate": e["start"].strftime("%Y-%m-%d"), "endDate": e["end"].strftime("%Y-%m-%d"),
+                "city": e["city"], "country": e["country"], "online": e["online"],
+                "cfpUrl": f"{e['url']}/cfp", "cfpEndDate": e["deadline"].strftime("%Y-%m-%d"),
+            })
+        self.confstech_payloads = {k: json.dumps(v) for k, v in self.confstech_payloads.items()}
+
+        half = len(github) // 2
+        events_json = json.dumps([{
+            "name": e["name"], "date": e["start"].strftime("%Y-%m-%d"),
+            "cfp_deadline": e["deadline"].strftime("%Y-%m-%d"), "cfp_url": f"{e['url']}/cfp",
+            "location": f"{e['city']}, {e['country']}", "url": e["url"],
+        } for e in github[:half]])
+        self.github_files = {"events.json": events_json, "README.md": render_agenda_readme(github[half:])}
+
+        rows = "".join(
+            f"<tr><td><a href=\"/conferences/{e['index']}\">{e['name']}</a></td>"
+            f"<td>{e['start'].strftime('%B %d, %Y')} - {e['end'].strftime('%B %d, %Y')}</td>"
+            f"<td>{e['city']}, {e['country']}</td></tr>"
+            for e in dev_events
+        )
+        self.dev_events_html = f"<html><body><table><tr><th>Name</th><th>Date</th><th>Location</th></tr>{rows}</table></body></html>"
+
+        self.call4papers_records = [{
+            "id": e["index"], "conference_name": e["name"],
+            "submission_deadline": e["deadline"].strftime("%Y-%m-%d"),
+            "conference_start_date": e["start"].strftime("%Y-%m-%d"),
+            "conference_end_date": e["end"].strftime("%Y-%m-%d"),
+            "location": f"{e['city']}, {e['country']}", "is_virtual": e["online"],
+            "topics": [e["category"]], "submission_url": f"{e['url']}/cfp", "source_url": e["url"],
+        } for e in call4papers]
+
+    async def _inject(self, request: web.Request, source: str) -> Optional[web.Response]:
+        """Apply the fault profile of a source; returns a response to short-circuit with"""
+        faults = self.faults_by_source.get(source, self.faults)
+        count = self.request_counts.get(request.path, 0) + 1
+        self.request_counts[request.path] = count
+
+        delay = faults.latency + (self.rng.uniform(0, faults.jitter) if faults.jitter else 0)
+        if delay:
+            await asyncio.sleep(delay)
+        if count <= faults.fail_first or self.rng.random() < faults.error_rate:
+            return web.Response(status=503, text="injected failure")
+        if self.rng.random() < faults.hang_rate:
+            # Released by stop(), which would otherwise wait for it to finish
+            try:
+                await asyncio.wait_for(self._stopping.wait(), 3600)
+            except asyncio.TimeoutError:
+                pass
+        if self.rng.random() < faults.reset_rate:
+            request.transport.close()
+            raise asyncio.CancelledError()
+        return None
+
+    async def confstech(self, request: web.Request) -> web.Response:
+        fault = await self._inject(request, "confs.tech")
+        if fault:
+            return fault
+        payload = self.confstech_payloads.get(request.match_info["category"])
+        if payload is None:
+            return web.Response(status=404)
+        return web.Response(text=payload, content_type="application/json")
+
+    async def github_contents(self, request: web.Request) -> web.Response:
+        fault = await self._inject(request, "github_events")
+        if fault:
+            return fault
+        content = self.github_files.get(request.match_info["path"])
+        if content is None:
+            return web.Response(status=404)
+        if "raw" in request.headers.get("Accept", ""):
+            return web.Response(text=content, content_type="text/plain")
+        encoded = base64.b64encode(content.encode("utf-8")).decode("ascii")
+        return web.json_response({"content": encoded, "encoding": "base64"})
+
+    async def dev_events(self, request: web.Request) -> web.Response:
+        fault = await self._inject(request, "dev_events")
+        if fault:
+            return fault
+        return web.Response(text=self.dev_events_html, content_type="text/html")
+
+    async def call4papers(self, request: web.Request) -> web.Response:
+        """Open CFPs with deadlines between start_date and end_date, one page at a time"""
+        fault = await self._inject(request, "call4papers")
+        if fault:
+            return fault
+        query = request.query
+        today = datetime.utcnow().strftime("%Y-%m-%d")
+        start = max(query.get("start_date", today), today) if query.get("status") == "open" else query.get("start_date", "")
+        end = query.get("end_date", "9999-12-31")
+        records = [r for r in self.call4papers_records if start <= r["submission_deadline"] <= end]
+
+        page_size = min(int(query.get("per_page", self.call4papers_max_page_size)), self.call4papers_max_page_size)
+        if self.call4papers_pagination == "cursor":
+            offset = int(base64.urlsafe_b64decode(query["cursor"]).decode("ascii")) if "cursor" in query else 0
+            page = records[offset:offset + page_size]
+            body = {"cfps": page}
+            if offset + page_size < len(records):
+                body["next_cursor"] = base64.urlsafe_b64encode(str(offset + page_size).encode("ascii")).decode("ascii")
+            return web.json_response(body)
+        page = int(query.get("page", 1))
+        total_pages = max(1, -(-len(records) // page_size))
+        return web.json_response({
+            "cfps": records[(page - 1) * page_size:page * page_size],
+            "page": page,
+            "total_pages": total_pages,
+        })
+
+    async def recorded_payload(self, request: web.Request) -> web.Response:
+        payload = self.recorded.get(_recorded_key(request.path, request.query.items()))
+        if payload is None:
+            return web.Response(status=404)
+        source, status, body = payload
+        fault = await self._inject(request, source)
+        if fault:
+            return fault
+        return web.Response(status=status, text=body)
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start serving in the running event loop; returns the base URL"""
+        self._stopping = asyncio.Event()
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        return f"http://{host}:{port}"
+
+    async def stop(self):
+        if self._stopping is not None:
+            self._stopping.set()
+        if self._runner:
+            await self._runner.cleanup()
+
+
+def point_adapters_at(manager, base_url: str, recorded: bool = False):
+    """Redirect the manager's adapters from the real sources to the stub server
+
+    For recorded payloads only the scheme and host of each adapter URL are
+    replaced, since the stub serves them under their original paths.
+    """
+    for adapter in manager.adapters.values():
+        if recorded:
+            for attr in ("base_url", "api_url"):
+                url = getattr(adapter, attr, None)
+                if url:
+                    parts = urlsplit(url)
+                    setattr(adapter, attr, f"{base_url}{parts.path}")
+            continue
+        name = type(adapter).__name__
+        if name == "ConfsTechAdapter":
+            adapter.base_url = f"{base_url}/conferences/2024"
+        elif name == "GitHubEventsAdapter":
+            adapter.api_url = base_url
+        elif name == "DevEventsAdapter":
+            adapter.base_url = f"{base_url}/conferences"
+        elif name == "Call4PapersAdapter":
+            adapter.api_url = f"{base_url}/api/v1/cfp"
+
+
+async def _serve(args):
+    faults = FaultProfile(
+        latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+        reset_rate=args.reset_rate, hang_rate=args.hang_rate, fail_first=args.fail_first,
+    )
+    if args.snapshot_dir:
+        server = StubSourceServer.from_snapshot(args.snapshot_dir, args.run_id, faults=faults)
+        description = f"{len(server.recorded)} recorded payloads"
+    else:
+        server = StubSourceServer(cfps=args.cfps, faults=faults,
+                                  call4papers_pagination=args.call4papers_pagination)
+        description = f"{args.cfps} CFPs"
+    base_url = await server.start(port=args.port)
+    print(f"Stub sources serving {description} at {base_url}", flush=True)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--cfps", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--reset-rate", type=float, default=0.0)
+    parser.add_argument("--hang-rate", type=float, default=0.0)
+    parser.add_argument("--fail-first", type=int, default=0)
+    parser.add_argument("--call4papers-pagination", choices=["pages", "cursor"], default="pages")
+    parser.add_argument("--snapshot-dir", help="Serve payloads recorded in this snapshot store")
+    parser.add_argument("--run-id", help="Recorded run to serve (default: latest)")
+    asyncio.run(_serve(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
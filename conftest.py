@@ -0,0 +1,10 @@
+import pytest
+
+from src.cfp_tracker.config import Config
+
+
+@pytest.fixture(autouse=True)
+def fast_retries(monkeypatch):
+    """Shorten adapter retry backoff so fault-injection tests run quickly"""
+    monkeypatch.setattr(Config, "ADAPTER_RETRY_BASE_DELAY", 0.05)
+    monkeypatch.setattr(Config, "ADAPTER_RETRY_MAX_DELAY", 0.2)
@@ -1,13 +1,12 @@
-import uvicorn
-import os
+import sys
+import logging
 from dotenv import load_dotenv
 
 load_dotenv()
+logging.basicConfig(level=logging.INFO)
+
+from src.cfp_tracker.server import serve
 
 if __name__ == "__main__":
-    uvicorn.run(
-        "src.cfp_tracker.api.app:app",
-        host=os.getenv("API_HOST", "0.0.0.0"),
-        port=8001,
-        reload=True
-    ) 
\ No newline at end of file
+    # Development server on port 8001; pass --production for the multi-worker mode
+    serve("src.cfp_tracker.api.app:app", production="--production" in sys.argv, port=8001)
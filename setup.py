@@ -10,6 +10,11 @@ setup(
         "sqlalchemy",
         "aiohttp",
         "beautifulsoup4",
+        "prometheus-client",
     ],
+    extras_require={
+        "parquet": ["pyarrow"],
+        "server": ["uvloop; sys_platform != 'win32'", "httptools"],
+    },
     python_requires=">=3.9",
 ) 
\ No newline at end of file
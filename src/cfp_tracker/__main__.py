@@ -1,19 +1,21 @@
-import uvicorn
-import os
+import argparse
+import logging
 from dotenv import load_dotenv
 
 load_dotenv()
+logging.basicConfig(level=logging.INFO)
+
+from .server import serve
 
 def main():
     """Run the application"""
-    uvicorn.run(
-        "cfp_tracker.api.app:app",
-        host=os.getenv("API_HOST", "0.0.0.0"),
-        port=int(os.getenv("API_PORT", 8000)),
-        reload=os.getenv("DEBUG", "False").lower() == "true",
-        reload_dirs=["src"],
-        factory=False
-    )
+    parser = argparse.ArgumentParser(description="Run the CFP Tracker API")
+    parser.add_argument("--production", action="store_true",
+                        help="Run API_WORKERS worker processes without reload")
+    parser.add_argument("--workers", type=int, help="Worker processes in production mode")
+    parser.add_argument("--port", type=int)
+    args = parser.parse_args()
+    serve("cfp_tracker.api.app:app", production=args.production, port=args.port, workers=args.workers)
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main() 
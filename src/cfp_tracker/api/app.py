@@ -1,17 +1,63 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from contextlib import asynccontextmanager
+import asyncio
 import logging
 
-from .endpoints import ingestion, notifications
+from .endpoints import calendar, cfps, export, ingestion, notifications, profiling, scheduler
+from ..config import Config
+from .cfp_stream import cfp_stream
+from .response_cache import response_cache
+from ..storage.database import SessionLocal, dispose_engine, get_engine
+from ..storage.dataset_version import dataset_version
+from ..storage.read_model import open_cfps, refresh_periodically
+from ..utils.metrics import MetricsMiddleware, render_metrics
+from ..utils.profiling import ProfilingMiddleware
+from ..utils.tracing import TracingMiddleware
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def _refresh_read_model(version: int):
+    """Rebuild the read model as soon as another process changes the data."""
+    db = SessionLocal()
+    try:
+        open_cfps.refresh_if_loaded(db)
+    finally:
+        db.close()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create database-backed resources at startup rather than at import.
+    
+    Loads the open CFP read model and keeps it refreshed, and follows the
+    dataset version to invalidate cached responses and the read model and
+    to stream changes, whenever the data changes.
+    """
+    read_model_task = None
+    if Config.READ_MODEL_ENABLED:
+        read_model_task = asyncio.create_task(
+            refresh_periodically(SessionLocal, Config.READ_MODEL_REFRESH_SECONDS)
+        )
+    
+    dataset_version.on_change(response_cache.clear)
+    dataset_version.on_change(_refresh_read_model)
+    cfp_stream.start(asyncio.get_running_loop(), SessionLocal)
+    dataset_version.on_change(cfp_stream.on_version_change)
+    dataset_version.start(get_engine(), SessionLocal)
+    
+    yield
+    
+    if read_model_task is not None:
+        read_model_task.cancel()
+    dispose_engine()
+
 app = FastAPI(
     title="CFP Tracker API",
     description="API for tracking and managing Call for Papers",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Configure CORS
@@ -22,10 +68,18 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(ProfilingMiddleware)
+app.add_middleware(TracingMiddleware)
 
 # Include routers
+app.include_router(cfps.router, prefix="/api/v1/cfps", tags=["cfps"])
 app.include_router(ingestion.router, prefix="/api/v1/ingestion", tags=["ingestion"])
 app.include_router(notifications.router, prefix="/api/v1/notifications", tags=["notifications"])
+app.include_router(profiling.router, prefix="/api/v1/profiling", tags=["profiling"])
+app.include_router(export.router, prefix="/api/v1/export", tags=["export"])
+app.include_router(calendar.router, prefix="/api/v1", tags=["calendar"])
+app.include_router(scheduler.router, prefix="/api/v1/scheduler", tags=["scheduler"])
 
 @app.get("/")
 async def root():
@@ -36,6 +90,13 @@ async def root():
         "redoc_url": "/redoc"
     }
 
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    """Prometheus metrics."""
+    body, content_type = render_metrics()
+    # As a header rather than media_type, which would get a second charset
+    return Response(content=body, headers={"Content-Type": content_type})
+
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"} 
\ No newline at end of file
@@ -0,0 +1,185 @@
+import gzip
+import hashlib
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional
+
+from ..config import Config
+
+PRODID = "-//CFP Tracker//CFP deadlines//EN"
+
+
+def _escape(text: str) -> str:
+    """Escape a TEXT value per RFC 5545"""
+    return (
+        text.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,")
+        .replace("\r\n", "\\n").replace("\n", "\\n")
+    )
+
+
+def _fold(line: str) -> str:
+    """Fold a content line into CRLF-separated lines of at most 75 octets"""
+    encoded = line.encode("utf-8")
+    if len(encoded) <= 75:
+        return line + "\r\n"
+    parts = []
+    limit = 75
+    while encoded:
+        cut = min(limit, len(encoded))
+        # Never split a multi-byte character
+        while cut < len(encoded) and (encoded[cut] & 0xC0) == 0x80:
+            cut -= 1
+        parts.append(encoded[:cut].decode("utf-8"))
+        encoded = encoded[cut:]
+        limit = 74  # Continuation lines start with a space
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def _utc(value: datetime) -> str:
+    return value.strftime("%Y%m%dT%H%M%SZ")
+
+
+def _date(value: datetime) -> str:
+    return value.strftime("%Y%m%d")
+
+
+def _cfp_events(cfp: Dict[str, Any], stamp: str) -> Iterator[List[str]]:
+    """VEVENT properties for a CFP's deadline and for its conference dates"""
+    name = _escape(cfp["conference_name"])
+    categories = ",".join(_escape(topic) for topic in cfp["topics"] or [])
+    common = [f"DTSTAMP:{stamp}"]
+    if categories:
+        common.append(f"CATEGORIES:{categories}")
+
+    if cfp["submission_deadline"] is not None:
+        description = f"Submit at {cfp['submission_url']}"
+        if cfp["description"]:
+            description += f"\n\n{cfp['description']}"
+        yield [
+            f"UID:cfp-{cfp['id']}-deadline@cfp-tracker",
+            *common,
+            f"DTSTART:{_utc(cfp['submission_deadline'])}",
+            f"DTEND:{_utc(cfp['submission_deadline'])}",
+            f"SUMMARY:CFP deadline: {name}",
+            f"URL:{cfp['submission_url']}",
+            f"DESCRIPTION:{_escape(description)}",
+            "TRANSP:TRANSPARENT",
+        ]
+
+    if cfp["conference_start_date"] is not None:
+        end = cfp["conference_end_date"] or cfp["conference_start_date"]
+        event = [
+            f"UID:cfp-{cfp['id']}-conference@cfp-tracker",
+            *common,
+            f"DTSTART;VALUE=DATE:{_date(cfp['conference_start_date'])}",
+            # DTEND of an all-day event is exclusive
+            f"DTEND;VALUE=DATE:{_date(end + timedelta(days=1))}",
+            f"SUMMARY:{name}",
+            f"URL:{cfp['source_url'] or cfp['submission_url']}",
+            "TRANSP:TRANSPARENT",
+        ]
+        if cfp["location"]:
+            event.append(f"LOCATION:{_escape(cfp['location'])}")
+        yield event
+
+
+def render_calendar(cfps: List[Dict[str, Any]], name: str) -> bytes:
+    """Render CFPs as an iCalendar (RFC 5545) feed.
+
+    Each CFP yields a timed event at its submission deadline and an
+    all-day event spanning the conference, when those dates are known.
+
+    Args:
+        cfps: Rows from list_calendar_cfps
+        name: Calendar name shown by clients
+
+    Returns:
+        bytes: The feed, UTF-8 encoded with CRLF line endings
+    """
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:{PRODID}",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        f"X-WR-CALNAME:{_escape(name)}",
+        f"REFRESH-INTERVAL;VALUE=DURATION:PT{Config.CALENDAR_MAX_AGE_SECONDS // 60}M",
+    ]
+    for cfp in cfps:
+        stamp = _utc(cfp["updated_at"] or cfp["created_at"] or datetime.utcnow())
+        for event in _cfp_events(cfp, stamp):
+            lines.append("BEGIN:VEVENT")
+            lines.extend(event)
+            lines.append("END:VEVENT")
+    lines.append("END:VCALENDAR")
+    return "".join(_fold(line) for line in lines).encode("utf-8")
+
+
+class CalendarFeed(NamedTuple):
+    version: int
+    etag: str
+    body: bytes
+    gzipped: bytes
+
+
+class CalendarFeedCache:
+    """Rendered feeds per filter set, rebuilt at most once per dataset version
+
+    A feed built at an older version is rebuilt by the first request that
+    sees it; concurrent requests for the same feed wait for that one build
+    instead of querying the database themselves. ETags hash the content,
+    so clients keep getting 304 when a change did not touch their feed.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._feeds: "OrderedDict[str, CalendarFeed]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._build_locks: Dict[str, threading.Lock] = {}
+        self.builds = 0
+
+    def _cached(self, key: str, version: int) -> Optional[CalendarFeed]:
+        with self._lock:
+            feed = self._feeds.get(key)
+            if feed is not None and feed.version == version:
+                self._feeds.move_to_end(key)
+                return feed
+            return None
+
+    def get(self, key: str, version: int, build: Callable[[], bytes]) -> CalendarFeed:
+        """The feed for a filter set at a dataset version, building it if needed"""
+        feed = self._cached(key, version)
+        if feed is not None:
+            return feed
+
+        with self._lock:
+            build_lock = self._build_locks.setdefault(key, threading.Lock())
+        with build_lock:
+            # Another request may have built it while this one waited
+            feed = self._cached(key, version)
+            if feed is not None:
+                return feed
+            body = build()
+            digest = hashlib.blake2b(body, digest_size=12).hexdigest()
+            feed = CalendarFeed(version, f'"{digest}"', body, gzip.compress(body, compresslevel=6))
+            with self._lock:
+                self.builds += 1
+                self._feeds[key] = feed
+                self._feeds.move_to_end(key)
+                while len(self._feeds) > self.max_entries:
+                    evicted, _ = self._feeds.popitem(last=False)
+                    self._build_locks.pop(evicted, None)
+            return feed
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "feeds": len(self._feeds),
+                "bytes": sum(len(feed.body) + len(feed.gzipped) for feed in self._feeds.values()),
+                "builds": self.builds,
+            }
+
+
+# One cache per worker process
+calendar_feeds = CalendarFeedCache(Config.CALENDAR_CACHE_MAX_FEEDS)
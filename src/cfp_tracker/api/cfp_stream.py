@@ -0,0 +1,202 @@
+import asyncio
+import json
+import logging
+import threading
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+
+from fastapi import Request
+from fastapi.concurrency import run_in_threadpool
+from pydantic import TypeAdapter
+from sqlalchemy.orm import Session
+
+from ..config import Config
+from ..models.cfp import CFPResponse
+from ..storage.changes import ChangeCursor, is_retained, latest_change, read_changes
+
+logger = logging.getLogger(__name__)
+
+_cfp = TypeAdapter(CFPResponse)
+
+
+def _session_call(session_factory: Callable[[], Session], function, *args):
+    db = session_factory()
+    try:
+        return function(db, *args)
+    finally:
+        db.close()
+
+
+class StreamClient:
+    """One connected client: its filters, a bounded queue and the last change sent"""
+
+    def __init__(
+        self,
+        cursor: ChangeCursor,
+        source: Optional[str] = None,
+        topic: Optional[str] = None,
+        deadline_from: Optional[datetime] = None,
+        deadline_to: Optional[datetime] = None
+    ):
+        self.cursor = cursor
+        self.source = source
+        self.topic = topic
+        self.deadline_from = deadline_from
+        self.deadline_to = deadline_to
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=Config.CFP_STREAM_QUEUE_SIZE)
+        self.overflowed = False
+
+    def matches(self, cfp: Dict[str, Any]) -> bool:
+        if self.source is not None and cfp["source"] != self.source:
+            return False
+        if self.topic is not None and self.topic not in (cfp["topics"] or []):
+            return False
+        deadline = cfp["submission_deadline"]
+        if self.deadline_from is not None and (deadline is None or deadline < self.deadline_from):
+            return False
+        if self.deadline_to is not None and (deadline is None or deadline > self.deadline_to):
+            return False
+        return True
+
+    def offer(self, change: Dict[str, Any]):
+        """Queue a change without blocking; a full queue switches the client to resync"""
+        if self.overflowed or not self.matches(change["cfp"]):
+            return
+        try:
+            self.queue.put_nowait(change)
+        except asyncio.QueueFull:
+            # Drop the backlog; the client catches up from the change log instead
+            self.overflowed = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(None)
+
+
+class CFPStreamBroadcaster:
+    """Fans logged CFP changes out to the stream clients of this worker
+
+    Whenever the dataset version changes, in this process or another one,
+    new changes are read from the log once and offered to every client.
+    """
+
+    def __init__(self):
+        self._clients: set = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._session_factory: Optional[Callable[[], Session]] = None
+        self._cursor: Optional[ChangeCursor] = None
+        self._lock = threading.Lock()
+
+    def start(self, loop: asyncio.AbstractEventLoop, session_factory: Callable[[], Session]):
+        self._loop = loop
+        self._session_factory = session_factory
+        self._cursor = _session_call(session_factory, latest_change)
+
+    def on_version_change(self, version: int):
+        """Read the new changes and publish them; called from any thread"""
+        if self._loop is None:
+            return
+        with self._lock:
+            while True:
+                changes = _session_call(
+                    self._session_factory, read_changes, self._cursor, Config.CFP_STREAM_REPLAY_LIMIT
+                )
+                if not changes:
+                    return
+                self._cursor = changes[-1]["cursor"]
+                self._loop.call_soon_threadsafe(self._publish, changes)
+                if len(changes) < Config.CFP_STREAM_REPLAY_LIMIT:
+                    return
+
+    def _publish(self, changes: List[Dict[str, Any]]):
+        for client in list(self._clients):
+            # A client that fails must not keep the changes from the others
+            try:
+                for change in changes:
+                    client.offer(change)
+            except Exception as e:
+                logger.error(f"Error offering CFP changes to a stream client: {e}")
+
+    async def current_cursor(self) -> ChangeCursor:
+        if self._cursor is None:
+            return await run_in_threadpool(_session_call, self._session_factory, latest_change)
+        return self._cursor
+
+    def connect(self, client: StreamClient):
+        self._clients.add(client)
+
+    def disconnect(self, client: StreamClient):
+        self._clients.discard(client)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "clients": len(self._clients),
+            "lagging_clients": sum(1 for client in self._clients if client.overflowed),
+            "cursor": list(self._cursor) if self._cursor else None,
+        }
+
+
+def _change_event(change: Dict[str, Any]) -> str:
+    data = _cfp.dump_json(_cfp.validate_python(change["cfp"])).decode("utf-8")
+    return _event(change["kind"], data, change["id"])
+
+
+def _event(event: str, data: str, event_id: Optional[str] = None) -> str:
+    prefix = f"id: {event_id}\n" if event_id else ""
+    return f"{prefix}event: {event}\ndata: {data}\n\n"
+
+
+async def _replay(broadcaster: CFPStreamBroadcaster, client: StreamClient) -> AsyncIterator[str]:
+    """Send the logged changes after the client's cursor, or a resync event if too many were missed"""
+    session_factory = broadcaster._session_factory
+    retained = await run_in_threadpool(_session_call, session_factory, is_retained, client.cursor)
+    changes = []
+    if retained:
+        changes = await run_in_threadpool(
+            _session_call, session_factory, read_changes, client.cursor, Config.CFP_STREAM_REPLAY_LIMIT + 1
+        )
+    if not retained or len(changes) > Config.CFP_STREAM_REPLAY_LIMIT:
+        # Cheaper for the client to reload the list than to replay the gap
+        client.cursor = await broadcaster.current_cursor()
+        yield _event("resync", json.dumps({"reason": "missed too many changes"}))
+        return
+    for change in changes:
+        client.cursor = change["cursor"]
+        if client.matches(change["cfp"]):
+            yield _change_event(change)
+
+
+async def stream_events(
+    request: Request,
+    broadcaster: CFPStreamBroadcaster,
+    client: StreamClient,
+    resume: bool
+) -> AsyncIterator[str]:
+    """Server-sent events for one client, until it disconnects"""
+    broadcaster.connect(client)
+    try:
+        yield f"retry: {Config.CFP_STREAM_KEEPALIVE_SECONDS * 1000}\n\n"
+        if resume:
+            async for event in _replay(broadcaster, client):
+                yield event
+        while not await request.is_disconnected():
+            try:
+                change = await asyncio.wait_for(client.queue.get(), Config.CFP_STREAM_KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            if change is None:
+                client.overflowed = False
+                async for event in _replay(broadcaster, client):
+                    yield event
+                continue
+            # Already sent by a replay that overlapped the live stream
+            if change["cursor"] <= client.cursor:
+                continue
+            client.cursor = change["cursor"]
+            yield _change_event(change)
+    finally:
+        broadcaster.disconnect(client)
+
+
+# One broadcaster per worker process
+cfp_stream = CFPStreamBroadcaster()
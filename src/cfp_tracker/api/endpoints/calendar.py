@@ -0,0 +1,75 @@
+from fastapi import APIRouter, Depends, Header, Response
+from typing import Any, Dict, Optional
+from sqlalchemy.orm import Session
+
+from ...config import Config
+from ...storage.database import get_db, get_read_db
+from ...storage.dataset_version import dataset_version, fresh_session
+from ...storage.queries import list_calendar_cfps
+from ..calendar_feed import calendar_feeds, render_calendar
+from ..response_cache import cache_key, etag_matches
+
+router = APIRouter()
+
+def _accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    for coding in (accept_encoding or "").split(","):
+        name, _, params = coding.strip().partition(";")
+        if name.strip().lower() == "gzip":
+            return params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000")
+    return False
+
+@router.get("/cfps.ics")
+def get_calendar(
+    source: Optional[str] = None,
+    topic: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None),
+    accept_encoding: Optional[str] = Header(None),
+    read_db: Session = Depends(get_read_db),
+    db: Session = Depends(get_db)
+):
+    """iCalendar feed of CFP deadlines and conference dates.
+    
+    Feeds are rendered once per filter set and dataset version and served
+    from memory, so polling calendar clients do not reach the database
+    between ingestion runs.
+    
+    Args:
+        source: Only CFPs from this source
+        topic: Only CFPs tagged with this topic
+        if_none_match: ETag of a feed the client already has
+        accept_encoding: Compressed with gzip when the client accepts it
+        read_db: Read-only database session, only used when the feed must be rebuilt
+        db: Database session, used when the replica is behind
+        
+    Returns:
+        Response: The text/calendar feed, or 304 if the client's copy is current
+    """
+    key = cache_key("/cfps.ics", {"source": source, "topic": topic})
+    name = " / ".join(part for part in ("CFP deadlines", source, topic) if part)
+    version = dataset_version.current(db)
+    feed = calendar_feeds.get(
+        key,
+        version,
+        lambda: render_calendar(
+            list_calendar_cfps(fresh_session(version, read_db, db), source=source, topic=topic), name
+        )
+    )
+    
+    gzipped = _accepts_gzip(accept_encoding)
+    headers = {
+        "ETag": feed.etag[:-1] + '-gzip"' if gzipped else feed.etag,
+        "Cache-Control": f"public, max-age={Config.CALENDAR_MAX_AGE_SECONDS}",
+        "Vary": "Accept-Encoding",
+    }
+    # Either representation's ETag means the client has the current content
+    if etag_matches(if_none_match, feed.etag) or etag_matches(if_none_match, feed.etag[:-1] + '-gzip"'):
+        return Response(status_code=304, headers=headers)
+    if gzipped:
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=feed.gzipped, media_type="text/calendar", headers=headers)
+    return Response(content=feed.body, media_type="text/calendar", headers=headers)
+
+@router.get("/cfps.ics/cache", response_model=Dict[str, Any])
+async def get_calendar_cache_stats():
+    """Get the calendar feeds cached by this worker"""
+    return calendar_feeds.stats()
@@ -0,0 +1,216 @@
+from datetime import datetime, timezone
+import time
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+import anyio
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy.orm import Session
+
+from ...config import Config
+from ...models.cfp import CFPResponse
+from ...storage.bulk_import import IMPORT_FORMATS, import_cfps, iter_csv_records, iter_lines, iter_ndjson_records
+from ...storage.database import get_db, get_read_db
+from ...storage.dataset_version import dataset_version, fresh_session
+from ...storage.queries import list_cfps
+from ...storage.changes import parse_change_id
+from ...storage.read_model import open_cfps
+from ..cfp_stream import StreamClient, cfp_stream, stream_events
+from ..response_cache import cache_key, etag_matches, make_etag, response_cache
+
+router = APIRouter()
+
+_cfp_list = TypeAdapter(List[CFPResponse])
+
+def _naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """A datetime given by a client as naive UTC, the form CFP dates are stored in"""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+def _query_filters(open_only: bool, **filters) -> Dict[str, Any]:
+    """The filters of a list query, with open_only turned into a deadline bound"""
+    if open_only:
+        now = datetime.utcnow()
+        deadline_from = filters["deadline_from"]
+        filters["deadline_from"] = max(deadline_from, now) if deadline_from else now
+    return filters
+
+def _blocking_chunks(stream: AsyncIterator[bytes]) -> Iterator[bytes]:
+    """Read an async request body from a worker thread, one chunk at a time"""
+    while True:
+        try:
+            yield anyio.from_thread.run(stream.__anext__)
+        except StopAsyncIteration:
+            return
+
+def _import_format(format: Optional[str], content_type: Optional[str]) -> str:
+    if format is not None:
+        return format
+    content_type = (content_type or "").split(";")[0].strip()
+    if content_type in ("application/x-ndjson", "application/jsonl", "application/json"):
+        return "ndjson"
+    if content_type == "text/csv":
+        return "csv"
+    raise HTTPException(status_code=415, detail=f"Send {' or '.join(IMPORT_FORMATS)}, or set the format parameter")
+
+# A plain def: FastAPI runs it in the threadpool, so database reads on a
+# cache miss do not block the event loop
+@router.get("", response_model=List[CFPResponse])
+def get_cfps(
+    source: Optional[str] = None,
+    topic: Optional[str] = None,
+    deadline_from: Optional[datetime] = None,
+    deadline_to: Optional[datetime] = None,
+    include_archived: bool = False,
+    open_only: bool = False,
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+    if_none_match: Optional[str] = Header(None),
+    read_db: Session = Depends(get_read_db),
+    db: Session = Depends(get_db)
+):
+    """List CFPs ordered by submission deadline.
+    
+    Queries for CFPs that are still open are answered from the in-memory
+    read model without touching the database, others from the read replica
+    when one is configured. Responses are cached per
+    normalized query until the dataset version changes, and carry a strong
+    ETag so clients can revalidate with If-None-Match.
+    
+    Args:
+        source: Only CFPs from this source
+        topic: Only CFPs tagged with this topic
+        deadline_from: Only CFPs whose deadline is on or after this time
+        deadline_to: Only CFPs whose deadline is on or before this time
+        include_archived: Also return CFPs of conferences that ended long ago
+        open_only: Only CFPs whose deadline has not passed yet
+        limit: Maximum number of CFPs returned
+        offset: Number of CFPs skipped
+        if_none_match: ETag of a response the client already has
+        read_db: Read-only database session
+        db: Database session, used when the replica is behind
+        
+    Returns:
+        List[CFPResponse]: Matching CFPs, or 304 if the client's copy is current
+    """
+    filters = {
+        "source": source,
+        "topic": topic,
+        "deadline_from": _naive_utc(deadline_from),
+        "deadline_to": _naive_utc(deadline_to),
+        "include_archived": include_archived,
+        "limit": limit,
+        "offset": offset,
+    }
+    key = cache_key("/cfps", {**filters, "open_only": open_only})
+    query_filters = _query_filters(open_only, **filters)
+    include_archived = query_filters.pop("include_archived")
+    # Answers from the read model are labelled with the version its snapshot
+    # was built from, which lags the current one while it is being rebuilt
+    snapshot = open_cfps.snapshot_for(query_filters["deadline_from"], include_archived)
+    version = snapshot.version if snapshot is not None else dataset_version.current(db)
+    # "Open" moves with the clock, so those responses also expire with the TTL
+    time_bucket = int(time.time() // Config.RESPONSE_CACHE_TTL_SECONDS) if open_only else None
+    headers = {
+        "ETag": make_etag(key, version, time_bucket),
+        "Cache-Control": f"public, max-age={Config.RESPONSE_MAX_AGE_SECONDS}",
+    }
+    if etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    
+    body = response_cache.get(key, version)
+    if body is None:
+        if snapshot is not None:
+            rows = snapshot.query(**query_filters)
+        else:
+            rows = list_cfps(fresh_session(version, read_db, db), include_archived=include_archived, **query_filters)
+        body = _cfp_list.dump_json(_cfp_list.validate_python(rows))
+        response_cache.put(key, version, body)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+@router.get("/stream")
+async def stream_cfps(
+    request: Request,
+    source: Optional[str] = None,
+    topic: Optional[str] = None,
+    deadline_from: Optional[datetime] = None,
+    deadline_to: Optional[datetime] = None,
+    last_event_id: Optional[str] = Header(None)
+):
+    """Stream CFP inserts and updates as server-sent events.
+    
+    Each event is named insert or update and carries the CFP as JSON; its
+    id can be sent back as Last-Event-ID to resume after a reconnect. A
+    resync event means changes were missed (the client fell behind or
+    resumed from too far back) and the list should be reloaded.
+    
+    Args:
+        request: Request, polled for client disconnects
+        source: Only CFPs from this source
+        topic: Only CFPs tagged with this topic
+        deadline_from: Only CFPs whose deadline is on or after this time
+        deadline_to: Only CFPs whose deadline is on or before this time
+        last_event_id: Id of the last event the client received
+        
+    Returns:
+        StreamingResponse: A text/event-stream that stays open
+    """
+    resume_from = parse_change_id(last_event_id)
+    cursor = resume_from or await cfp_stream.current_cursor()
+    client = StreamClient(
+        cursor, source=source, topic=topic,
+        deadline_from=_naive_utc(deadline_from), deadline_to=_naive_utc(deadline_to)
+    )
+    return StreamingResponse(
+        stream_events(request, cfp_stream, client, resume=resume_from is not None),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.get("/stream/stats", response_model=Dict[str, Any])
+async def get_stream_stats():
+    """Get the stream clients connected to this worker"""
+    return cfp_stream.stats()
+
+@router.get("/read-model", response_model=Dict[str, Any])
+async def get_read_model_stats():
+    """Get size, memory use and age of the in-memory read model of open CFPs"""
+    return open_cfps.stats()
+
+@router.get("/cache", response_model=Dict[str, Any])
+async def get_cache_stats():
+    """Get size and hit counts of this worker's response cache"""
+    return {"dataset_version": dataset_version.version, **response_cache.stats()}
+
+@router.post("/bulk", response_model=Dict[str, Any])
+async def bulk_import_cfps(
+    request: Request,
+    format: Optional[str] = Query(None, pattern="^(ndjson|csv)$"),
+    content_type: Optional[str] = Header(None),
+    db: Session = Depends(get_db)
+):
+    """Import CFPs streamed in the request body as NDJSON or CSV.
+    
+    The body is read chunk by chunk while rows are validated and staged,
+    so uploads of any size use bounded memory; all valid rows are then
+    merged into cfps by dedup_key in one transaction.
+    
+    Args:
+        request: Request whose body holds the rows
+        format: ndjson or csv; defaults to the Content-Type of the body
+        content_type: application/x-ndjson or text/csv
+        db: Database session
+        
+    Returns:
+        Dict[str, Any]: Row counts by outcome, and the line and reason of rejected rows
+    """
+    import_format = _import_format(format, content_type)
+    lines = iter_lines(_blocking_chunks(request.stream().__aiter__()))
+    records = iter_ndjson_records(lines) if import_format == "ndjson" else iter_csv_records(lines)
+    try:
+        return await run_in_threadpool(import_cfps, db, records)
+    except UnicodeDecodeError as e:
+        db.rollback()
+        raise HTTPException(status_code=400, detail=f"Body is not valid UTF-8: {e}")
@@ -0,0 +1,52 @@
+from fastapi import APIRouter, Query
+from fastapi.responses import StreamingResponse
+from datetime import datetime
+from typing import Iterator
+import logging
+
+from ...storage.database import ReadSessionLocal
+from ...storage.export import iter_cfp_batches, iter_csv, iter_ndjson
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+def _stream_export(format: str, include_archived: bool, include_withdrawn: bool) -> Iterator[bytes]:
+    """Stream the export with its own read-only session, held only while streaming"""
+    db = ReadSessionLocal()
+    try:
+        batches = iter_cfp_batches(db, include_archived=include_archived, include_withdrawn=include_withdrawn)
+        encode = iter_ndjson if format == "ndjson" else iter_csv
+        yield from encode(batches)
+    except Exception as e:
+        logger.error(f"Error streaming CFP export: {e}")
+        raise
+    finally:
+        db.close()
+
+@router.get("/cfps")
+def export_cfps(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    include_archived: bool = False,
+    include_withdrawn: bool = False
+):
+    """Stream the active CFPs as NDJSON or CSV with constant memory.
+    
+    Args:
+        format: ndjson or csv; Parquet files are written by the export_cfps script
+        include_archived: Also export CFPs moved to the archive
+        include_withdrawn: Also export CFPs their source stopped listing
+        
+    Returns:
+        StreamingResponse: The export, sent in chunks as rows are read
+    """
+    filename = f"cfps-{datetime.utcnow().strftime('%Y%m%dT%H%M%SZ')}.{format}"
+    return StreamingResponse(
+        _stream_export(format, include_archived, include_withdrawn),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
@@ -1,56 +1,51 @@
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import logging
 
 from ...ingestion.manager import CFPIngestionManager
-from ...models.cfp import CFPSchema, CFP
-from ...storage.database import get_db
+from ...ingestion.pipeline import fetch_and_store
+from ...models.cfp import SourcePollResponse
+from ...storage.database import get_db, get_read_db
+from ...storage.source_polls import list_source_polls
+from ...utils import tracing
 from sqlalchemy.orm import Session
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
-# Create a global ingestion manager
-ingestion_manager = CFPIngestionManager()
+# Created by the first request that needs it, with its adapters
+_ingestion_manager: Optional[CFPIngestionManager] = None
 
-async def fetch_and_store_cfps(db: Session):
+def get_ingestion_manager() -> CFPIngestionManager:
+    """Dependency for the shared ingestion manager"""
+    global _ingestion_manager
+    if _ingestion_manager is None:
+        _ingestion_manager = CFPIngestionManager()
+    return _ingestion_manager
+
+async def fetch_and_store_cfps(
+    db: Session,
+    ingestion_manager: CFPIngestionManager,
+    trace_parent: Optional[tracing.SpanContext] = None
+):
     """Fetch CFPs from all sources and store them in the database"""
     try:
-        cfps = await ingestion_manager.fetch_all_cfps()
-        logger.info(f"Fetched {len(cfps)} CFPs from all sources")
-        
-        # Store CFPs in the database
-        for cfp_schema in cfps:
-            # Convert Pydantic model to dict, excluding unset fields
-            cfp_data = cfp_schema.model_dump(exclude_unset=True)
-            
-            # Check if CFP already exists
-            existing_cfp = db.query(CFP).filter(
-                CFP.conference_name == cfp_data["conference_name"],
-                CFP.submission_deadline == cfp_data["submission_deadline"]
-            ).first()
-            
-            if existing_cfp:
-                # Update existing CFP
-                for key, value in cfp_data.items():
-                    setattr(existing_cfp, key, value)
-            else:
-                # Create new CFP
-                db_cfp = CFP(**cfp_data)
-                db.add(db_cfp)
-        
-        db.commit()
-        logger.info(f"Stored {len(cfps)} CFPs in the database")
+        return await fetch_and_store(db, ingestion_manager, trace_parent)
     except Exception as e:
         logger.error(f"Error fetching and storing CFPs: {e}")
         db.rollback()
 
 @router.post("/ingest", response_model=Dict[str, Any])
-async def ingest_cfps(background_tasks: BackgroundTasks, db: Session = Depends(get_db)):
+async def ingest_cfps(
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+    ingestion_manager: CFPIngestionManager = Depends(get_ingestion_manager)
+):
     """Trigger CFP ingestion process"""
     try:
         # Add the task to background tasks
-        background_tasks.add_task(fetch_and_store_cfps, db)
+        # The run continues the request's trace after the response is sent
+        background_tasks.add_task(fetch_and_store_cfps, db, ingestion_manager, tracing.current_context())
         
         return {
             "status": "success",
@@ -62,19 +57,51 @@ async def ingest_cfps(background_tasks: BackgroundTasks, db: Session = Depends(g
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/adapters", response_model=List[str])
-async def get_adapters():
-    """Get list of available adapters"""
+async def get_adapters(ingestion_manager: CFPIngestionManager = Depends(get_ingestion_manager)):
+    """Get list of enabled adapters"""
     return ingestion_manager.get_adapter_names()
 
 @router.get("/adapters/{adapter_name}/last-fetch", response_model=Dict[str, Any])
-async def get_adapter_last_fetch(adapter_name: str):
-    """Get last fetch time for a specific adapter"""
+async def get_adapter_last_fetch(
+    adapter_name: str,
+    ingestion_manager: CFPIngestionManager = Depends(get_ingestion_manager)
+):
+    """Get last fetch time for a specific adapter; null until it has fetched"""
+    if ingestion_manager.get_adapter(adapter_name) is None:
+        raise HTTPException(status_code=404, detail=f"Adapter '{adapter_name}' not found")
+    
     last_fetch = ingestion_manager.get_adapter_last_fetch_time(adapter_name)
+    return {
+        "adapter": adapter_name,
+        "last_fetch": last_fetch.isoformat() if last_fetch else None
+    }
+
+@router.get("/adapters/{adapter_name}/status", response_model=Dict[str, Any])
+async def get_adapter_status(
+    adapter_name: str,
+    ingestion_manager: CFPIngestionManager = Depends(get_ingestion_manager),
+    read_db: Session = Depends(get_read_db)
+):
+    """Get fetch, retry, circuit breaker and polling state for a specific adapter
     
-    if last_fetch is None:
+    Polling state is shared by every process through the database, and lists
+    the adapter's categories separately when it polls them separately.
+    """
+    status = ingestion_manager.get_adapter_status(adapter_name)
+    
+    if status is None:
         raise HTTPException(status_code=404, detail=f"Adapter '{adapter_name}' not found")
     
+    source = ingestion_manager.get_adapter(adapter_name).source_name
+    polling = [
+        {
+            **SourcePollResponse.model_validate(poll).model_dump(),
+            "change_rate": poll.changed_polls / poll.polls if poll.polls else None
+        }
+        for poll in list_source_polls(read_db, source)
+    ]
     return {
         "adapter": adapter_name,
-        "last_fetch": last_fetch.isoformat() if last_fetch else None
-    } 
\ No newline at end of file
+        **status,
+        "polling": polling
+    }
@@ -2,7 +2,7 @@ from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
-from ...storage.database import get_db
+from ...storage.database import get_db, get_read_db
 from ...notifications.service import NotificationService
 
 router = APIRouter()
@@ -10,18 +10,20 @@ router = APIRouter()
 @router.post("/notify")
 async def notify_new_cfps(
     hours: Optional[int] = 24,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    read_db: Session = Depends(get_read_db)
 ):
     """Notify about new CFPs added in the last N hours.
     
     Args:
         hours: Number of hours to look back (default: 24)
         db: Database session
+        read_db: Read-only database session
         
     Returns:
         dict: Status of the notification operation
     """
-    service = NotificationService(db)
+    service = NotificationService(db, read_db)
     success = service.notify_new_cfps(hours)
     
     if not success:
@@ -0,0 +1,34 @@
+from fastapi import APIRouter, HTTPException
+from typing import Dict, Any
+import logging
+
+from ...utils import profiling
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+@router.get("", response_model=Dict[str, Any])
+async def get_profiling_status():
+    """Get enabled and armed profiling sections and the latest profile files"""
+    return {
+        "sections": list(profiling.SECTIONS),
+        "enabled": profiling.enabled_sections(),
+        "armed": profiling.armed_sections(),
+        "profiles": profiling.list_profiles()
+    }
+
+@router.post("/arm", response_model=Dict[str, Any])
+async def arm_profiling(section: str, runs: int = 1):
+    """Profile the next runs of a section in the worker handling this request"""
+    if runs < 1:
+        raise HTTPException(status_code=400, detail="runs must be at least 1")
+    try:
+        profiling.arm(section, runs)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    logger.info(f"Armed profiling of the next {runs} {section} run(s)")
+    return {
+        "status": "success",
+        "section": section,
+        "armed": profiling.armed_sections()
+    }
@@ -0,0 +1,21 @@
+from fastapi import APIRouter, Depends
+from typing import List
+from sqlalchemy.orm import Session
+
+from ...models.cfp import ScheduledJobResponse
+from ...storage.database import get_db
+from ...storage.scheduled_jobs import list_jobs
+
+router = APIRouter()
+
+@router.get("/jobs", response_model=List[ScheduledJobResponse])
+def get_scheduled_jobs(db: Session = Depends(get_db)):
+    """List scheduled jobs with their last and next run, whichever node ran them.
+    
+    Args:
+        db: Database session
+        
+    Returns:
+        List[ScheduledJobResponse]: Jobs known to the scheduler
+    """
+    return list_jobs(db)
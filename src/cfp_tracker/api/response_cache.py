@@ -0,0 +1,97 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from ..config import Config
+
+
+def cache_key(path: str, params: Dict[str, Any]) -> str:
+    """Normalized key of a query: parsed parameter values, sorted, defaults included"""
+    return f"{path}?{json.dumps(params, sort_keys=True, default=str, separators=(',', ':'))}"
+
+
+def make_etag(key: str, version: int, time_bucket: Optional[int] = None) -> str:
+    """Strong ETag of a query's response at a dataset version
+
+    Responses that depend on the current time (open CFPs) also carry the
+    time bucket, so they change once per cache TTL even without writes.
+    """
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).hexdigest()
+    suffix = f"-{time_bucket}" if time_bucket is not None else ""
+    return f'"v{version}-{digest}{suffix}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header matches; comparison is weak per RFC 9110"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+class ResponseCache:
+    """LRU cache of serialized responses, bounded by entries and bytes
+
+    Entries remember the dataset version and time they were built at; a
+    lookup under a different version or past the TTL misses.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[int, float, bytes]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str, version: int) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != version or time.monotonic() - entry[1] > self.ttl_seconds:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+
+    def put(self, key: str, version: int, body: bytes):
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= len(old[2])
+            self._entries[key] = (version, time.monotonic(), body)
+            self._bytes += len(body)
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, _, evicted) = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+
+    def clear(self, version: Optional[int] = None):
+        """Drop every entry; usable as a dataset version change callback"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+# One cache per worker process
+response_cache = ResponseCache(
+    Config.RESPONSE_CACHE_MAX_ENTRIES, Config.RESPONSE_CACHE_MAX_BYTES, Config.RESPONSE_CACHE_TTL_SECONDS
+)
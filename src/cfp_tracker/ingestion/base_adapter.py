@@ -1,45 +1,314 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
 from datetime import datetime
+import asyncio
+import codecs
 import logging
+import time
 
+import aiohttp
+
+from ..config import Config
 from ..models.cfp import CFPSchema
+from ..utils import metrics, tracing
+from ..utils.profiling import profile
+from .polling import PollPlan, PollResult, payload_digest, poll_key, records_digest
+from .resilience import CircuitBreaker, FetchStatusError, TransientFetchError, TRANSIENT_STATUSES, backoff_delay
+from .snapshots import ReplayRun, SnapshotRun
 
 logger = logging.getLogger(__name__)
 
+# Bytes read from a streamed response at a time
+STREAM_CHUNK_BYTES = 64 * 1024
+
 class BaseCFPAdapter(ABC):
     """Base class for CFP data adapters"""
-    
+
+    # Budgets for one fetch of the whole source and for a single request;
+    # subclasses override them for sources that are slower or faster
+    fetch_deadline_seconds: float = Config.ADAPTER_FETCH_DEADLINE_SECONDS
+    request_timeout_seconds: float = Config.ADAPTER_REQUEST_TIMEOUT_SECONDS
+    max_retries: int = Config.ADAPTER_MAX_RETRIES
+    # Requests in flight at once, and the bounds adaptive polling keeps the
+    # source's polling interval within
+    max_concurrent_requests: int = Config.ADAPTER_MAX_CONCURRENT_REQUESTS
+    min_poll_interval_seconds: int = Config.POLL_MIN_INTERVAL_SECONDS
+    max_poll_interval_seconds: int = Config.POLL_MAX_INTERVAL_SECONDS
+
     def __init__(self, source_name: str):
         self.source_name = source_name
         self.last_fetch_time: Optional[datetime] = None
-    
+        # Whether the last fetch covered the whole source; adapters clear it
+        # when part of a fetch fails so its rows are not swept as withdrawn
+        self.fetch_complete: bool = False
+        self.last_fetch_count: int = 0
+        self.last_error: Optional[str] = None
+        self.circuit_breaker = CircuitBreaker(
+            Config.CIRCUIT_FAILURE_THRESHOLD, Config.CIRCUIT_COOLDOWN_SECONDS
+        )
+        # Created by each fetch, in the event loop that runs it
+        self._request_slots: Optional[asyncio.Semaphore] = None
+        # Set by the manager to record fetched payloads, or to serve them
+        # from a recorded run instead of the network
+        self.snapshot_run: Optional[SnapshotRun] = None
+        self.replay_run: Optional[ReplayRun] = None
+        # Set by the manager for scheduled runs, which only fetch what is due
+        self.poll_plan: Optional[PollPlan] = None
+        # Sources fetched completely by the last fetch, for adaptive polling
+        self.poll_results: List[PollResult] = []
+        # Records of the last complete fetch, which stand in for the source
+        # while it is not due or cannot be reached, so the clusters it is
+        # part of are resolved the same way on every run
+        self.last_cfps: Optional[List[CFPSchema]] = None
+
     @abstractmethod
     async def fetch_cfps(self) -> List[Dict[str, Any]]:
         """Fetch CFPs from the source"""
         pass
-    
+
     @abstractmethod
     def parse_cfp(self, raw_data: Dict[str, Any]) -> CFPSchema:
         """Parse raw CFP data into a CFPSchema object"""
         pass
-    
+
+    def poll_keys(self) -> List[str]:
+        """Keys under which the source's polling is adapted; one per category if it has them"""
+        return [poll_key(self.source_name)]
+
+    def raw_poll_key(self, raw_data: Dict[str, Any]) -> str:
+        """Poll key a raw record was fetched under"""
+        return poll_key(self.source_name)
+
+    def polled_keys(self) -> List[str]:
+        """Poll keys the last fetch_cfps fetched completely and from the network"""
+        return [poll_key(self.source_name)] if self.fetch_complete else []
+
+    def _collect_poll_results(self, raw_cfps: List[Dict[str, Any]], parsed: List[Tuple[str, CFPSchema]]):
+        raw_by_key: Dict[str, List[Dict[str, Any]]] = {}
+        for raw_cfp in raw_cfps:
+            raw_by_key.setdefault(self.raw_poll_key(raw_cfp), []).append(raw_cfp)
+        parsed_by_key: Dict[str, List[CFPSchema]] = {}
+        for key, cfp in parsed:
+            parsed_by_key.setdefault(key, []).append(cfp)
+        self.poll_results = [
+            PollResult(
+                key, self.source_name, records_digest(parsed_by_key[key]), payload_digest(raw_by_key.get(key, [])),
+                self.min_poll_interval_seconds, self.max_poll_interval_seconds
+            )
+            # Like sweeps, polling does not trust a fetch that found nothing
+            for key in self.polled_keys() if parsed_by_key.get(key)
+        ]
+
+    def reused_cfps(self) -> List[CFPSchema]:
+        """Records of the last complete fetch, for a run that does not fetch the source"""
+        if self.replay_run is not None or not self.last_cfps:
+            return []
+        logger.info(f"Reusing {len(self.last_cfps)} CFPs from the last complete fetch of {self.source_name}")
+        return self.last_cfps
+
+    def _client_session(self) -> aiohttp.ClientSession:
+        """Create an HTTP session bounded by the per-request timeout"""
+        return aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=self.request_timeout_seconds)
+        )
+
+    async def _get(self, session: aiohttp.ClientSession, url: str,
+                   trace_attributes: Optional[Dict[str, Any]] = None, **kwargs) -> Tuple[int, str]:
+        """GET a URL, retrying transient failures with jittered backoff
+
+        Returns the status and body of the final response. Transient statuses
+        are only returned once retries are exhausted; connection errors and
+        timeouts are raised as TransientFetchError at that point.
+        trace_attributes are added to the request's trace span.
+        """
+        if self.replay_run is not None:
+            return self.replay_run.lookup(self.source_name, url, kwargs.get("params"))
+
+        if self._request_slots is None:
+            self._request_slots = asyncio.Semaphore(self.max_concurrent_requests)
+        async with self._request_slots:
+            with tracing.span("http.get", adapter=self.source_name, url=url, **(trace_attributes or {})) as span:
+                return await self._get_with_retries(session, url, span, **kwargs)
+
+    async def _get_with_retries(self, session: aiohttp.ClientSession, url: str, span, **kwargs) -> Tuple[int, str]:
+        for attempt in range(self.max_retries + 1):
+            start = time.perf_counter()
+            span.set_attribute("attempts", attempt + 1)
+            try:
+                async with session.get(url, **kwargs) as response:
+                    # text() decodes the body read() already buffered
+                    body = await response.read()
+                    text = await response.text()
+                    metrics.ADAPTER_REQUEST_SECONDS.labels(self.source_name).observe(time.perf_counter() - start)
+                    metrics.ADAPTER_REQUESTS.labels(self.source_name, str(response.status)).inc()
+                    metrics.ADAPTER_RESPONSE_BYTES.labels(self.source_name).inc(len(body))
+                    span.set_attributes(status=response.status, bytes=len(body))
+                    if response.status not in TRANSIENT_STATUSES or attempt == self.max_retries:
+                        if self.snapshot_run is not None:
+                            self.snapshot_run.record(self.source_name, url, kwargs.get("params"), response.status, text)
+                        return response.status, text
+                    reason = f"status {response.status}"
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                metrics.ADAPTER_REQUESTS.labels(self.source_name, "error").inc()
+                if attempt == self.max_retries:
+                    raise TransientFetchError(f"{url}: {e!r}") from e
+                reason = repr(e)
+
+            delay = backoff_delay(attempt, Config.ADAPTER_RETRY_BASE_DELAY, Config.ADAPTER_RETRY_MAX_DELAY)
+            logger.warning(
+                f"Retrying {url} for {self.source_name} in {delay:.1f}s after {reason} "
+                f"(attempt {attempt + 1}/{self.max_retries})"
+            )
+            await asyncio.sleep(delay)
+
+    async def _get_lines(self, session: aiohttp.ClientSession, url: str,
+                         trace_attributes: Optional[Dict[str, Any]] = None, **kwargs) -> AsyncIterator[str]:
+        """GET a URL and yield its body line by line as it arrives
+
+        Unlike _get, the body is never held in memory as a whole, unless a
+        snapshot is being recorded. Transient failures are retried as long
+        as no line has been yielded; after that, and once retries are
+        exhausted, they are raised as TransientFetchError. Any other final
+        status than 200 raises FetchStatusError.
+        """
+        if self.replay_run is not None:
+            status, text = self.replay_run.lookup(self.source_name, url, kwargs.get("params"))
+            if status != 200:
+                raise FetchStatusError(url, status)
+            for line in text.splitlines():
+                yield line
+            return
+
+        if self._request_slots is None:
+            self._request_slots = asyncio.Semaphore(self.max_concurrent_requests)
+        async with self._request_slots:
+            with tracing.span("http.get", adapter=self.source_name, url=url, streamed=True,
+                              **(trace_attributes or {})) as span:
+                for attempt in range(self.max_retries + 1):
+                    start = time.perf_counter()
+                    span.set_attribute("attempts", attempt + 1)
+                    yielded = False
+                    try:
+                        async with session.get(url, **kwargs) as response:
+                            metrics.ADAPTER_REQUESTS.labels(self.source_name, str(response.status)).inc()
+                            span.set_attribute("status", response.status)
+                            if response.status == 200:
+                                received = 0
+                                recorded = [] if self.snapshot_run is not None else None
+                                decoder = codecs.getincrementaldecoder(response.charset or "utf-8")(errors="replace")
+                                pending = ""
+                                async for chunk in response.content.iter_chunked(STREAM_CHUNK_BYTES):
+                                    received += len(chunk)
+                                    text = decoder.decode(chunk)
+                                    if recorded is not None:
+                                        recorded.append(text)
+                                    lines = (pending + text).split("\n")
+                                    pending = lines.pop()
+                                    for line in lines:
+                                        yielded = True
+                                        yield line.rstrip("\r")
+                                pending += decoder.decode(b"", final=True)
+                                if pending:
+                                    yield pending.rstrip("\r")
+                                metrics.ADAPTER_REQUEST_SECONDS.labels(self.source_name).observe(time.perf_counter() - start)
+                                metrics.ADAPTER_RESPONSE_BYTES.labels(self.source_name).inc(received)
+                                span.set_attribute("bytes", received)
+                                if recorded is not None:
+                                    self.snapshot_run.record(self.source_name, url, kwargs.get("params"), 200, "".join(recorded))
+                                return
+                            if response.status not in TRANSIENT_STATUSES or attempt == self.max_retries:
+                                if self.snapshot_run is not None:
+                                    self.snapshot_run.record(
+                                        self.source_name, url, kwargs.get("params"), response.status, await response.text()
+                                    )
+                                raise FetchStatusError(url, response.status)
+                            reason = f"status {response.status}"
+                    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                        metrics.ADAPTER_REQUESTS.labels(self.source_name, "error").inc()
+                        # Lines already handed out cannot be taken back
+                        if yielded or attempt == self.max_retries:
+                            raise TransientFetchError(f"{url}: {e!r}") from e
+                        reason = repr(e)
+
+                    delay = backoff_delay(attempt, Config.ADAPTER_RETRY_BASE_DELAY, Config.ADAPTER_RETRY_MAX_DELAY)
+                    logger.warning(
+                        f"Retrying {url} for {self.source_name} in {delay:.1f}s after {reason} "
+                        f"(attempt {attempt + 1}/{self.max_retries})"
+                    )
+                    await asyncio.sleep(delay)
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get fetch and circuit breaker state for status reporting"""
+        return {
+            "last_fetch": self.last_fetch_time.isoformat() if self.last_fetch_time else None,
+            "last_fetch_count": self.last_fetch_count,
+            "fetch_complete": self.fetch_complete,
+            "last_error": self.last_error,
+            "circuit": self.circuit_breaker.snapshot(),
+            "max_concurrent_requests": self.max_concurrent_requests,
+            "poll_interval_bounds": [self.min_poll_interval_seconds, self.max_poll_interval_seconds],
+        }
+
     async def get_cfps(self) -> List[CFPSchema]:
         """Get CFPs from the source and parse them"""
+        with profile("adapters", self.source_name), tracing.span("adapter.get_cfps", adapter=self.source_name) as span:
+            cfps = await self._fetch_and_parse()
+            span.set_attributes(records=len(cfps), complete=self.fetch_complete, error=self.last_error)
+            return cfps
+
+    async def _fetch_and_parse(self) -> List[CFPSchema]:
+        self.fetch_complete = False
+        self.last_fetch_count = 0
+        self.poll_results = []
+        if not self.circuit_breaker.allow_request():
+            logger.warning(f"Skipping {self.source_name}: circuit open after repeated failures")
+            return self.reused_cfps()
+
+        self.fetch_complete = True
+        self._request_slots = asyncio.Semaphore(self.max_concurrent_requests)
+        start = time.perf_counter()
         try:
-            raw_cfps = await self.fetch_cfps()
+            with tracing.span("adapter.fetch_cfps", adapter=self.source_name) as span:
+                raw_cfps = await asyncio.wait_for(self.fetch_cfps(), timeout=self.fetch_deadline_seconds)
+                span.set_attribute("records", len(raw_cfps))
             self.last_fetch_time = datetime.utcnow()
-            
+            metrics.ADAPTER_FETCH_SECONDS.labels(self.source_name).observe(time.perf_counter() - start)
+
             parsed_cfps = []
-            for raw_cfp in raw_cfps:
-                try:
-                    parsed_cfp = self.parse_cfp(raw_cfp)
-                    parsed_cfps.append(parsed_cfp)
-                except Exception as e:
-                    logger.error(f"Error parsing CFP from {self.source_name}: {e}")
-                    continue
-            
+            polled = []
+            with tracing.span("adapter.parse_cfp", adapter=self.source_name) as span:
+                for raw_cfp in raw_cfps:
+                    try:
+                        parsed_cfp = self.parse_cfp(raw_cfp)
+                        parsed_cfps.append(parsed_cfp)
+                        polled.append((self.raw_poll_key(raw_cfp), parsed_cfp))
+                    except Exception as e:
+                        logger.error(f"Error parsing CFP from {self.source_name}: {e}")
+                        continue
+                span.set_attributes(parsed=len(parsed_cfps), failed=len(raw_cfps) - len(parsed_cfps))
+            if self.replay_run is None:
+                self._collect_poll_results(raw_cfps, polled)
+                if self.fetch_complete and parsed_cfps:
+                    self.last_cfps = parsed_cfps
+
+            self.last_fetch_count = len(parsed_cfps)
+            metrics.ADAPTER_PARSED.labels(self.source_name, "success").inc(len(parsed_cfps))
+            metrics.ADAPTER_PARSED.labels(self.source_name, "failure").inc(len(raw_cfps) - len(parsed_cfps))
+            # A fetch that failed everywhere counts against the source
+            if self.fetch_complete or raw_cfps:
+                self.circuit_breaker.record_success()
+                self.last_error = None
+            else:
+                self.circuit_breaker.record_failure()
+                self.last_error = "fetch failed"
             return parsed_cfps
+        except asyncio.TimeoutError:
+            metrics.ADAPTER_FETCH_SECONDS.labels(self.source_name).observe(time.perf_counter() - start)
+            logger.error(f"Fetching CFPs from {self.source_name} exceeded {self.fetch_deadline_seconds}s deadline")
+            self.last_error = f"deadline of {self.fetch_deadline_seconds}s exceeded"
         except Exception as e:
             logger.error(f"Error fetching CFPs from {self.source_name}: {e}")
-            return [] 
\ No newline at end of file
+            self.last_error = str(e)
+        self.fetch_complete = False
+        self.circuit_breaker.record_failure()
+        return self.reused_cfps()
@@ -1,8 +1,10 @@
-import aiohttp
-from typing import List, Dict, Any
+import asyncio
+import json
+from typing import List, Dict, Any, Optional, Tuple
 import logging
-from bs4 import BeautifulSoup
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+
+import aiohttp
 
 from .base_adapter import BaseCFPAdapter
 from .utils import parse_date, clean_text, extract_urls
@@ -11,34 +13,133 @@ from ..models.cfp import CFPSchema
 logger = logging.getLogger(__name__)
 
 class Call4PapersAdapter(BaseCFPAdapter):
-    """Adapter for the Call4Papers website"""
+    """Adapter for the Call4Papers website
+    
+    The lookahead is split into windows of submission deadlines fetched in
+    parallel. Each window is paged through either by page number, when
+    responses report total_pages, or by following next_cursor; a response
+    with neither is a single page. Records are merged by id, so windows or
+    pages that overlap do not produce duplicates.
+    """
+    
+    max_concurrent_requests = 4
+    lookahead_days = 90
+    window_days = 30
+    page_size = 100
+    # Guards against a cursor that never ends
+    max_pages_per_window = 200
     
     def __init__(self):
         super().__init__("Call4Papers")
         self.base_url = "https://www.call4papers.com"
         self.api_url = f"{self.base_url}/api/v1/cfp"
     
+    def _windows(self, today: date) -> List[Tuple[date, date]]:
+        """Inclusive (start, end) deadline windows covering the lookahead"""
+        last = today + timedelta(days=self.lookahead_days)
+        windows = []
+        start = today
+        while start <= last:
+            end = min(start + timedelta(days=self.window_days - 1), last)
+            windows.append((start, end))
+            start = end + timedelta(days=1)
+        return windows
+    
+    def _first_day(self) -> date:
+        """Start of the first window: today, or the recorded run's first day when replaying
+        
+        The window dates are request parameters, so a replay on a later day
+        has to request the windows that were recorded.
+        """
+        if self.replay_run is not None:
+            starts = [params["start_date"] for params in self.replay_run.recorded_params(self.source_name)
+                      if "start_date" in params]
+            if starts:
+                return datetime.strptime(min(starts), "%Y-%m-%d").date()
+        return datetime.utcnow().date()
+    
     async def fetch_cfps(self) -> List[Dict[str, Any]]:
-        """Fetch CFPs from Call4Papers API"""
-        async with aiohttp.ClientSession() as session:
-            try:
-                # Get CFPs for the next 3 months
-                end_date = datetime.now() + timedelta(days=90)
-                params = {
-                    "end_date": end_date.strftime("%Y-%m-%d"),
-                    "status": "open"
-                }
-                
-                async with session.get(self.api_url, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return data.get("cfps", [])
-                    else:
-                        logger.error(f"Error fetching CFPs from Call4Papers: {response.status}")
-                        return []
-            except Exception as e:
-                logger.error(f"Exception fetching CFPs from Call4Papers: {e}")
-                return []
+        """Fetch open CFPs from the Call4Papers API, all windows and pages"""
+        async with self._client_session() as session:
+            results = await asyncio.gather(*(
+                self._fetch_window(session, start, end) for start, end in self._windows(self._first_day())
+            ))
+        
+        cfps: Dict[Any, Dict[str, Any]] = {}
+        for window_cfps in results:
+            for cfp in window_cfps:
+                key = cfp.get("id") or (cfp.get("conference_name"), cfp.get("submission_url"))
+                cfps.setdefault(key, cfp)
+        fetched = sum(len(window_cfps) for window_cfps in results)
+        logger.info(f"Fetched {len(cfps)} CFPs from Call4Papers ({fetched - len(cfps)} duplicates merged)")
+        return list(cfps.values())
+    
+    async def _fetch_page(self, session: aiohttp.ClientSession, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """One page of a window, or None if it could not be fetched"""
+        try:
+            status, text = await self._get(session, self.api_url, trace_attributes={
+                "window": params["start_date"], "page": params.get("page") or params.get("cursor") or 1
+            }, params=params)
+            if status != 200:
+                logger.error(f"Error fetching CFPs from Call4Papers ({params}): {status}")
+                return None
+            data = json.loads(text)
+            if not isinstance(data, dict) or not isinstance(data.get("cfps"), list):
+                logger.error(f"Unexpected response from Call4Papers ({params}): no cfps list")
+                return None
+            return data
+        except Exception as e:
+            logger.error(f"Exception fetching CFPs from Call4Papers ({params}): {e}")
+            return None
+    
+    async def _fetch_window(self, session: aiohttp.ClientSession, start: date, end: date) -> List[Dict[str, Any]]:
+        """All pages of one deadline window; clears fetch_complete if any page is missing"""
+        params = {
+            "start_date": start.strftime("%Y-%m-%d"),
+            "end_date": end.strftime("%Y-%m-%d"),
+            "status": "open",
+            "per_page": self.page_size,
+        }
+        first = await self._fetch_page(session, params)
+        if first is None:
+            self.fetch_complete = False
+            return []
+        cfps = list(first["cfps"])
+        
+        total_pages = first.get("total_pages")
+        if total_pages:
+            total_pages = int(total_pages)
+            if total_pages > self.max_pages_per_window:
+                logger.error(f"Call4Papers window {start} - {end} has {total_pages} pages, "
+                             f"fetching the first {self.max_pages_per_window}")
+                self.fetch_complete = False
+                total_pages = self.max_pages_per_window
+            # The page count is known, so the remaining pages are fetched at once
+            pages = await asyncio.gather(*(
+                self._fetch_page(session, {**params, "page": page}) for page in range(2, total_pages + 1)
+            ))
+            for page in pages:
+                if page is None:
+                    self.fetch_complete = False
+                    continue
+                cfps.extend(page["cfps"])
+            return cfps
+        
+        cursor = first.get("next_cursor")
+        pages = 1
+        while cursor:
+            if pages >= self.max_pages_per_window:
+                logger.error(f"Call4Papers window {start} - {end} exceeded {self.max_pages_per_window} pages")
+                self.fetch_complete = False
+                break
+            page = await self._fetch_page(session, {**params, "cursor": cursor})
+            if page is None:
+                self.fetch_complete = False
+                break
+            cfps.extend(page["cfps"])
+            cursor = page.get("next_cursor")
+            pages += 1
+        return cfps
     
     def parse_cfp(self, raw_data: Dict[str, Any]) -> CFPSchema:
         """Parse raw CFP data into a CFPSchema object"""
@@ -1,10 +1,13 @@
-import aiohttp
 from typing import List, Dict, Any
+import asyncio
 import logging
 from datetime import datetime
 import json
 
+import aiohttp
+
 from .base_adapter import BaseCFPAdapter
+from .polling import poll_key
 from .utils import parse_date, clean_text
 from ..models.cfp import CFPSchema
 
@@ -13,6 +16,9 @@ logger = logging.getLogger(__name__)
 class ConfsTechAdapter(BaseCFPAdapter):
     """Adapter for tech-conferences GitHub repository"""
     
+    # One small file per category, served by a CDN
+    max_concurrent_requests = 8
+    
     def __init__(self):
         super().__init__("tech-conferences")
         self.base_url = "https://raw.githubusercontent.com/tech-conferences/conference-data/main/conferences/2024"
@@ -21,52 +27,88 @@ class ConfsTechAdapter(BaseCFPAdapter):
             "go", "php", "ruby", "scala", "kotlin", "swift", "android", 
             "ios", "data", "devops", "security", "testing", "ux", "accessibility"
         ]
+        # Records of each category's last fetch, reused while it is not due
+        # so scheduled runs still see (and do not sweep) the whole source
+        self._category_cfps: Dict[str, List[Dict[str, Any]]] = {}
+        self._polled_categories: List[str] = []
+    
+    def poll_keys(self) -> List[str]:
+        return [poll_key(self.source_name, category) for category in self.categories]
+    
+    def raw_poll_key(self, raw_data: Dict[str, Any]) -> str:
+        return poll_key(self.source_name, raw_data.get("category"))
+    
+    def polled_keys(self) -> List[str]:
+        return [poll_key(self.source_name, category) for category in self._polled_categories]
     
     async def fetch_cfps(self) -> List[Dict[str, Any]]:
-        """Fetch CFPs from tech-conferences JSON files"""
-        headers = {
-            "User-Agent": "CFPTracker/1.0 (https://github.com/your-repo/cfp-tracker)",
-            "Accept": "application/json",
-        }
-        
-        all_cfps = []
+        """Fetch CFPs from tech-conferences JSON files
         
-        async with aiohttp.ClientSession() as session:
-            for category in self.categories:
-                try:
-                    url = f"{self.base_url}/{category}.json"
-                    async with session.get(url, headers=headers) as response:
-                        if response.status == 200:
-                            try:
-                                text = await response.text()
-                                if not text.strip():
-                                    logger.info(f"Empty response for {category}.json")
-                                    continue
-                                    
-                                data = json.loads(text)
-                                if not isinstance(data, list):
-                                    logger.error(f"Unexpected data format in {category}.json: not a list")
-                                    continue
-                                    
-                                logger.info(f"Successfully fetched {len(data)} CFPs from {category}.json")
-                                
-                                # Add category to each CFP
-                                for cfp in data:
-                                    cfp["category"] = category
-                                
-                                all_cfps.extend(data)
-                            except json.JSONDecodeError as e:
-                                logger.error(f"Failed to parse JSON from {category}.json: {e}")
-                        else:
-                            response_text = await response.text()
-                            logger.error(f"Error fetching {category}.json: Status {response.status}, Response: {response_text}")
-                except Exception as e:
-                    logger.error(f"Exception fetching {category}.json: {e}")
-                    continue
+        Categories are fetched concurrently, up to max_concurrent_requests at once.
+        """
+        self._polled_categories = []
+        async with self._client_session() as session:
+            results = await asyncio.gather(*(
+                self._fetch_category(session, category) for category in self.categories
+            ))
         
+        all_cfps = [cfp for category_cfps in results for cfp in category_cfps]
         logger.info(f"Total CFPs fetched: {len(all_cfps)}")
         return all_cfps
     
+    async def _fetch_category(self, session: aiohttp.ClientSession, category: str) -> List[Dict[str, Any]]:
+        """Fetch one category, or reuse its last records while it is not due"""
+        if (
+            self.poll_plan is not None
+            and category in self._category_cfps
+            and not self.poll_plan.is_due(poll_key(self.source_name, category))
+        ):
+            return self._category_cfps[category]
+        
+        headers = {
+            "User-Agent": "CFPTracker/1.0 (https://github.com/your-repo/cfp-tracker)",
+            "Accept": "application/json",
+        }
+        try:
+            url = f"{self.base_url}/{category}.json"
+            status, text = await self._get(session, url, trace_attributes={"category": category}, headers=headers)
+            if status != 200:
+                logger.error(f"Error fetching {category}.json: Status {status}, Response: {text}")
+                self.fetch_complete = False
+                return self._reused_category(category)
+            if not text.strip():
+                logger.info(f"Empty response for {category}.json")
+                return []
+            
+            data = json.loads(text)
+            if not isinstance(data, list):
+                logger.error(f"Unexpected data format in {category}.json: not a list")
+                self.fetch_complete = False
+                return self._reused_category(category)
+            
+            logger.info(f"Successfully fetched {len(data)} CFPs from {category}.json")
+            
+            # Add category to each CFP
+            for cfp in data:
+                cfp["category"] = category
+            
+            if self.replay_run is None:
+                self._category_cfps[category] = data
+                self._polled_categories.append(category)
+            return data
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse JSON from {category}.json: {e}")
+        except Exception as e:
+            logger.error(f"Exception fetching {category}.json: {e}")
+        self.fetch_complete = False
+        return self._reused_category(category)
+    
+    def _reused_category(self, category: str) -> List[Dict[str, Any]]:
+        """Last records of a category whose fetch failed, so its events do not drop out of clusters"""
+        if self.replay_run is not None:
+            return []
+        return self._category_cfps.get(category, [])
+    
     def parse_cfp(self, raw_data: Dict[str, Any]) -> CFPSchema:
         """Parse raw CFP data into a CFPSchema object"""
         # Extract conference name
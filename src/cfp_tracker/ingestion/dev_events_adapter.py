@@ -1,15 +1,22 @@
-import aiohttp
 import logging
 from typing import List, Dict, Any, Optional, Tuple
 from bs4 import BeautifulSoup
 from datetime import datetime
 from .base_adapter import BaseCFPAdapter
+from .utils import parse_date
 from ..models.cfp import CFPSchema
 
 logger = logging.getLogger(__name__)
 
 class DevEventsAdapter(BaseCFPAdapter):
+    """Adapter scraping the dev.events conference listing"""
+
+    # A single page scraped from a site without an API; keep it gentle
+    max_concurrent_requests = 1
+    min_poll_interval_seconds = 3600
+
     def __init__(self):
+        super().__init__("dev.events")
         self.base_url = "https://dev.events/conferences"
         self.headers = {
             "User-Agent": "Mozilla/5.0 (compatible; CFPTrackerBot/1.0; +https://github.com/yourusername/cfp-tracker)"
@@ -38,72 +45,74 @@ class DevEventsAdapter(BaseCFPAdapter):
 
     async def fetch_cfps(self) -> List[Dict[Any, Any]]:
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.base_url, headers=self.headers) as response:
-                    if response.status != 200:
-                        logger.error(f"Failed to fetch CFPs from dev.events. Status code: {response.status}")
-                        return []
-
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
-                    cfps = []
-
-                    conference_table = soup.find('table')
-                    if not conference_table:
-                        logger.error("Could not find conference table on dev.events")
-                        return []
-
-                    for row in conference_table.find_all('tr')[1:]:  # Skip header row
-                        try:
-                            cells = row.find_all('td')
-                            if len(cells) >= 3:  # Name, Date, Location
-                                name_cell = cells[0].find('a')
-                                if not name_cell:
-                                    continue
-
-                                name = name_cell.text.strip()
-                                url = name_cell.get('href', '')
-                                if not url.startswith('http'):
-                                    url = f"https://dev.events{url}"
-
-                                date_text = cells[1].text.strip()
-                                location = cells[2].text.strip()
-
-                                start_date, end_date = self._parse_date_range(date_text)
-                                is_virtual = self._is_virtual_event(location)
-
-                                cfp_data = {
-                                    'name': name,
-                                    'url': url,
-                                    'location': location,
-                                    'conference_start_date': start_date,
-                                    'conference_end_date': end_date,
-                                    'is_virtual': is_virtual,
-                                    'source_url': self.base_url
-                                }
-                                cfps.append(cfp_data)
-
-                        except Exception as e:
-                            logger.error(f"Error parsing conference entry: {str(e)}")
+            async with self._client_session() as session:
+                status, html = await self._get(session, self.base_url, headers=self.headers)
+                if status != 200:
+                    logger.error(f"Failed to fetch CFPs from dev.events. Status code: {status}")
+                    self.fetch_complete = False
+                    return []
+
+            soup = BeautifulSoup(html, 'html.parser')
+            cfps = []
+
+            conference_table = soup.find('table')
+            if not conference_table:
+                logger.error("Could not find conference table on dev.events")
+                self.fetch_complete = False
+                return []
+
+            for row in conference_table.find_all('tr')[1:]:  # Skip header row
+                try:
+                    cells = row.find_all('td')
+                    if len(cells) >= 3:  # Name, Date, Location
+                        name_cell = cells[0].find('a')
+                        if not name_cell:
                             continue
 
-                    logger.info(f"Found {len(cfps)} CFPs from dev.events")
-                    return cfps
+                        name = name_cell.text.strip()
+                        url = name_cell.get('href', '')
+                        if not url.startswith('http'):
+                            url = f"https://dev.events{url}"
+
+                        date_text = cells[1].text.strip()
+                        location = cells[2].text.strip()
+
+                        start_date, end_date = self._parse_date_range(date_text)
+                        is_virtual = self._is_virtual_event(location)
+
+                        cfp_data = {
+                            'name': name,
+                            'url': url,
+                            'location': location,
+                            'conference_start_date': start_date,
+                            'conference_end_date': end_date,
+                            'is_virtual': is_virtual,
+                            'source_url': self.base_url
+                        }
+                        cfps.append(cfp_data)
+
+                except Exception as e:
+                    logger.error(f"Error parsing conference entry: {str(e)}")
+                    continue
+
+            logger.info(f"Found {len(cfps)} CFPs from dev.events")
+            return cfps
 
         except Exception as e:
             logger.error(f"Error fetching CFPs from dev.events: {str(e)}")
+            self.fetch_complete = False
             return []
 
     def parse_cfp(self, cfp_data: Dict[Any, Any]) -> CFPSchema:
         return CFPSchema(
             conference_name=cfp_data['name'],
-            conference_url=cfp_data['url'],
+            submission_deadline=None,  # dev.events does not list CFP deadlines
             location=cfp_data['location'],
-            conference_start_date=cfp_data['conference_start_date'],
-            conference_end_date=cfp_data['conference_end_date'],
+            conference_start_date=parse_date(cfp_data['conference_start_date']),
+            conference_end_date=parse_date(cfp_data['conference_end_date']),
             is_virtual=cfp_data['is_virtual'],
             topics=['technology', 'software development'],  # Default topics for dev.events
-            source='dev.events',
+            source=self.source_name,
             source_url=cfp_data['source_url'],
             submission_url=cfp_data['url']  # Using conference URL as submission URL since dev.events doesn't provide specific CFP URLs
         ) 
\ No newline at end of file
@@ -1,12 +1,13 @@
-import aiohttp
 from typing import List, Dict, Any
 import logging
 from datetime import datetime
 import base64
 import json
-import re
+
+import aiohttp
 
 from .base_adapter import BaseCFPAdapter
+from .markdown_events import MarkdownEventParser, iter_markdown_events
 from .utils import parse_date, clean_text
 from ..models.cfp import CFPSchema
 
@@ -15,6 +16,10 @@ logger = logging.getLogger(__name__)
 class GitHubEventsAdapter(BaseCFPAdapter):
     """Adapter for GitHub-based event repositories"""
     
+    # Unauthenticated GitHub API calls are limited to 60 an hour
+    max_concurrent_requests = 2
+    min_poll_interval_seconds = 1800
+    
     def __init__(self):
         super().__init__("github_events")
         self.api_url = "https://api.github.com"
@@ -40,49 +45,59 @@ class GitHubEventsAdapter(BaseCFPAdapter):
         
         all_events = []
         
-        async with aiohttp.ClientSession() as session:
+        async with self._client_session() as session:
             for repo in self.repos:
                 try:
-                    # Fetch file content from GitHub
                     url = f"{self.api_url}/repos/{repo['owner']}/{repo['repo']}/contents/{repo['path']}"
-                    async with session.get(url, headers=headers) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            content = base64.b64decode(data["content"]).decode("utf-8")
-                            
-                            if repo["path"].endswith(".json"):
-                                # Parse JSON content
-                                events = json.loads(content)
-                                all_events.extend(events)
-                            elif repo["path"].endswith(".md"):
-                                # Parse markdown content
-                                events = self._parse_markdown_events(content)
-                                all_events.extend(events)
-                        else:
-                            logger.error(f"Error fetching from {repo['owner']}/{repo['repo']}: {response.status}")
+                    if repo["path"].endswith(".md"):
+                        # Several MB, beyond what the contents API returns base64-encoded
+                        all_events.extend(await self._fetch_markdown_events(session, url, repo["path"]))
+                        continue
+                    
+                    # Fetch file content from GitHub
+                    status, text = await self._get(session, url, trace_attributes={"path": repo["path"]}, headers=headers)
+                    if status == 200:
+                        data = json.loads(text)
+                        content = base64.b64decode(data["content"]).decode("utf-8")
+                        all_events.extend(json.loads(content))
+                    else:
+                        logger.error(f"Error fetching from {repo['owner']}/{repo['repo']}: {status}")
+                        self.fetch_complete = False
                 except Exception as e:
                     logger.error(f"Exception fetching from {repo['owner']}/{repo['repo']}: {e}")
+                    self.fetch_complete = False
                     continue
         
         return all_events
     
-    def _parse_markdown_events(self, content: str) -> List[Dict[str, Any]]:
-        """Parse events from markdown content"""
+    async def _fetch_markdown_events(self, session: aiohttp.ClientSession, url: str, path: str) -> List[Dict[str, Any]]:
+        """Stream a markdown file as its raw media type and parse it line by line
+
+        Only the line being parsed is buffered, not the file, but the events
+        are collected for fetch_cfps, which returns them all at once, so
+        memory still grows with the number of events. While a snapshot is
+        recorded _get_lines also keeps the whole body.
+        """
+        headers = {
+            "Accept": "application/vnd.github.raw+json",
+            "User-Agent": "CFPTracker/1.0"
+        }
+        parser = MarkdownEventParser()
         events = []
-        
-        # Example pattern for conference entries in markdown
-        # This pattern needs to be adjusted based on the actual format
-        pattern = r"### (.+?)\n- Date: (.+?)\n- CFP: (.+?)\n"
-        
-        matches = re.finditer(pattern, content, re.MULTILINE)
-        for match in matches:
-            event = {
-                "name": match.group(1),
-                "date": match.group(2),
-                "cfp_url": match.group(3)
-            }
-            events.append(event)
-        
+        envelope = None
+        async for line in self._get_lines(session, url, trace_attributes={"path": path}, headers=headers):
+            # Payloads recorded before the raw media type was requested are
+            # base64 contents API responses
+            if envelope is not None or (parser.lines == 0 and line.startswith('{"')):
+                envelope = (envelope or "") + line
+                continue
+            event = parser.feed(line)
+            if event is not None:
+                events.append(event)
+        if envelope is not None:
+            content = base64.b64decode(json.loads(envelope)["content"]).decode("utf-8")
+            events.extend(iter_markdown_events(content.splitlines()))
+        logger.info(f"Parsed {len(events)} events from {path} ({parser.skipped} without a CFP or cancelled)")
         return events
     
     def parse_cfp(self, raw_data: Dict[str, Any]) -> CFPSchema:
@@ -93,6 +108,7 @@ class GitHubEventsAdapter(BaseCFPAdapter):
         # Parse dates
         date_str = raw_data.get("date", "")
         conference_date = parse_date(date_str)
+        conference_end_date = parse_date(raw_data.get("end_date")) or conference_date
         
         # For CFP deadline, we might need to parse it from description or other fields
         cfp_deadline = None
@@ -103,7 +119,7 @@ class GitHubEventsAdapter(BaseCFPAdapter):
             conference_name=conference_name,
             submission_deadline=cfp_deadline,
             conference_start_date=conference_date,
-            conference_end_date=conference_date,  # Using same date if end date not available
+            conference_end_date=conference_end_date,
             location=clean_text(raw_data.get("location", "")),
             is_virtual=raw_data.get("is_virtual", False),
             topics=raw_data.get("topics", []),
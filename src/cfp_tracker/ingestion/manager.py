@@ -1,42 +1,162 @@
-from typing import List, Dict, Type
+from typing import TYPE_CHECKING, List, Dict, Type, Any, Optional
+import importlib
+import importlib.metadata
 import logging
 import asyncio
 from datetime import datetime
 
-from .base_adapter import BaseCFPAdapter
-from .confstech_adapter import ConfsTechAdapter
-from .github_events_adapter import GitHubEventsAdapter
-from .dev_events_adapter import DevEventsAdapter
+from .polling import PollPlan, PollResult
+from .snapshots import ReplayRun, SnapshotStore
+from ..config import Config
 from ..models.cfp import CFPSchema
+from ..utils import tracing
+
+if TYPE_CHECKING:
+    from .base_adapter import BaseCFPAdapter
 
 logger = logging.getLogger(__name__)
 
+# Built-in adapters by name, as "module:Class" with modules relative to this
+# package; the modules, and aiohttp and BeautifulSoup with them, are only
+# imported by a manager, and only for enabled adapters
+ADAPTERS = {
+    "confs.tech": ".confstech_adapter:ConfsTechAdapter",
+    "github_events": ".github_events_adapter:GitHubEventsAdapter",
+    "dev_events": ".dev_events_adapter:DevEventsAdapter",
+    "call4papers": ".call4papers_adapter:Call4PapersAdapter",
+}
+
+# Installed packages add adapters under this entry point group, e.g. in setup.py:
+# entry_points={"cfp_tracker.adapters": ["meetup = cfp_meetup.adapter:MeetupAdapter"]}
+ADAPTER_ENTRY_POINT_GROUP = "cfp_tracker.adapters"
+
+def _split_setting(value: str) -> List[str]:
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+def _entry_points(group: str) -> List[importlib.metadata.EntryPoint]:
+    entry_points = importlib.metadata.entry_points()
+    # Python 3.9 returns a dict of groups
+    if hasattr(entry_points, "select"):
+        return list(entry_points.select(group=group))
+    return list(entry_points.get(group, []))
+
+def discover_adapters() -> Dict[str, str]:
+    """Find every available adapter without importing any
+    
+    Entry points, then ADAPTER_PLUGINS, are added to the built-ins and
+    replace built-ins of the same name.
+    
+    Returns:
+        Dict[str, str]: "module:Class" of each adapter by name
+    """
+    adapters = dict(ADAPTERS)
+    for entry_point in _entry_points(ADAPTER_ENTRY_POINT_GROUP):
+        adapters[entry_point.name] = entry_point.value
+    for plugin in _split_setting(Config.ADAPTER_PLUGINS):
+        adapter_name, _, spec = plugin.partition("=")
+        if not spec:
+            logger.error(f"Ignoring ADAPTER_PLUGINS entry '{plugin}': expected name=module:Class")
+            continue
+        adapters[adapter_name.strip()] = spec.strip()
+    return adapters
+
+def enabled_adapter_names(available: List[str]) -> List[str]:
+    """Names of the adapters enabled by ENABLED_ADAPTERS and DISABLED_ADAPTERS"""
+    enabled = _split_setting(Config.ENABLED_ADAPTERS) or available
+    disabled = set(_split_setting(Config.DISABLED_ADAPTERS))
+    for adapter_name in set(enabled) | disabled:
+        if adapter_name not in available:
+            logger.warning(f"Unknown adapter '{adapter_name}' in adapter settings")
+    return [name for name in enabled if name in available and name not in disabled]
+
+def load_adapter_class(spec: str) -> Type["BaseCFPAdapter"]:
+    """Import an adapter class from its "module:Class" on first use"""
+    module_name, _, class_name = spec.partition(":")
+    return getattr(importlib.import_module(module_name, __package__), class_name)
+
 class CFPIngestionManager:
     """Manager for CFP data ingestion"""
     
-    def __init__(self):
-        self.adapters: Dict[str, BaseCFPAdapter] = {}
+    def __init__(self, snapshot_store: Optional[SnapshotStore] = None):
+        self.adapters: Dict[str, "BaseCFPAdapter"] = {}
         self._register_adapters()
+        # Raw payloads are recorded only when a snapshot store is configured
+        self.snapshot_store = snapshot_store
+        if self.snapshot_store is None and Config.SNAPSHOT_DIR:
+            self.snapshot_store = SnapshotStore(Config.SNAPSHOT_DIR)
     
     def _register_adapters(self):
-        """Register available adapters"""
-        self.adapters["confs.tech"] = ConfsTechAdapter()
-        self.adapters["github_events"] = GitHubEventsAdapter()
-        self.adapters["dev_events"] = DevEventsAdapter()
-        # Add more adapters here as they are implemented
-    
-    async def fetch_all_cfps(self) -> List[CFPSchema]:
-        """Fetch CFPs from all registered adapters"""
+        """Register the enabled adapters, importing only their modules"""
+        available = discover_adapters()
+        for adapter_name in enabled_adapter_names(list(available)):
+            try:
+                self.adapters[adapter_name] = load_adapter_class(available[adapter_name])()
+            except Exception as e:
+                # A broken plugin must not take the other sources down with it
+                logger.error(f"Could not load adapter {adapter_name} ({available[adapter_name]}): {e}")
+    
+    async def fetch_all_cfps(
+        self,
+        replay_run: Optional[ReplayRun] = None,
+        poll_plan: Optional[PollPlan] = None
+    ) -> List[CFPSchema]:
+        """Fetch CFPs from all registered adapters
+        
+        With a replay run, adapters parse the payloads recorded by that run
+        instead of hitting the network, and adapters it did not record are
+        skipped. With a poll plan, adapters with nothing due are not
+        fetched; their last records are reused so duplicates across sources
+        resolve as they did when every source was fetched.
+        """
+        adapters = self.adapters
+        snapshot_run = None
+        all_cfps = []
+        if poll_plan is not None:
+            due_adapter_names = set(self.get_due_adapter_names(poll_plan))
+            adapters = {}
+            for adapter_name, adapter in self.adapters.items():
+                adapter.poll_plan = poll_plan
+                if adapter_name in due_adapter_names:
+                    adapters[adapter_name] = adapter
+                else:
+                    adapter.fetch_complete = False
+                    adapter.last_fetch_count = 0
+                    adapter.poll_results = []
+                    all_cfps.extend(adapter.last_cfps)
+        if replay_run is not None:
+            recorded_sources = set(replay_run.sources())
+            adapters = {}
+            for adapter_name, adapter in self.adapters.items():
+                if adapter.source_name in recorded_sources:
+                    adapters[adapter_name] = adapter
+                else:
+                    adapter.fetch_complete = False
+                    adapter.last_fetch_count = 0
+                    adapter.poll_results = []
+        elif self.snapshot_store is not None:
+            snapshot_run = self.snapshot_store.begin_run()
+        
         tasks = []
-        for adapter_name, adapter in self.adapters.items():
+        for adapter_name, adapter in adapters.items():
             logger.info(f"Fetching CFPs from {adapter_name}")
+            adapter.replay_run = replay_run
+            adapter.snapshot_run = snapshot_run
             tasks.append(adapter.get_cfps())
         
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        try:
+            with tracing.span("ingestion.fetch_all", adapters=len(tasks), replay=replay_run is not None) as span:
+                results = await asyncio.gather(*tasks, return_exceptions=True)
+                span.set_attribute("records", sum(len(r) for r in results if not isinstance(r, Exception)))
+        finally:
+            for adapter in self.adapters.values():
+                adapter.replay_run = None
+                adapter.snapshot_run = None
+                adapter.poll_plan = None
+            if snapshot_run is not None:
+                snapshot_run.close()
+                self.snapshot_store.prune(Config.SNAPSHOT_RETENTION_DAYS)
         
-        all_cfps = []
-        for i, result in enumerate(results):
-            adapter_name = list(self.adapters.keys())[i]
+        for adapter_name, result in zip(adapters.keys(), results):
             if isinstance(result, Exception):
                 logger.error(f"Error fetching CFPs from {adapter_name}: {result}")
                 continue
@@ -45,7 +165,7 @@ class CFPIngestionManager:
         
         return all_cfps
     
-    def get_adapter(self, adapter_name: str) -> BaseCFPAdapter:
+    def get_adapter(self, adapter_name: str) -> "BaseCFPAdapter":
         """Get a specific adapter by name"""
         return self.adapters.get(adapter_name)
     
@@ -53,9 +173,42 @@ class CFPIngestionManager:
         """Get names of all registered adapters"""
         return list(self.adapters.keys())
     
-    def get_adapter_last_fetch_time(self, adapter_name: str) -> datetime:
-        """Get the last fetch time for a specific adapter"""
+    def get_completed_sources(self) -> List[str]:
+        """Get source names of adapters whose last fetch covered the whole source
+        
+        An empty result is not trusted to mean the source has no events.
+        """
+        return [
+            adapter.source_name
+            for adapter in self.adapters.values()
+            if adapter.fetch_complete and adapter.last_fetch_count > 0
+        ]
+    
+    def get_due_adapter_names(self, poll_plan: PollPlan) -> List[str]:
+        """Get names of adapters with a source or category due under a poll plan
+        
+        Adapters without records to reuse, as after a restart, are always due.
+        """
+        return [
+            adapter_name
+            for adapter_name, adapter in self.adapters.items()
+            if adapter.last_cfps is None or any(poll_plan.is_due(key) for key in adapter.poll_keys())
+        ]
+    
+    def get_poll_results(self) -> List[PollResult]:
+        """Get what the last fetch polled, for the sources it fetched completely"""
+        return [result for adapter in self.adapters.values() for result in adapter.poll_results]
+    
+    def get_adapter_last_fetch_time(self, adapter_name: str) -> Optional[datetime]:
+        """Get the last fetch time for a specific adapter; None if it has not fetched yet"""
         adapter = self.get_adapter(adapter_name)
         if adapter:
             return adapter.last_fetch_time
-        return None 
\ No newline at end of file
+        return None
+    
+    def get_adapter_status(self, adapter_name: str) -> Optional[Dict[str, Any]]:
+        """Get fetch and circuit breaker state for a specific adapter"""
+        adapter = self.get_adapter(adapter_name)
+        if adapter:
+            return adapter.get_status()
+        return None
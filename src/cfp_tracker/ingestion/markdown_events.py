@@ -0,0 +1,155 @@
+import calendar
+import re
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+from urllib.parse import unquote
+import logging
+
+logger = logging.getLogger(__name__)
+
+MONTHS = {name.lower(): number for number, name in enumerate(calendar.month_name) if name}
+
+YEAR_HEADING = re.compile(r"^##\s+(\d{4})\s*$")
+MONTH_HEADING = re.compile(r"^###\s+(.+?)\s*$")
+# "* 8-10: [Name](https://...) - City (Country) <a href=...><img alt="CFP ..." ...></a>"
+LIST_ENTRY = re.compile(r"^\s*[*-]\s+(?P<days>[\d/\-–\s]+):\s*\[(?P<name>[^\]]+)\]\((?P<url>[^)\s]+)\)(?P<rest>.*)$")
+LINK = re.compile(r"\[(?P<name>[^\]]+)\]\((?P<url>[^)\s]+)\)")
+CFP_BADGE = re.compile(
+    r'<a href="(?P<url>[^"]+)"[^>]*>\s*<img alt="CFP[^"]*" src="[^"]*?message=until(?:%20|\s|\+)(?P<until>[^&"]+)'
+)
+# The format the stub sources and older recorded payloads use
+LEGACY_DATE = re.compile(r"^- Date: (.+)$")
+LEGACY_CFP = re.compile(r"^- CFP: (.+)$")
+
+
+def _parse_until(value: str) -> Optional[str]:
+    """ISO date of a CFP badge's "until" message, such as "15-September-2024" """
+    try:
+        return datetime.strptime(unquote(value).strip(), "%d-%B-%Y").strftime("%Y-%m-%d")
+    except ValueError:
+        return None
+
+
+def _parse_days(days: str, year: int, month: int) -> Optional[Tuple[date, date]]:
+    """Start and end of "8", "8-10" or "30/01-02/02" within a month section"""
+    parts = [part.strip() for part in re.split(r"[-–]", days) if part.strip()]
+    if not 1 <= len(parts) <= 2:
+        return None
+    try:
+        dates = []
+        for part in parts:
+            day, _, part_month = part.partition("/")
+            dates.append(date(year, int(part_month) if part_month else month, int(day)))
+    except ValueError:
+        return None
+    start, end = dates[0], dates[-1]
+    if end < start:
+        try:
+            if "/" in parts[-1]:
+                # "30/12-02/01" runs into the next year
+                end = end.replace(year=year + 1)
+            else:
+                # "29-2" runs into the next month
+                end = date(year + month // 12, month % 12 + 1, end.day)
+        except ValueError:
+            return None
+    return start, end
+
+
+class MarkdownEventParser:
+    """State machine turning the lines of an events README into event records
+
+    Tracks the "## 2024" year and "### January" month sections and reads
+    each event of a month from a list item or a table row whose first cells
+    hold the days, the linked name and the location; the CFP comes from
+    the "CFP" badge linking to it. Events without a CFP, and struck-through
+    (cancelled) ones, are skipped. The "### Name / - Date: / - CFP:" blocks
+    of the older format are read too.
+    """
+
+    def __init__(self):
+        self.year: Optional[int] = None
+        self.month: Optional[int] = None
+        self.lines = 0
+        self.skipped = 0
+        self._heading: Optional[str] = None
+        self._legacy: Optional[Dict[str, Any]] = None
+
+    def feed(self, line: str) -> Optional[Dict[str, Any]]:
+        """Read one line; returns the event it completes, if any"""
+        self.lines += 1
+        heading, self._heading = self._heading, None
+        legacy, self._legacy = self._legacy, None
+
+        if legacy is not None:
+            match = LEGACY_CFP.match(line)
+            if match:
+                return {**legacy, "cfp_url": match.group(1)}
+        if heading is not None:
+            match = LEGACY_DATE.match(line)
+            if match:
+                self._legacy = {"name": heading, "date": match.group(1)}
+                return None
+
+        if line.startswith("##"):
+            match = YEAR_HEADING.match(line)
+            if match:
+                self.year, self.month = int(match.group(1)), None
+                return None
+            match = MONTH_HEADING.match(line)
+            if match:
+                self._heading = match.group(1)
+                self.month = MONTHS.get(self._heading.lower())
+                return None
+
+        if self.year is None or self.month is None:
+            return None
+        if line.lstrip().startswith("|"):
+            return self._table_row(line)
+        match = LIST_ENTRY.match(line)
+        if match:
+            return self._event(match.group("days"), match.group("name"), match.group("url"), match.group("rest"), line)
+        return None
+
+    def _table_row(self, line: str) -> Optional[Dict[str, Any]]:
+        cells = [cell.strip() for cell in line.strip().strip("|").split("|")]
+        if len(cells) < 2:
+            return None
+        link = LINK.search(cells[1])
+        if not link or not re.match(r"^[\d/\-–\s]+$", cells[0]):
+            # Header and separator rows
+            return None
+        rest = " - " + " | ".join(cells[2:])
+        return self._event(cells[0], link.group("name"), link.group("url"), rest, line)
+
+    def _event(self, days: str, name: str, url: str, rest: str, line: str) -> Optional[Dict[str, Any]]:
+        badge = CFP_BADGE.search(rest)
+        if "~~" in line or badge is None:
+            self.skipped += 1
+            return None
+        dates = _parse_days(days, self.year, self.month)
+        if dates is None:
+            logger.debug(f"Unreadable days '{days}' for {name}")
+            self.skipped += 1
+            return None
+
+        location = rest.split("<", 1)[0].strip(" -|")
+        return {
+            "name": name.strip(),
+            "date": dates[0].isoformat(),
+            "end_date": dates[1].isoformat(),
+            "url": url,
+            "location": location,
+            "is_virtual": "online" in location.lower(),
+            "cfp_url": badge.group("url"),
+            "cfp_deadline": _parse_until(badge.group("until")),
+        }
+
+
+def iter_markdown_events(lines: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    """Events of an events README, yielded as their lines are read"""
+    parser = MarkdownEventParser()
+    for line in lines:
+        event = parser.feed(line)
+        if event is not None:
+            yield event
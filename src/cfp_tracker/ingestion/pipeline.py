@@ -0,0 +1,143 @@
+from typing import TYPE_CHECKING, Dict, List, Optional
+from datetime import datetime
+import logging
+
+from sqlalchemy.orm import Session
+
+from .polling import PollPlan, record_polls
+from .resolution import resolve_duplicates
+from .snapshots import SnapshotStore
+from ..models.cfp import CFPSchema, IngestionRun
+from ..storage.cfp_store import store_cfps, sweep_unseen_cfps
+from ..storage.changes import record_changes
+from ..storage.dataset_version import bump_dataset_version, dataset_version
+from ..storage.source_polls import next_poll_times
+from ..utils import tracing
+from ..utils.profiling import profile
+
+if TYPE_CHECKING:
+    from .manager import CFPIngestionManager
+
+logger = logging.getLogger(__name__)
+
+def store_resolved_cfps(db: Session, manager: "CFPIngestionManager", cfps: List[CFPSchema]) -> Dict[str, int]:
+    """Store and reconcile CFPs already collapsed by resolve_duplicates.
+    
+    Args:
+        db: Database session; committed on success
+        manager: Manager whose adapters produced the CFPs, used to tell
+            which sources were fetched completely
+        cfps: Resolved CFPs from all sources
+        
+    Returns:
+        Dict[str, int]: Counts of inserted, updated, unchanged and withdrawn rows
+    """
+    with tracing.span("storage.store", records=len(cfps)) as span:
+        # The run id is the generation stamped on every row seen by this run
+        run = IngestionRun()
+        db.add(run)
+        db.flush()
+        
+        # Store CFPs in the database, writing only new or changed rows
+        changes = []
+        stats = store_cfps(db, cfps, generation=run.id, changes=changes)
+        
+        # Withdraw rows that fully fetched sources no longer list
+        stats["withdrawn"] = 0
+        with tracing.span("storage.sweep") as sweep_span:
+            for source in manager.get_completed_sources():
+                stats["withdrawn"] += sweep_unseen_cfps(db, source, run.id)
+            sweep_span.set_attribute("withdrawn", stats["withdrawn"])
+        
+        for key, value in stats.items():
+            setattr(run, key, value)
+        run.finished_at = datetime.utcnow()
+        # Invalidates response caches and read models in every worker
+        version = bump_dataset_version(db)
+        # Feeds the CFP stream of every worker
+        record_changes(db, version, changes)
+        db.commit()
+        span.set_attributes(run_id=run.id, dataset_version=version, **stats)
+    
+    dataset_version.set(version)
+    logger.info(
+        f"Stored {len(cfps)} CFPs in the database: {stats['inserted']} inserted, "
+        f"{stats['updated']} updated, {stats['unchanged']} unchanged, "
+        f"{stats['withdrawn']} withdrawn"
+    )
+    return stats
+
+def store_ingested_cfps(db: Session, manager: "CFPIngestionManager", cfps: List[CFPSchema]) -> Dict[str, int]:
+    """Resolve, store and reconcile the CFPs fetched by one ingestion run."""
+    # Collapse the same event reported by several sources
+    with tracing.span("ingestion.resolve", records=len(cfps)) as span:
+        resolved = resolve_duplicates(cfps)
+        span.set_attribute("resolved", len(resolved))
+    return store_resolved_cfps(db, manager, resolved)
+
+async def fetch_and_store(
+    db: Session,
+    manager: "CFPIngestionManager",
+    trace_parent: Optional[tracing.SpanContext] = None,
+    due_only: bool = False
+) -> Dict[str, int]:
+    """Fetch CFPs from all sources and store them in the database
+    
+    With due_only, only sources due under adaptive polling are fetched, and
+    nothing is stored when none is. Either way, the run's observations
+    adapt the polling intervals of the sources it fetched.
+    """
+    with profile("ingestion"), tracing.span("ingestion.run", parent=trace_parent, due_only=due_only) as span:
+        polled_at = datetime.utcnow()
+        poll_plan = None
+        if due_only:
+            poll_plan = PollPlan(next_poll_times(db), polled_at)
+            due_adapters = manager.get_due_adapter_names(poll_plan)
+            span.set_attribute("due_adapters", len(due_adapters))
+            if not due_adapters:
+                logger.info("No sources are due for polling")
+                return {}
+        cfps = await manager.fetch_all_cfps(poll_plan=poll_plan)
+        logger.info(f"Fetched {len(cfps)} CFPs from all sources")
+        stats = store_ingested_cfps(db, manager, cfps)
+        record_polls(db, manager.get_poll_results(), polled_at)
+        return stats
+
+async def replay_snapshots(
+    db: Session,
+    manager: "CFPIngestionManager",
+    store: SnapshotStore,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    skip_identical: bool = True
+) -> Dict[str, int]:
+    """Re-run parsing and storage over recorded runs, without the network.
+    
+    Args:
+        db: Database session
+        manager: Manager whose adapters parse the recorded payloads
+        store: Snapshot store holding the recorded runs
+        since: Only replay runs recorded at or after this time
+        until: Only replay runs recorded at or before this time
+        skip_identical: Skip runs whose payloads are byte-for-byte those of
+            the previously replayed run, as they cannot change anything
+        
+    Returns:
+        Dict[str, int]: Totals over all replayed runs, plus runs replayed and skipped
+    """
+    totals = {"runs": 0, "skipped": 0, "inserted": 0, "updated": 0, "unchanged": 0, "withdrawn": 0}
+    previous_digests = None
+    for replay_run in store.iter_runs(since, until):
+        if skip_identical and replay_run.digests == previous_digests:
+            totals["skipped"] += 1
+            continue
+        previous_digests = replay_run.digests
+        
+        cfps = await manager.fetch_all_cfps(replay_run=replay_run)
+        stats = store_ingested_cfps(db, manager, cfps)
+        for key, value in stats.items():
+            totals[key] += value
+        totals["runs"] += 1
+        logger.info(f"Replayed snapshot run {replay_run.run_id}: {len(cfps)} CFPs")
+    
+    return totals
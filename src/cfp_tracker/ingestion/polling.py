@@ -0,0 +1,154 @@
+import hashlib
+import json
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional
+import logging
+
+from sqlalchemy.orm import Session
+
+from ..config import Config
+from ..models.cfp import CFPSchema, SourcePoll
+from ..storage.cfp_store import compute_content_hash
+from ..storage.source_polls import list_source_polls
+
+logger = logging.getLogger(__name__)
+
+
+def poll_key(source: str, category: Optional[str] = None) -> str:
+    """Key of a source, or of one category of a source, in source_polls"""
+    return f"{source}/{category}" if category else source
+
+
+def payload_digest(raw_cfps: List[Dict[str, Any]]) -> str:
+    """Fingerprint of the raw records of one poll, equal only for identical payloads"""
+    payload = json.dumps(raw_cfps, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def records_digest(cfps: List[CFPSchema]) -> str:
+    """Fingerprint of the parsed records of one poll, independent of their order"""
+    digest = hashlib.blake2b(digest_size=16)
+    for content_hash in sorted(compute_content_hash(cfp.model_dump()) for cfp in cfps):
+        digest.update(content_hash.encode("ascii"))
+    return digest.hexdigest()
+
+
+class PollResult:
+    """What one poll of a source fetched"""
+
+    def __init__(
+        self,
+        key: str,
+        source: str,
+        records_digest: str,
+        payload_digest: str,
+        min_interval_seconds: int = Config.POLL_MIN_INTERVAL_SECONDS,
+        max_interval_seconds: int = Config.POLL_MAX_INTERVAL_SECONDS
+    ):
+        self.key = key
+        self.source = source
+        self.records_digest = records_digest
+        self.payload_digest = payload_digest
+        # Declared by the source's adapter
+        self.min_interval_seconds = min_interval_seconds
+        self.max_interval_seconds = max_interval_seconds
+
+
+class PollPlan:
+    """Which sources a scheduled ingestion run fetches
+
+    A source is due when its next poll falls before the middle of the next
+    ingestion tick, so scheduler jitter does not push it back a whole tick.
+    Sources never polled before are always due.
+    """
+
+    def __init__(self, next_poll_times: Dict[str, datetime], now: Optional[datetime] = None):
+        self.next_poll_times = next_poll_times
+        self.now = now or datetime.utcnow()
+
+    def is_due(self, key: str) -> bool:
+        next_poll_at = self.next_poll_times.get(key)
+        if next_poll_at is None:
+            return True
+        return next_poll_at <= self.now + timedelta(seconds=Config.POLL_MIN_INTERVAL_SECONDS / 2)
+
+
+def next_interval(
+    interval: float,
+    changed: bool,
+    payload_unchanged: bool,
+    min_seconds: int = Config.POLL_MIN_INTERVAL_SECONDS,
+    max_seconds: int = Config.POLL_MAX_INTERVAL_SECONDS
+) -> int:
+    """Polling interval after a poll, within bounds
+
+    Args:
+        interval: Current interval in seconds
+        changed: Whether the poll produced new, changed or dropped records
+        payload_unchanged: Whether the payloads were identical to the last poll's
+        min_seconds: Shortest interval
+        max_seconds: Longest interval
+
+    Returns:
+        int: Seconds until the next poll
+    """
+    if changed:
+        interval /= Config.POLL_SPEEDUP_FACTOR
+    elif payload_unchanged:
+        interval *= Config.POLL_UNCHANGED_BACKOFF_FACTOR
+    else:
+        interval *= Config.POLL_BACKOFF_FACTOR
+    return int(min(max_seconds, max(min_seconds, interval)))
+
+
+def record_polls(db: Session, results: Iterable[PollResult], polled_at: datetime) -> int:
+    """Update the polling state of the sources a run fetched.
+
+    Args:
+        db: Database session; committed
+        results: Poll results of the sources fetched completely
+        polled_at: When the run started fetching
+
+    Returns:
+        int: Number of sources whose records changed
+    """
+    polls = {poll.key: poll for poll in list_source_polls(db)}
+    changed_sources = 0
+    for result in results:
+        poll = polls.get(result.key)
+        if poll is None:
+            # First poll; nothing to compare with yet
+            poll = SourcePoll(
+                key=result.key,
+                source=result.source,
+                interval_seconds=result.min_interval_seconds,
+                polls=0,
+                changed_polls=0
+            )
+            db.add(poll)
+        else:
+            changed = result.records_digest != poll.records_digest
+            interval = next_interval(
+                poll.interval_seconds,
+                changed,
+                result.payload_digest == poll.payload_digest,
+                result.min_interval_seconds,
+                result.max_interval_seconds
+            )
+            if interval != poll.interval_seconds:
+                logger.debug(
+                    f"Polling {result.key} every {interval}s instead of {poll.interval_seconds}s "
+                    f"({'changed' if changed else 'unchanged'})"
+                )
+            poll.interval_seconds = interval
+            if changed:
+                poll.changed_polls += 1
+                poll.last_changed_at = polled_at
+                changed_sources += 1
+        poll.polls += 1
+        poll.last_polled_at = polled_at
+        poll.next_poll_at = polled_at + timedelta(seconds=poll.interval_seconds)
+        poll.records_digest = result.records_digest
+        poll.payload_digest = result.payload_digest
+    db.commit()
+    return changed_sources
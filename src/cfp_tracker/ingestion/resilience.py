@@ -0,0 +1,96 @@
+import random
+import time
+from typing import Any, Dict, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+# HTTP statuses worth retrying: timeouts, throttling and server-side errors
+TRANSIENT_STATUSES = {408, 425, 429, 500, 502, 503, 504}
+
+
+class TransientFetchError(Exception):
+    """A request failed in a way that may succeed when retried"""
+
+
+class FetchStatusError(Exception):
+    """A streamed request was finally answered with a status other than 200"""
+
+    def __init__(self, url: str, status: int):
+        super().__init__(f"{url}: status {status}")
+        self.status = status
+
+
+def backoff_delay(attempt: int, base_delay: float, max_delay: float) -> float:
+    """Full-jitter exponential backoff delay for a retry attempt
+
+    Args:
+        attempt: Zero-based number of the retry
+        base_delay: Delay ceiling of the first retry in seconds
+        max_delay: Upper bound of any delay in seconds
+
+    Returns:
+        float: Seconds to wait, drawn uniformly below the exponential ceiling
+    """
+    return random.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
+
+
+class CircuitBreaker:
+    """Circuit breaker that skips a source which keeps failing
+
+    After `failure_threshold` consecutive failures the circuit opens and
+    requests are refused for `cooldown_seconds`. The first request after the
+    cool-down is let through as a trial (half-open); its outcome closes the
+    circuit again or re-opens it for another cool-down.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, cooldown_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_in_progress = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return self.CLOSED
+        if time.monotonic() - self.opened_at >= self.cooldown_seconds:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def allow_request(self) -> bool:
+        """Whether a fetch may be attempted now"""
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        if state == self.HALF_OPEN and not self._trial_in_progress:
+            self._trial_in_progress = True
+            return True
+        return False
+
+    def record_success(self):
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self._trial_in_progress = False
+
+    def record_failure(self):
+        self.consecutive_failures += 1
+        if self._trial_in_progress or self.consecutive_failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+        self._trial_in_progress = False
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current state for status reporting"""
+        retry_in = None
+        if self.opened_at is not None:
+            retry_in = max(0.0, self.cooldown_seconds - (time.monotonic() - self.opened_at))
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "retry_in_seconds": retry_in,
+        }
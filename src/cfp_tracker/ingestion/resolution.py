@@ -0,0 +1,237 @@
+import re
+import unicodedata
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import logging
+
+from ..models.cfp import CFPSchema
+
+logger = logging.getLogger(__name__)
+
+# Sources listed first win when choosing the canonical record of a cluster.
+# confs.tech carries the richest structured data, dev.events the poorest.
+SOURCE_PRIORITY = ["tech-conferences", "Call4Papers", "github_events", "dev.events"]
+
+# Maximum distance in days between two dates for them to describe one event
+DATE_TOLERANCE_DAYS = 3
+
+_YEAR_RE = re.compile(r"\b(?:19|20)\d{2}\b|'\d{2}\b")
+_ORDINAL_RE = re.compile(r"\b\d+(?:st|nd|rd|th)\b")
+_NON_WORD_RE = re.compile(r"[^a-z0-9]+")
+_NOISE_TOKENS = {"the", "conf", "conference", "edition", "annual"}
+
+
+def normalize_name(name: str) -> str:
+    """Normalize a conference name for comparison
+
+    Lowercases, strips accents, years ("2025", "'25"), ordinals and
+    punctuation, and drops filler words such as "conference".
+    """
+    if not name:
+        return ""
+    text = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
+    text = text.lower()
+    text = _YEAR_RE.sub(" ", text)
+    text = _ORDINAL_RE.sub(" ", text)
+    tokens = [t for t in _NON_WORD_RE.split(text) if t and t not in _NOISE_TOKENS]
+    return " ".join(tokens)
+
+
+def _anchor_date(cfp: CFPSchema) -> Optional[datetime]:
+    """Date used to tell editions apart: conference start, else CFP deadline"""
+    return cfp.conference_start_date or cfp.submission_deadline
+
+
+def dedup_key(cfp: CFPSchema) -> str:
+    """Stable identity key for a CFP: normalized name plus event date
+
+    The date is the conference start, else the CFP deadline, so two events
+    of the same name in the same year keep separate rows.
+    """
+    anchor = _anchor_date(cfp)
+    return f"{normalize_name(cfp.conference_name)}|{anchor.strftime('%Y-%m-%d') if anchor else ''}"
+
+
+def dedup_key_name(key: str) -> str:
+    """The normalized name part of a dedup key"""
+    return key.rpartition("|")[0]
+
+
+def year_dedup_key(key: str) -> str:
+    """The name|year key a row was stored under before keys carried the date"""
+    name, _, day = key.rpartition("|")
+    return f"{name}|{day[:4]}"
+
+
+def _names_match(a_tokens: frozenset, b_tokens: frozenset) -> bool:
+    """Decide whether two normalized names describe the same conference
+
+    Most tokens of each name must appear in the other, so "pycon us"
+    matches "pycon us" but neither "pycon" alone nor "pycon de", and a
+    bare name cannot link two different events into one cluster.
+    """
+    if not a_tokens or not b_tokens:
+        return False
+    overlap = len(a_tokens & b_tokens)
+    return overlap / max(len(a_tokens), len(b_tokens)) >= 0.8
+
+
+class _UnionFind:
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, i: int) -> int:
+        parent = self.parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(self, a: int, b: int):
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a != root_b:
+            # Keep the lowest index as root so cluster order is deterministic
+            if root_b < root_a:
+                root_a, root_b = root_b, root_a
+            self.parent[root_b] = root_a
+
+
+def _blocking_keys(normalized: str, tokens: Iterable[str], cfp: CFPSchema) -> List[Tuple[str, ...]]:
+    """Blocking keys for a record
+
+    Records only get compared when they share a key. Undated records can
+    only be trusted on an exact normalized name; dated records are also
+    blocked by each significant name token together with the event year.
+    """
+    anchor = _anchor_date(cfp)
+    if not anchor:
+        return [("undated", normalized)]
+    # Events just after New Year also join the previous year's blocks
+    years = {anchor.year, (anchor - timedelta(days=DATE_TOLERANCE_DAYS)).year}
+    keys = [("token", token, year) for token in tokens if len(token) > 2 for year in years]
+    return keys or [("name", normalized, year) for year in years]
+
+
+def _link_block(members: List[int], anchors: List[Optional[datetime]],
+                token_sets: List[frozenset], uf: "_UnionFind"):
+    """Union matching records within one block
+
+    Members are swept in date order and each record is only compared with
+    the following records whose date lies within the tolerance window, so a
+    block costs O(b log b) rather than O(b^2).
+    """
+    members = sorted(members, key=lambda i: anchors[i])
+    for pos, i in enumerate(members):
+        for j in members[pos + 1:]:
+            if (anchors[j] - anchors[i]).days > DATE_TOLERANCE_DAYS:
+                break
+            if uf.find(i) != uf.find(j) and _names_match(token_sets[i], token_sets[j]):
+                uf.union(i, j)
+
+
+def _source_rank(source: str) -> int:
+    try:
+        return SOURCE_PRIORITY.index(source)
+    except ValueError:
+        return len(SOURCE_PRIORITY)
+
+
+def _completeness(cfp: CFPSchema) -> int:
+    fields = (
+        cfp.submission_deadline, cfp.conference_start_date, cfp.conference_end_date,
+        cfp.location, cfp.submission_url, cfp.source_url, cfp.description,
+    )
+    return sum(1 for value in fields if value)
+
+
+def _provenance_entry(cfp: CFPSchema) -> Dict[str, Any]:
+    return {
+        "source": cfp.source,
+        "conference_name": cfp.conference_name,
+        "source_url": cfp.source_url,
+        "submission_url": cfp.submission_url,
+    }
+
+
+def merge_cluster(cfps: List[CFPSchema]) -> CFPSchema:
+    """Merge records describing one event into a canonical CFP
+
+    The highest priority (then most complete) record supplies the base
+    values, missing fields are filled in from the others in the same order,
+    topics are unioned and every input record is kept as provenance. Fields
+    no record provides are left unset, so storing the result keeps their
+    stored values rather than clearing them.
+    """
+    ordered = sorted(cfps, key=lambda c: (_source_rank(c.source), -_completeness(c)))
+    canonical = ordered[0]
+
+    updates: Dict[str, Any] = {}
+    for field in ("submission_deadline", "conference_start_date", "conference_end_date",
+                  "location", "submission_url", "source_url", "description"):
+        if not getattr(canonical, field):
+            for other in ordered[1:]:
+                value = getattr(other, field)
+                if value:
+                    updates[field] = value
+                    break
+
+    topics: List[str] = []
+    provenance: List[Dict[str, Any]] = []
+    for cfp in ordered:
+        for topic in cfp.topics:
+            if topic and topic not in topics:
+                topics.append(topic)
+        provenance.extend(cfp.provenance or [_provenance_entry(cfp)])
+
+    updates["topics"] = topics
+    updates["is_virtual"] = canonical.is_virtual
+    updates["provenance"] = provenance
+    merged = canonical.model_copy(update=updates)
+    merged = CFPSchema.model_construct(
+        _fields_set={field for field in merged.model_fields_set if getattr(merged, field) is not None},
+        **dict(merged)
+    )
+    merged.dedup_key = dedup_key(merged)
+    return merged
+
+
+def resolve_duplicates(cfps: List[CFPSchema]) -> List[CFPSchema]:
+    """Collapse records that describe the same event into canonical CFPs
+
+    Candidate pairs are generated through a blocking index and a date
+    window within each block, so the cost grows near-linearly with the
+    number of records rather than quadratically.
+    """
+    if not cfps:
+        return []
+
+    normalized = [normalize_name(cfp.conference_name) for cfp in cfps]
+    token_sets = [frozenset(name.split()) for name in normalized]
+    anchors = [_anchor_date(cfp) for cfp in cfps]
+
+    blocks: Dict[Tuple[str, ...], List[int]] = defaultdict(list)
+    for i, cfp in enumerate(cfps):
+        if not normalized[i]:
+            continue
+        for key in _blocking_keys(normalized[i], token_sets[i], cfp):
+            blocks[key].append(i)
+
+    uf = _UnionFind(len(cfps))
+    for key, members in blocks.items():
+        if len(members) < 2:
+            continue
+        if key[0] == "undated":
+            # Exact normalized name is the only evidence available
+            for j in members[1:]:
+                uf.union(members[0], j)
+        else:
+            _link_block(members, anchors, token_sets, uf)
+
+    clusters: Dict[int, List[CFPSchema]] = defaultdict(list)
+    for i, cfp in enumerate(cfps):
+        clusters[uf.find(i)].append(cfp)
+
+    resolved = [merge_cluster(members) for members in clusters.values()]
+    logger.info(f"Resolved {len(cfps)} CFPs into {len(resolved)} distinct events")
+    return resolved
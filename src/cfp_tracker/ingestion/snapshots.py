@@ -0,0 +1,206 @@
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Run ids are UTC timestamps, so lexical order is chronological order
+RUN_ID_FORMAT = "%Y%m%dT%H%M%S%fZ"
+
+
+class PayloadNotRecorded(LookupError):
+    """A replayed adapter requested something the recorded run never fetched"""
+
+
+def _request_key(url: str, params: Optional[Dict[str, Any]]) -> str:
+    if not params:
+        return url
+    return f"{url}?{json.dumps(params, sort_keys=True, default=str)}"
+
+
+class SnapshotRun:
+    """Raw payloads recorded during one ingestion run
+
+    Payload bodies go to the store's content-addressed objects; the run
+    itself is a JSONL manifest of (source, request, status, digest) entries,
+    written when the run is closed.
+    """
+
+    def __init__(self, store: "SnapshotStore", run_id: str):
+        self.store = store
+        self.run_id = run_id
+        self.entries: List[Dict[str, Any]] = []
+
+    def record(self, source: str, url: str, params: Optional[Dict[str, Any]], status: int, body: str):
+        """Store one fetched payload"""
+        digest = self.store.put(body.encode("utf-8"))
+        self.entries.append({
+            "source": source,
+            "url": url,
+            "params": params,
+            "status": status,
+            "digest": digest,
+            "fetched_at": datetime.utcnow().isoformat(),
+        })
+
+    def close(self):
+        """Write the manifest; runs without payloads leave no trace"""
+        if self.entries:
+            self.store.write_manifest(self.run_id, self.entries)
+
+
+class ReplayRun:
+    """Serves the payloads of a recorded run in place of live requests"""
+
+    def __init__(self, store: "SnapshotStore", run_id: str, entries: List[Dict[str, Any]]):
+        self.store = store
+        self.run_id = run_id
+        self.entries = entries
+        # Sorted so runs compare equal regardless of the order adapters finished in
+        self.digests = tuple(sorted(entry["digest"] for entry in entries))
+        self._by_request: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for entry in entries:
+            self._by_request.setdefault((entry["source"], _request_key(entry["url"], entry["params"])), entry)
+
+    def sources(self) -> List[str]:
+        return sorted({entry["source"] for entry in self.entries})
+
+    def recorded_params(self, source: str) -> List[Dict[str, Any]]:
+        """Query parameters of the requests a source made in the recorded run"""
+        return [entry["params"] for entry in self.entries if entry["source"] == source and entry["params"]]
+
+    def lookup(self, source: str, url: str, params: Optional[Dict[str, Any]]) -> Tuple[int, str]:
+        """Recorded status and body for a request
+
+        Only the same URL with the same query parameters matches: a payload
+        recorded for other parameters, such as another page, would stand in
+        for data the run never fetched. Adapters whose parameters depend on
+        the current date must derive them from the recorded run instead.
+
+        Raises:
+            PayloadNotRecorded: The recorded run never made this request
+        """
+        entry = self._by_request.get((source, _request_key(url, params)))
+        if entry is None:
+            raise PayloadNotRecorded(f"{url} was not fetched by {source} in run {self.run_id}")
+        return entry["status"], self.store.get(entry["digest"]).decode("utf-8")
+
+
+class SnapshotStore:
+    """Content-addressed, compressed store of raw source payloads
+
+    Layout under the root directory:
+        objects/ab/abcdef...   gzip-compressed payload, named by the SHA-256
+                               of its uncompressed content
+        runs/<run_id>.jsonl    manifest of the payloads fetched by one run
+
+    Identical payloads fetched by different runs are stored once, so keeping
+    a year of mostly unchanged daily runs costs little more than one run.
+    """
+
+    def __init__(self, root: str, cache_size: int = 256):
+        self.root = root
+        self.objects_dir = os.path.join(root, "objects")
+        self.runs_dir = os.path.join(root, "runs")
+        os.makedirs(self.objects_dir, exist_ok=True)
+        os.makedirs(self.runs_dir, exist_ok=True)
+        self._cache: "OrderedDict[str, bytes]" = OrderedDict()
+        self._cache_size = cache_size
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.objects_dir, digest[:2], digest)
+
+    def put(self, data: bytes) -> str:
+        """Store a payload and return its digest"""
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write then rename so concurrent readers never see partial objects
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+            with os.fdopen(fd, "wb") as f:
+                f.write(gzip.compress(data, compresslevel=6))
+            os.replace(tmp_path, path)
+        return digest
+
+    def get(self, digest: str) -> bytes:
+        """Load a payload by digest, keeping recently used ones decompressed"""
+        data = self._cache.get(digest)
+        if data is not None:
+            self._cache.move_to_end(digest)
+            return data
+        with open(self._object_path(digest), "rb") as f:
+            data = gzip.decompress(f.read())
+        self._cache[digest] = data
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return data
+
+    def begin_run(self) -> SnapshotRun:
+        return SnapshotRun(self, datetime.utcnow().strftime(RUN_ID_FORMAT))
+
+    def write_manifest(self, run_id: str, entries: List[Dict[str, Any]]):
+        path = os.path.join(self.runs_dir, f"{run_id}.jsonl")
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            for entry in entries:
+                f.write(json.dumps(entry) + "\n")
+        os.replace(tmp_path, path)
+
+    def list_runs(self, since: Optional[datetime] = None, until: Optional[datetime] = None) -> List[str]:
+        """Ids of recorded runs in chronological order"""
+        run_ids = sorted(name[:-len(".jsonl")] for name in os.listdir(self.runs_dir) if name.endswith(".jsonl"))
+        if since:
+            run_ids = [r for r in run_ids if r >= since.strftime(RUN_ID_FORMAT)]
+        if until:
+            run_ids = [r for r in run_ids if r <= until.strftime(RUN_ID_FORMAT)]
+        return run_ids
+
+    def load_run(self, run_id: str) -> ReplayRun:
+        with open(os.path.join(self.runs_dir, f"{run_id}.jsonl")) as f:
+            entries = [json.loads(line) for line in f if line.strip()]
+        return ReplayRun(self, run_id, entries)
+
+    def iter_runs(self, since: Optional[datetime] = None, until: Optional[datetime] = None) -> Iterator[ReplayRun]:
+        for run_id in self.list_runs(since, until):
+            yield self.load_run(run_id)
+
+    def prune(self, retention_days: int) -> Tuple[int, int]:
+        """Apply the retention policy
+
+        Deletes manifests of runs older than the retention period, then every
+        object no remaining manifest references.
+
+        Returns:
+            Tuple[int, int]: Number of runs and objects deleted
+        """
+        cutoff = (datetime.utcnow() - timedelta(days=retention_days)).strftime(RUN_ID_FORMAT)
+        expired = [r for r in self.list_runs() if r < cutoff]
+        for run_id in expired:
+            os.remove(os.path.join(self.runs_dir, f"{run_id}.jsonl"))
+        if not expired:
+            return 0, 0
+
+        referenced = set()
+        for run in self.iter_runs():
+            referenced.update(run.digests)
+
+        deleted_objects = 0
+        for prefix in os.listdir(self.objects_dir):
+            prefix_dir = os.path.join(self.objects_dir, prefix)
+            for name in os.listdir(prefix_dir):
+                if name not in referenced:
+                    os.remove(os.path.join(prefix_dir, name))
+                    deleted_objects += 1
+            if not os.listdir(prefix_dir):
+                shutil.rmtree(prefix_dir, ignore_errors=True)
+
+        logger.info(f"Pruned {len(expired)} snapshot runs and {deleted_objects} payloads")
+        return len(expired), deleted_objects
@@ -1,11 +1,32 @@
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Dict, Any
+import json
 from pydantic import BaseModel, Field
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, JSON, Index
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.types import TypeDecorator
 
 Base = declarative_base()
 
+class JSONEncodedList(TypeDecorator):
+    """List of strings stored as JSON in a text column"""
+    impl = Text
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return json.dumps(list(value))
+
+    def process_result_value(self, value, dialect):
+        if not value:
+            return []
+        try:
+            return json.loads(value)
+        except ValueError:
+            # Rows written before topics were JSON encoded
+            return [t.strip() for t in value.split(",") if t.strip()]
+
 class CFP(Base):
     """SQLAlchemy model for CFP data"""
     __tablename__ = "cfps"
@@ -17,14 +38,141 @@ class CFP(Base):
     conference_end_date = Column(DateTime, nullable=True)
     location = Column(String(255), nullable=True)
     is_virtual = Column(Boolean, default=False)
-    topics = Column(Text, nullable=True)
+    topics = Column(JSONEncodedList, nullable=True)
     submission_url = Column(String(512), nullable=False)
     source = Column(String(100), nullable=False)
     source_url = Column(String(512), nullable=True)
     description = Column(Text, nullable=True)
+    dedup_key = Column(String(255), nullable=True, unique=True, index=True)
+    provenance = Column(JSON, nullable=True)
+    content_hash = Column(String(32), nullable=True)
+    seen_generation = Column(Integer, nullable=True)
+    withdrawn_at = Column(DateTime, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # Partial indexes over active rows only, so withdrawn CFPs cost nothing
+    # to the read and notification queries that exclude them
+    __table_args__ = (
+        Index(
+            "ix_cfps_active_created_at", "created_at",
+            postgresql_where=withdrawn_at.is_(None), sqlite_where=withdrawn_at.is_(None)
+        ),
+        Index(
+            "ix_cfps_active_submission_deadline", "submission_deadline",
+            postgresql_where=withdrawn_at.is_(None), sqlite_where=withdrawn_at.is_(None)
+        ),
+        # seen_generation is left unindexed so the per-run stamp of unchanged
+        # rows stays a cheap heap-only update on Postgres
+        Index("ix_cfps_source", "source"),
+    )
+
+class CFPArchive(Base):
+    """SQLAlchemy model for CFPs whose conference ended long ago
+
+    Mirrors the cfps columns (keeping the original id) so rows can be moved
+    with a single INSERT ... SELECT and queried together with cfps. Rows are
+    keyed by their own archive_id, as SQLite reuses the ids of deleted cfps
+    rows, and an event is archived at most once per dedup_key.
+    """
+    __tablename__ = "cfps_archive"
+
+    archive_id = Column(Integer, primary_key=True)
+    id = Column(Integer, nullable=False, index=True)
+    conference_name = Column(String(255), nullable=False)
+    submission_deadline = Column(DateTime, nullable=True)
+    conference_start_date = Column(DateTime, nullable=True)
+    conference_end_date = Column(DateTime, nullable=True)
+    location = Column(String(255), nullable=True)
+    is_virtual = Column(Boolean, default=False)
+    topics = Column(JSONEncodedList, nullable=True)
+    submission_url = Column(String(512), nullable=False)
+    source = Column(String(100), nullable=False)
+    source_url = Column(String(512), nullable=True)
+    description = Column(Text, nullable=True)
+    dedup_key = Column(String(255), nullable=True, unique=True, index=True)
+    provenance = Column(JSON, nullable=True)
+    content_hash = Column(String(32), nullable=True)
+    seen_generation = Column(Integer, nullable=True)
+    withdrawn_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, nullable=True)
+    archived_at = Column(DateTime, default=datetime.utcnow)
+
+class IngestionRun(Base):
+    """SQLAlchemy model for one ingestion run; its id is the run generation"""
+    __tablename__ = "ingestion_runs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    started_at = Column(DateTime, default=datetime.utcnow)
+    finished_at = Column(DateTime, nullable=True)
+    inserted = Column(Integer, default=0)
+    updated = Column(Integer, default=0)
+    unchanged = Column(Integer, default=0)
+    withdrawn = Column(Integer, default=0)
+
+class DatasetVersion(Base):
+    """SQLAlchemy model for the single-row counter bumped by every CFP data change"""
+    __tablename__ = "dataset_version"
+
+    id = Column(Integer, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow)
+
+class CFPChange(Base):
+    """SQLAlchemy model for a CFP inserted or updated at a dataset version
+
+    Written in the transaction that bumps the version, so versions become
+    visible in commit order and (version, cfp_id) orders the change stream.
+    """
+    __tablename__ = "cfp_changes"
+
+    version = Column(Integer, primary_key=True)
+    cfp_id = Column(Integer, primary_key=True)
+    kind = Column(String(10), nullable=False)  # insert or update
+
+class ScheduledJob(Base):
+    """SQLAlchemy model for the schedule and last run of one scheduler job
+
+    Shared by every node running the scheduler: whichever node holds the
+    job's lock runs it and moves next_run_at on for all of them.
+    """
+    __tablename__ = "scheduled_jobs"
+
+    name = Column(String(100), primary_key=True)
+    schedule = Column(String(100), nullable=False)
+    next_run_at = Column(DateTime, nullable=False)
+    last_started_at = Column(DateTime, nullable=True)
+    last_finished_at = Column(DateTime, nullable=True)
+    last_status = Column(String(20), nullable=True)  # running, success or failed
+    last_error = Column(Text, nullable=True)
+    last_node = Column(String(255), nullable=True)
+    # Lease standing in for the advisory lock on databases other than Postgres
+    locked_by = Column(String(255), nullable=True)
+    locked_until = Column(DateTime, nullable=True)
+    # How far the job's last successful run got, for jobs that resume from it
+    watermark = Column(DateTime, nullable=True)
+
+class SourcePoll(Base):
+    """SQLAlchemy model for the adaptive polling state of one source
+
+    A source is an adapter, or one category of an adapter that fetches
+    categories separately (key "tech-conferences/python"). The digests of
+    the last fetch tell whether the next one changed anything.
+    """
+    __tablename__ = "source_polls"
+
+    key = Column(String(150), primary_key=True)
+    source = Column(String(100), nullable=False, index=True)
+    interval_seconds = Column(Integer, nullable=False)
+    next_poll_at = Column(DateTime, nullable=False)
+    last_polled_at = Column(DateTime, nullable=True)
+    last_changed_at = Column(DateTime, nullable=True)
+    polls = Column(Integer, nullable=False, default=0)
+    changed_polls = Column(Integer, nullable=False, default=0)  # Polls that produced new or changed records
+    records_digest = Column(String(32), nullable=True)
+    payload_digest = Column(String(32), nullable=True)
+
 class CFPSchema(BaseModel):
     """Schema for Call for Papers data"""
     conference_name: str
@@ -38,6 +186,56 @@ class CFPSchema(BaseModel):
     source: str
     source_url: str
     description: Optional[str] = None
+    dedup_key: Optional[str] = None
+    provenance: List[Dict[str, Any]] = []
+
+    class Config:
+        from_attributes = True  # For SQLAlchemy compatibility
+
+class CFPResponse(BaseModel):
+    """Schema for CFPs returned by the read API"""
+    id: int
+    conference_name: str
+    submission_deadline: Optional[datetime] = None
+    conference_start_date: Optional[datetime] = None
+    conference_end_date: Optional[datetime] = None
+    location: Optional[str] = None
+    is_virtual: Optional[bool] = False
+    topics: List[str] = []
+    submission_url: str
+    source: str
+    source_url: Optional[str] = None
+    description: Optional[str] = None
+    provenance: Optional[List[Dict[str, Any]]] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+class ScheduledJobResponse(BaseModel):
+    """Schema for the scheduler jobs returned by the API"""
+    name: str
+    schedule: str
+    next_run_at: datetime
+    last_started_at: Optional[datetime] = None
+    last_finished_at: Optional[datetime] = None
+    last_status: Optional[str] = None
+    last_error: Optional[str] = None
+    last_node: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
+class SourcePollResponse(BaseModel):
+    """Schema for the polling state of a source returned by the API"""
+    key: str
+    interval_seconds: int
+    next_poll_at: datetime
+    last_polled_at: Optional[datetime] = None
+    last_changed_at: Optional[datetime] = None
+    polls: int
+    changed_polls: int
 
     class Config:
-        from_attributes = True  # For SQLAlchemy compatibility 
\ No newline at end of file
+        from_attributes = True
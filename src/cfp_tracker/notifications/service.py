@@ -6,6 +6,7 @@ from sqlalchemy.orm import Session
 
 from ..models.cfp import CFP
 from ..config import Config
+from ..utils import tracing
 from .slack_adapter import SlackAdapter
 
 logger = logging.getLogger(__name__)
@@ -13,13 +14,15 @@ logger = logging.getLogger(__name__)
 class NotificationService:
     """Service for handling CFP notifications."""
     
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, read_db: Optional[Session] = None):
         """Initialize the notification service.
         
         Args:
             db: Database session
+            read_db: Read-only session for looking up CFPs, e.g. on the replica; defaults to db
         """
         self.db = db
+        self.read_db = read_db or db
         self.slack_adapter = None
         if Config.SLACK_WEBHOOK_URL:
             self.slack_adapter = SlackAdapter(Config.SLACK_WEBHOOK_URL)
@@ -33,8 +36,24 @@ class NotificationService:
         Returns:
             List[CFP]: List of new CFPs
         """
-        cutoff_time = datetime.utcnow() - timedelta(hours=hours)
-        return self.db.query(CFP).filter(CFP.created_at >= cutoff_time).all()
+        until = datetime.utcnow()
+        return self.get_cfps_added_between(until - timedelta(hours=hours), until)
+        
+    def get_cfps_added_between(self, since: datetime, until: datetime) -> List[CFP]:
+        """Get active CFPs added at or after since and before until.
+        
+        Args:
+            since: Start of the window, inclusive
+            until: End of the window, exclusive
+            
+        Returns:
+            List[CFP]: List of new CFPs
+        """
+        return self.read_db.query(CFP).filter(
+            CFP.created_at >= since,
+            CFP.created_at < until,
+            CFP.withdrawn_at.is_(None)
+        ).all()
         
     def notify_new_cfps(self, hours: int = 24) -> bool:
         """Notify about new CFPs added in the last N hours.
@@ -42,6 +61,19 @@ class NotificationService:
         Args:
             hours: Number of hours to look back
             
+        Returns:
+            bool: True if notifications were sent successfully
+        """
+        until = datetime.utcnow()
+        return self.notify_cfps_added_between(until - timedelta(hours=hours), until)
+        
+    def notify_cfps_added_between(self, since: datetime, until: datetime) -> bool:
+        """Notify about active CFPs added at or after since and before until.
+        
+        Args:
+            since: Start of the window, inclusive
+            until: End of the window, exclusive
+            
         Returns:
             bool: True if notifications were sent successfully
         """
@@ -49,10 +81,13 @@ class NotificationService:
             logger.warning("Slack webhook URL not configured, skipping notifications")
             return False
             
-        cfps = self.get_new_cfps(hours)
+        cfps = self.get_cfps_added_between(since, until)
         if not cfps:
-            logger.info(f"No new CFPs found in the last {hours} hours")
+            logger.info(f"No new CFPs added since {since}")
             return True
             
         logger.info(f"Found {len(cfps)} new CFPs to notify about")
-        return self.slack_adapter.post_cfps(cfps) 
\ No newline at end of file
+        with tracing.span("notifications.send", cfps=len(cfps), since=since.isoformat()) as span:
+            success = self.slack_adapter.post_cfps(cfps)
+            span.set_attribute("success", success)
+        return success 
\ No newline at end of file
@@ -1,9 +1,11 @@
 import logging
-import requests
+import time
 from typing import List, Optional
 from datetime import datetime
 
 from ..models.cfp import CFP
+from ..utils import metrics, tracing
+from ..utils.profiling import profile
 
 logger = logging.getLogger(__name__)
 
@@ -119,18 +121,32 @@ class SlackAdapter:
         Returns:
             bool: True if all messages were posted successfully, False otherwise
         """
+        # Imported here so loading the notification service stays cheap
+        import requests
+        
         success = True
-        for cfp in cfps:
-            try:
-                message = self.format_cfp_message(cfp)
-                response = requests.post(
-                    self.webhook_url,
-                    json=message
-                )
-                response.raise_for_status()
-                logger.info(f"Posted CFP {cfp.conference_name} to Slack")
-            except Exception as e:
-                logger.error(f"Error posting CFP {cfp.conference_name} to Slack: {str(e)}")
-                success = False
+        with profile("slack"):
+            for cfp in cfps:
+                try:
+                    message = self.format_cfp_message(cfp)
+                    start = time.perf_counter()
+                    with tracing.span("slack.post", conference=cfp.conference_name) as span:
+                        try:
+                            response = requests.post(
+                                self.webhook_url,
+                                json=message
+                            )
+                        except requests.RequestException:
+                            metrics.SLACK_POSTS.labels("error").inc()
+                            raise
+                        finally:
+                            metrics.SLACK_POST_SECONDS.observe(time.perf_counter() - start)
+                        span.set_attribute("status", response.status_code)
+                    metrics.SLACK_POSTS.labels(str(response.status_code)).inc()
+                    response.raise_for_status()
+                    logger.info(f"Posted CFP {cfp.conference_name} to Slack")
+                except Exception as e:
+                    logger.error(f"Error posting CFP {cfp.conference_name} to Slack: {str(e)}")
+                    success = False
                 
         return success 
\ No newline at end of file
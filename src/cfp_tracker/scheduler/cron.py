@@ -0,0 +1,79 @@
+from datetime import date, datetime, time, timedelta
+from typing import List
+
+ALIASES = {
+    "@hourly": "0 * * * *",
+    "@daily": "0 0 * * *",
+    "@weekly": "0 0 * * 0",
+    "@monthly": "0 0 1 * *",
+}
+
+
+def _parse_field(field: str, low: int, high: int) -> List[int]:
+    """Values of one cron field: *, n, a-b, with an optional /step, comma-separated"""
+    values = set()
+    for part in field.split(","):
+        base, _, step = part.partition("/")
+        step = int(step) if step else 1
+        if base == "*":
+            start, end = low, high
+        elif "-" in base:
+            start, end = (int(value) for value in base.split("-", 1))
+        else:
+            start = int(base)
+            # "5/15" means every 15 starting at 5
+            end = high if step > 1 else start
+        if step < 1 or not low <= start <= end <= high:
+            raise ValueError(f"Cron field '{field}' is outside {low}-{high}")
+        values.update(range(start, end + 1, step))
+    return sorted(values)
+
+
+class CronSchedule:
+    """A five-field cron expression (minute hour day-of-month month day-of-week) in UTC
+
+    Day of week runs from 0 (Sunday) to 6; 7 is Sunday too. As in cron,
+    when both day fields are restricted, a day matching either one fires.
+    """
+
+    def __init__(self, expression: str):
+        self.expression = expression
+        fields = ALIASES.get(expression, expression).split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression '{expression}' needs 5 fields")
+        minute, hour, day, month, weekday = fields
+        self.minutes = _parse_field(minute, 0, 59)
+        self.hours = _parse_field(hour, 0, 23)
+        self.days = set(_parse_field(day, 1, 31))
+        self.months = set(_parse_field(month, 1, 12))
+        self.weekdays = {value % 7 for value in _parse_field(weekday, 0, 7)}
+        self._any_day = day.startswith("*")
+        self._any_weekday = weekday.startswith("*")
+
+    def _day_matches(self, day: date) -> bool:
+        if day.month not in self.months:
+            return False
+        in_days = day.day in self.days
+        # date.weekday() counts from Monday
+        in_weekdays = (day.weekday() + 1) % 7 in self.weekdays
+        if self._any_day or self._any_weekday:
+            return in_days and in_weekdays
+        return in_days or in_weekdays
+
+    def next_after(self, after: datetime) -> datetime:
+        """First time the schedule fires strictly after a time"""
+        start = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        day = start.date()
+        # Four years and a day covers a schedule that only fires on February 29
+        for _ in range(4 * 366 + 1):
+            if self._day_matches(day):
+                for hour in self.hours:
+                    for minute in self.minutes:
+                        candidate = datetime.combine(day, time(hour, minute))
+                        if candidate >= start:
+                            return candidate
+            day += timedelta(days=1)
+        raise ValueError(f"Cron expression '{self.expression}' never fires")
+
+    def __str__(self) -> str:
+        return self.expression
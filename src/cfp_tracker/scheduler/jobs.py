@@ -0,0 +1,108 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from sqlalchemy import text
+
+from ..config import Config
+from ..ingestion.manager import CFPIngestionManager
+from ..ingestion.pipeline import fetch_and_store
+from ..notifications.service import NotificationService
+from ..storage.archival import archive_expired_cfps
+from ..storage.database import SessionLocal
+from ..storage.scheduled_jobs import read_job_watermark, record_job_watermark
+from .service import Job
+
+logger = logging.getLogger(__name__)
+
+NOTIFICATIONS_JOB = "notifications"
+
+# Kept across runs so adapters keep their circuit breaker state and last fetch times
+_ingestion_manager: Optional[CFPIngestionManager] = None
+
+
+async def run_ingestion():
+    global _ingestion_manager
+    if _ingestion_manager is None:
+        _ingestion_manager = CFPIngestionManager()
+    db = SessionLocal()
+    try:
+        await fetch_and_store(db, _ingestion_manager, due_only=True)
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def _notify():
+    """Notify about the CFPs added since the window the last successful run covered
+
+    Runs start late by their jitter, catch up on missed slots once, and may
+    be scheduled more often than daily, so a fixed look-back would skip or
+    repeat CFPs. The first run covers the last day.
+    """
+    db = SessionLocal()
+    try:
+        until = datetime.utcnow()
+        since = read_job_watermark(db, NOTIFICATIONS_JOB) or until - timedelta(hours=24)
+        # Read from the primary: a lagging replica would miss CFPs the window then moves past
+        if not NotificationService(db).notify_cfps_added_between(since, until):
+            raise RuntimeError("Sending notifications failed")
+        record_job_watermark(db, NOTIFICATIONS_JOB, until)
+    finally:
+        db.close()
+
+
+def _archive():
+    db = SessionLocal()
+    try:
+        archived = archive_expired_cfps(db)
+        logger.info(f"Archived {archived} CFPs older than {Config.ARCHIVE_AFTER_DAYS} days")
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def _maintain_database():
+    """Refresh planner statistics, and on SQLite also truncate the WAL"""
+    db = SessionLocal()
+    try:
+        if db.get_bind().dialect.name == "sqlite":
+            db.execute(text("PRAGMA optimize"))
+            db.execute(text("PRAGMA wal_checkpoint(TRUNCATE)"))
+        else:
+            db.execute(text("ANALYZE cfps"))
+            db.execute(text("ANALYZE cfp_changes"))
+        db.commit()
+    finally:
+        db.close()
+
+
+async def run_notifications():
+    await asyncio.to_thread(_notify)
+
+
+async def run_archival():
+    await asyncio.to_thread(_archive)
+
+
+async def run_maintenance():
+    await asyncio.to_thread(_maintain_database)
+
+
+def default_jobs() -> List[Job]:
+    """The jobs enabled by the SCHEDULE_* settings"""
+    schedules = [
+        ("ingestion", Config.SCHEDULE_INGESTION, run_ingestion),
+        ("archival", Config.SCHEDULE_ARCHIVAL, run_archival),
+        ("maintenance", Config.SCHEDULE_MAINTENANCE, run_maintenance),
+    ]
+    if Config.SLACK_WEBHOOK_URL:
+        schedules.append((NOTIFICATIONS_JOB, Config.SCHEDULE_NOTIFICATIONS, run_notifications))
+    else:
+        logger.warning("SLACK_WEBHOOK_URL not configured, not scheduling notifications")
+    return [Job(name, schedule, run) for name, schedule, run in schedules if schedule]
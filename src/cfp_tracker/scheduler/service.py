@@ -0,0 +1,130 @@
+import asyncio
+import logging
+import os
+import random
+import socket
+import time
+from datetime import datetime
+from typing import Awaitable, Callable, List, Optional
+
+from sqlalchemy.orm import Session
+
+from ..config import Config
+from ..models.cfp import ScheduledJob
+from ..storage.scheduled_jobs import ensure_job, record_job_result, record_job_start, try_lock_job
+from ..utils import metrics
+from .cron import CronSchedule
+
+logger = logging.getLogger(__name__)
+
+
+class Job:
+    """A named coroutine run on a cron schedule"""
+
+    def __init__(
+        self,
+        name: str,
+        schedule: str,
+        run: Callable[[], Awaitable[None]],
+        jitter_seconds: Optional[int] = None
+    ):
+        self.name = name
+        self.schedule = CronSchedule(schedule)
+        self.run = run
+        self.jitter_seconds = Config.SCHEDULER_JITTER_SECONDS if jitter_seconds is None else jitter_seconds
+
+
+class Scheduler:
+    """Runs jobs on their schedules, each on exactly one node at a time
+
+    Job state lives in the scheduled_jobs table shared by every node. A due
+    job is started after a random jitter by whichever node takes its lock
+    (a Postgres advisory lock); the others see next_run_at move on and wait
+    for the next run. Runs missed while no node was up are caught up with a
+    single run, never one per missed slot, and at most
+    SCHEDULER_MAX_CONCURRENT_JOBS jobs run at once on a node, so a node
+    starting with several overdue jobs works through them one by one.
+    """
+
+    def __init__(self, jobs: List[Job], session_factory: Callable[[], Session]):
+        self.jobs = jobs
+        self._session_factory = session_factory
+        self.node = f"{socket.gethostname()}:{os.getpid()}"
+        self._slots = asyncio.Semaphore(Config.SCHEDULER_MAX_CONCURRENT_JOBS)
+
+    def _call(self, function, *args):
+        db = self._session_factory()
+        try:
+            return function(db, *args)
+        finally:
+            db.close()
+
+    def _state(self, job: Job) -> ScheduledJob:
+        return self._call(ensure_job, job.name, job.schedule.expression, job.schedule.next_after(datetime.utcnow()))
+
+    async def run_forever(self):
+        logger.info(f"Scheduler {self.node} running jobs: {', '.join(job.name for job in self.jobs)}")
+        await asyncio.gather(*(self._job_loop(job) for job in self.jobs))
+
+    async def _job_loop(self, job: Job):
+        while True:
+            try:
+                state = await asyncio.to_thread(self._state, job)
+                wait = (state.next_run_at - datetime.utcnow()).total_seconds()
+                if wait > 0:
+                    # Wake up now and then to notice runs rescheduled by other nodes
+                    await asyncio.sleep(min(wait, Config.SCHEDULER_POLL_SECONDS))
+                    continue
+                # Spread nodes, and jobs due at the same time, over the jitter window
+                await asyncio.sleep(random.uniform(0, job.jitter_seconds))
+                if not await self.run_if_due(job):
+                    await asyncio.sleep(Config.SCHEDULER_POLL_SECONDS)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Scheduler error for job {job.name}: {e}")
+                await asyncio.sleep(Config.SCHEDULER_POLL_SECONDS)
+
+    async def run_if_due(self, job: Job, force: bool = False) -> bool:
+        """Run a job if it is due and no other node runs it; returns whether it ran"""
+        async with self._slots:
+            # The lease lives on the job's row, so make sure it exists
+            await asyncio.to_thread(self._state, job)
+            lock = await asyncio.to_thread(
+                try_lock_job, self._session_factory, job.name, self.node, Config.SCHEDULER_LOCK_TTL_SECONDS
+            )
+            if lock is None:
+                logger.debug(f"Job {job.name} is locked by another node")
+                return False
+            try:
+                # Another node may have run it between our check and the lock
+                state = await asyncio.to_thread(self._state, job)
+                if not force and state.next_run_at > datetime.utcnow():
+                    return False
+                await self._run(job)
+                return True
+            finally:
+                await asyncio.to_thread(lock.release)
+
+    async def _run(self, job: Job):
+        started_at = datetime.utcnow()
+        await asyncio.to_thread(self._call, record_job_start, job.name, self.node, started_at)
+        logger.info(f"Running job {job.name} (scheduled '{job.schedule}')")
+        start = time.perf_counter()
+        status, error = "success", None
+        try:
+            await job.run()
+        except Exception as e:
+            status, error = "failed", str(e)
+            logger.error(f"Job {job.name} failed: {e}")
+        seconds = time.perf_counter() - start
+        metrics.SCHEDULER_JOB_SECONDS.labels(job.name).observe(seconds)
+        metrics.SCHEDULER_RUNS.labels(job.name, status).inc()
+
+        finished_at = datetime.utcnow()
+        # Counted from the end of the run, so slots missed meanwhile are skipped
+        next_run_at = job.schedule.next_after(finished_at)
+        await asyncio.to_thread(
+            self._call, record_job_result, job.name, finished_at, status, error, next_run_at
+        )
+        logger.info(f"Job {job.name} finished with {status} in {seconds:.1f}s; next run at {next_run_at}")
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+import argparse
+import logging
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from src.cfp_tracker.storage.database import ReadSessionLocal
+from src.cfp_tracker.storage.export import EXPORT_FORMATS, iter_cfp_batches, iter_csv, iter_ndjson, write_parquet
+from src.cfp_tracker.config import Config
+
+# Configure logging; stdout may carry the export itself
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    stream=sys.stderr
+)
+
+logger = logging.getLogger(__name__)
+
+def main():
+    """Export the active CFPs as NDJSON, CSV or Parquet, streaming from the database."""
+    parser = argparse.ArgumentParser(description="Export CFPs in bulk")
+    parser.add_argument("--format", choices=EXPORT_FORMATS, default="ndjson")
+    parser.add_argument("--output", help="Output file; NDJSON and CSV go to stdout by default")
+    parser.add_argument("--include-archived", action="store_true", help="Also export archived CFPs")
+    parser.add_argument("--include-withdrawn", action="store_true", help="Also export CFPs their source stopped listing")
+    parser.add_argument("--batch-size", type=int, default=Config.EXPORT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    if args.format == "parquet" and not args.output:
+        parser.error("--output is required for Parquet")
+
+    db = ReadSessionLocal()
+    try:
+        batches = iter_cfp_batches(
+            db,
+            include_archived=args.include_archived,
+            include_withdrawn=args.include_withdrawn,
+            batch_size=args.batch_size
+        )
+        if args.format == "parquet":
+            write_parquet(batches, args.output)
+            return
+
+        encode = iter_ndjson if args.format == "ndjson" else iter_csv
+        output = open(args.output, "wb") if args.output else sys.stdout.buffer
+        try:
+            for chunk in encode(batches):
+                output.write(chunk)
+        finally:
+            if args.output:
+                output.close()
+        logger.info(f"Exported CFPs as {args.format}")
+    except Exception as e:
+        logger.error(f"Error exporting CFPs: {str(e)}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+import argparse
+import asyncio
+import logging
+import sys
+import os
+import time
+from datetime import datetime
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from src.cfp_tracker.storage.database import SessionLocal
+from src.cfp_tracker.ingestion.manager import CFPIngestionManager
+from src.cfp_tracker.ingestion.pipeline import replay_snapshots
+from src.cfp_tracker.ingestion.snapshots import SnapshotStore
+from src.cfp_tracker.config import Config
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+
+logger = logging.getLogger(__name__)
+
+async def main():
+    """Re-ingest recorded source payloads without touching the network."""
+    parser = argparse.ArgumentParser(description="Replay recorded CFP source snapshots")
+    parser.add_argument("--snapshot-dir", default=Config.SNAPSHOT_DIR, help="Snapshot store directory")
+    parser.add_argument("--since", type=datetime.fromisoformat, help="Only runs recorded at or after this time")
+    parser.add_argument("--until", type=datetime.fromisoformat, help="Only runs recorded at or before this time")
+    parser.add_argument("--all-runs", action="store_true", help="Also replay runs identical to the previous one")
+    args = parser.parse_args()
+    
+    if not args.snapshot_dir:
+        logger.error("No snapshot directory given. Pass --snapshot-dir or set SNAPSHOT_DIR.")
+        return False
+    
+    store = SnapshotStore(args.snapshot_dir)
+    manager = CFPIngestionManager(snapshot_store=store)
+    db = SessionLocal()
+    try:
+        start = time.perf_counter()
+        totals = await replay_snapshots(
+            db, manager, store, since=args.since, until=args.until, skip_identical=not args.all_runs
+        )
+        logger.info(f"Replay finished in {time.perf_counter() - start:.1f}s: {totals}")
+        return True
+    except Exception as e:
+        logger.error(f"Error replaying snapshots: {str(e)}")
+        db.rollback()
+        return False
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+import logging
+import sys
+import os
+import time
+from datetime import datetime
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from src.cfp_tracker.storage.database import SessionLocal
+from src.cfp_tracker.storage.archival import archive_expired_cfps
+from src.cfp_tracker.config import Config
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+
+logger = logging.getLogger(__name__)
+
+def run_archival():
+    """Move CFPs of conferences that ended long ago into the archive table."""
+    db = SessionLocal()
+    try:
+        archived = archive_expired_cfps(db)
+        logger.info(f"Archived {archived} CFPs older than {Config.ARCHIVE_AFTER_DAYS} days")
+        return True
+    except Exception as e:
+        logger.error(f"Error archiving CFPs: {str(e)}")
+        db.rollback()
+        return False
+    finally:
+        db.close()
+
+def main():
+    """Main function to run the archival job."""
+    logger.info(f"Archival job started at {datetime.now()}")
+    
+    # Run once immediately
+    run_archival()
+    if "--once" in sys.argv:
+        return
+    
+    while True:
+        logger.info(f"Sleeping for {Config.ARCHIVE_INTERVAL_HOURS} hours before next archival run")
+        time.sleep(Config.ARCHIVE_INTERVAL_HOURS * 60 * 60)
+        run_archival()
+
+if __name__ == "__main__":
+    main()
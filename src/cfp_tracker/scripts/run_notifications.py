@@ -8,7 +8,7 @@ from datetime import datetime
 # Add the project root to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
-from src.cfp_tracker.storage.database import SessionLocal
+from src.cfp_tracker.storage.database import ReadSessionLocal, SessionLocal
 from src.cfp_tracker.notifications.service import NotificationService
 from src.cfp_tracker.config import Config
 
@@ -34,7 +34,8 @@ def run_notifications():
     
     try:
         db = SessionLocal()
-        service = NotificationService(db)
+        read_db = ReadSessionLocal()
+        service = NotificationService(db, read_db)
         
         # Check for CFPs added in the last 24 hours
         success = service.notify_new_cfps(hours=24)
@@ -49,6 +50,7 @@ def run_notifications():
         logger.error(f"Error running notifications: {str(e)}")
         return False
     finally:
+        read_db.close()
         db.close()
 
 def main():
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+import argparse
+import asyncio
+import logging
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from src.cfp_tracker.scheduler.jobs import default_jobs
+from src.cfp_tracker.scheduler.service import Scheduler
+from src.cfp_tracker.storage.database import SessionLocal
+from src.cfp_tracker.storage.scheduled_jobs import list_jobs
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+
+logger = logging.getLogger(__name__)
+
+def print_jobs():
+    """Print the schedule and last run of every job, as recorded by any node."""
+    db = SessionLocal()
+    try:
+        for job in list_jobs(db):
+            print(f"{job.name:<14} '{job.schedule}'  next {job.next_run_at:%Y-%m-%d %H:%M}  "
+                  f"last {job.last_status or 'never'} {job.last_finished_at or ''} {job.last_node or ''}")
+    finally:
+        db.close()
+
+def main():
+    """Run ingestion, notifications, archival and maintenance on their schedules."""
+    parser = argparse.ArgumentParser(description="Run the CFP tracker's scheduled jobs")
+    parser.add_argument("--list", action="store_true", help="Show job schedules and last runs, then exit")
+    parser.add_argument("--run", metavar="JOB", help="Run one job now, unless another node is running it, then exit")
+    args = parser.parse_args()
+    
+    if args.list:
+        print_jobs()
+        return
+    
+    jobs = default_jobs()
+    scheduler = Scheduler(jobs, SessionLocal)
+    if args.run:
+        job = next((job for job in jobs if job.name == args.run), None)
+        if job is None:
+            parser.error(f"Unknown job {args.run}; scheduled jobs are {', '.join(job.name for job in jobs)}")
+        if not asyncio.run(scheduler.run_if_due(job, force=True)):
+            logger.error(f"Job {job.name} is running on another node")
+            sys.exit(1)
+        return
+    
+    asyncio.run(scheduler.run_forever())
+
+if __name__ == "__main__":
+    main()
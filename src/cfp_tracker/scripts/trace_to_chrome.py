@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+import argparse
+import json
+import logging
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from src.cfp_tracker.config import Config
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+
+logger = logging.getLogger(__name__)
+
+def convert(spans, trace_id=None):
+    """Turn exported spans into Chrome trace events.
+    
+    Each trace becomes a process and each adapter a thread, so concurrent
+    adapter fetches get their own rows in the flame chart.
+    """
+    events = []
+    threads = {}
+    for span in spans:
+        if trace_id and span["trace_id"] != trace_id:
+            continue
+        adapter = span["attributes"].get("adapter", "pipeline")
+        tid = threads.setdefault((span["trace_id"], adapter), len(threads) + 1)
+        events.append({
+            "name": span["name"],
+            "ph": "X",
+            "ts": span["start_us"],
+            "dur": span["duration_us"],
+            "pid": span["trace_id"][:8],
+            "tid": tid,
+            "args": {**span["attributes"], "error": span["error"]},
+        })
+    for (trace, adapter), tid in threads.items():
+        events.append({"name": "thread_name", "ph": "M", "pid": trace[:8], "tid": tid, "args": {"name": adapter}})
+    return events
+
+def main():
+    """Convert a JSONL span file into a trace for chrome://tracing, Perfetto or speedscope."""
+    parser = argparse.ArgumentParser(description="Convert exported tracing spans to Chrome trace format")
+    parser.add_argument("--input", default=Config.TRACE_FILE, help="JSONL span file")
+    parser.add_argument("--output", default="trace.json", help="Chrome trace JSON file to write")
+    parser.add_argument("--trace-id", help="Only convert this trace (default: all traces)")
+    args = parser.parse_args()
+    
+    with open(args.input) as f:
+        spans = [json.loads(line) for line in f if line.strip()]
+    events = convert(spans, args.trace_id)
+    with open(args.output, "w") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+    logger.info(f"Wrote {len(events)} trace events to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+import importlib.util
+import logging
+import os
+import shutil
+import tempfile
+from typing import Optional
+
+import uvicorn
+
+from .config import Config
+
+logger = logging.getLogger(__name__)
+
+
+def _available(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+def _prepare_metrics_dir(workers: int):
+    """Give multi-worker runs a fresh shared directory for /metrics, unless one is configured"""
+    if workers < 2:
+        return
+    directory = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+    if directory:
+        # Values left by a previous run would be aggregated with the new ones
+        shutil.rmtree(directory, ignore_errors=True)
+        os.makedirs(directory)
+    else:
+        os.environ["PROMETHEUS_MULTIPROC_DIR"] = tempfile.mkdtemp(prefix="cfp-tracker-metrics-")
+
+
+def serve(app: str, production: bool, port: Optional[int] = None, workers: Optional[int] = None):
+    """Run the API with uvicorn.
+
+    Development mode is a single process that reloads on code changes.
+    Production mode runs Config.API_WORKERS worker processes, picks uvloop
+    and httptools when they are installed, and applies the keep-alive and
+    graceful shutdown timeouts. Worker count is passed to the workers
+    through the environment so each sizes its database pool to its share
+    of DB_CONNECTION_BUDGET.
+
+    Args:
+        app: Import string of the ASGI app
+        production: Run the production mode
+        port: Port to listen on; defaults to Config.API_PORT
+        workers: Worker processes in production mode; defaults to Config.API_WORKERS
+    """
+    host = Config.API_HOST
+    port = port or Config.API_PORT
+    if not production:
+        uvicorn.run(app, host=host, port=port, reload=Config.API_RELOAD, reload_dirs=["src"])
+        return
+
+    workers = workers or Config.API_WORKERS
+    # Read back by storage.database in every worker when sizing its pool
+    os.environ["API_WORKERS"] = str(workers)
+    _prepare_metrics_dir(workers)
+    loop = "uvloop" if _available("uvloop") else "asyncio"
+    http = "httptools" if _available("httptools") else "h11"
+    logger.info(f"Starting {workers} workers on {host}:{port} with the {loop} loop and {http} parser")
+
+    uvicorn.run(
+        app,
+        host=host,
+        port=port,
+        workers=workers,
+        loop=loop,
+        http=http,
+        timeout_keep_alive=Config.API_KEEPALIVE_TIMEOUT_SECONDS,
+        timeout_graceful_shutdown=Config.API_GRACEFUL_SHUTDOWN_SECONDS,
+        backlog=Config.API_BACKLOG,
+        proxy_headers=True,
+        forwarded_allow_ips=Config.API_FORWARDED_ALLOW_IPS,
+        access_log=Config.API_ACCESS_LOG,
+    )
@@ -0,0 +1,78 @@
+import logging
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, func, literal, select
+from sqlalchemy.orm import Session
+
+from ..config import Config
+from ..models.cfp import CFP, CFPArchive
+from .cfp_store import dialect_insert
+from .dataset_version import bump_dataset_version, dataset_version
+
+logger = logging.getLogger(__name__)
+
+# Columns shared by cfps and cfps_archive, in cfps_archive order
+ARCHIVED_COLUMNS = [
+    column.name for column in CFPArchive.__table__.columns if column.name not in ("archive_id", "archived_at")
+]
+
+
+def expired_condition(cutoff: datetime):
+    """SQL condition for CFPs whose event ended before the cutoff
+
+    Falls back to the start date, then the CFP deadline, when a source does
+    not report the end of the conference.
+    """
+    return func.coalesce(
+        CFP.conference_end_date, CFP.conference_start_date, CFP.submission_deadline
+    ) < cutoff
+
+
+def archive_expired_cfps(
+    db: Session,
+    older_than_days: int = Config.ARCHIVE_AFTER_DAYS,
+    batch_size: int = Config.ARCHIVE_BATCH_SIZE
+) -> int:
+    """Move CFPs whose conference ended long ago into cfps_archive.
+
+    Rows move in id order, one batch per transaction, with an
+    INSERT ... SELECT followed by a DELETE, so the hot table is never
+    locked for long and an interrupted job can simply be re-run. An event
+    already archived under the same dedup_key is not archived again.
+
+    Args:
+        db: Database session
+        older_than_days: Archive conferences that ended more than this many days ago
+        batch_size: Number of rows moved per transaction
+
+    Returns:
+        int: Number of rows archived
+    """
+    cutoff = datetime.utcnow() - timedelta(days=older_than_days)
+    archived_at = datetime.utcnow()
+    total = 0
+
+    while True:
+        ids = db.execute(
+            select(CFP.id).where(expired_condition(cutoff)).order_by(CFP.id).limit(batch_size)
+        ).scalars().all()
+        if not ids:
+            break
+
+        source_columns = [CFP.__table__.c[name] for name in ARCHIVED_COLUMNS]
+        db.execute(dialect_insert(db)(CFPArchive).from_select(
+            ARCHIVED_COLUMNS + ["archived_at"],
+            select(*source_columns, literal(archived_at).label("archived_at")).where(CFP.id.in_(ids))
+        ).on_conflict_do_nothing(index_elements=[CFPArchive.dedup_key]))
+        db.execute(delete(CFP).where(CFP.id.in_(ids)).execution_options(synchronize_session=False))
+        version = bump_dataset_version(db)
+        db.commit()
+        dataset_version.set(version)
+
+        total += len(ids)
+        logger.info(f"Archived {len(ids)} expired CFPs ({total} so far)")
+
+        if len(ids) < batch_size:
+            break
+
+    return total
@@ -0,0 +1,262 @@
+import csv
+import io
+import json
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import Column, Integer, MetaData, Table, case, func, insert, literal, or_, select
+from sqlalchemy.orm import Session
+
+from ..config import Config
+from ..ingestion.resolution import dedup_key
+from ..models.cfp import CFP, CFPSchema
+from ..utils import tracing
+from .cfp_store import compute_content_hash, dialect_insert
+from .changes import record_changes_from_select
+from .dataset_version import bump_dataset_version, dataset_version
+
+logger = logging.getLogger(__name__)
+
+IMPORT_FORMATS = ("ndjson", "csv")
+
+# cfps columns filled from an imported row
+STAGED_COLUMNS = [
+    "conference_name", "submission_deadline", "conference_start_date", "conference_end_date",
+    "location", "is_virtual", "topics", "submission_url", "source", "source_url", "description",
+    "dedup_key", "provenance", "content_hash",
+]
+
+# Per-transaction staging table; line is the input line of each row
+_staging_metadata = MetaData()
+staging = Table(
+    "cfps_bulk_staging", _staging_metadata,
+    Column("line", Integer, nullable=False),
+    *[Column(name, CFP.__table__.c[name].type) for name in STAGED_COLUMNS],
+    prefixes=["TEMPORARY"]
+)
+
+Record = Tuple[int, Optional[Dict[str, Any]], Optional[str]]
+
+
+def iter_lines(chunks: Iterable[bytes]) -> Iterator[str]:
+    """Split a stream of byte chunks into decoded lines, keeping line endings"""
+    pending = b""
+    for chunk in chunks:
+        pending += chunk
+        lines = pending.split(b"\n")
+        pending = lines.pop()
+        for line in lines:
+            yield line.decode("utf-8") + "\n"
+    if pending:
+        yield pending.decode("utf-8")
+
+
+def iter_ndjson_records(lines: Iterable[str]) -> Iterator[Record]:
+    """Parse NDJSON lines into (line number, row, error) records; blank lines are skipped"""
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as e:
+            yield number, None, f"Invalid JSON: {e}"
+            continue
+        if not isinstance(row, dict):
+            yield number, None, "Expected a JSON object"
+            continue
+        yield number, row, None
+
+
+def _parse_csv_row(header: List[str], values: List[str]) -> Dict[str, Any]:
+    row = {}
+    for name, value in zip(header, values):
+        field = CFPSchema.model_fields.get(name)
+        if value == "":
+            # Empty cells of fields with a default leave the default in place
+            if field is not None and field.is_required():
+                row[name] = None
+        elif name == "topics" and not value.startswith("["):
+            row[name] = [topic.strip() for topic in value.split(",") if topic.strip()]
+        elif name in ("topics", "provenance"):
+            row[name] = json.loads(value)
+        else:
+            row[name] = value
+    return row
+
+
+def iter_csv_records(lines: Iterable[str]) -> Iterator[Record]:
+    """Parse CSV with a header row into (line number, row, error) records
+
+    Accepts the layout written by the CSV export: empty cells are missing
+    values, and topics and provenance are JSON (topics may also be a
+    comma-separated list).
+    """
+    reader = csv.reader(lines)
+    header = next(reader, None)
+    if header is None:
+        return
+    for values in reader:
+        if not values:
+            continue
+        if len(values) != len(header):
+            yield reader.line_num, None, f"Expected {len(header)} columns, got {len(values)}"
+            continue
+        try:
+            row = _parse_csv_row(header, values)
+        except ValueError as e:
+            yield reader.line_num, None, f"Invalid JSON in a list column: {e}"
+            continue
+        yield reader.line_num, row, None
+
+
+def _staged_row(line: int, row: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate one row against CFPSchema and build its staging row"""
+    cfp = CFPSchema.model_validate(row)
+    if not cfp.dedup_key:
+        cfp.dedup_key = dedup_key(cfp)
+    cfp_data = cfp.model_dump()
+    cfp_data["content_hash"] = compute_content_hash(cfp_data)
+    return {"line": line, **cfp_data}
+
+
+def _csv_cell(value: Any) -> Any:
+    if value is None:
+        return "\\N"
+    if isinstance(value, (list, dict)):
+        return json.dumps(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _load_staging(db: Session, rows: List[Dict[str, Any]]):
+    """Append validated rows to the staging table, with COPY on Postgres"""
+    if db.get_bind().dialect.name != "postgresql":
+        db.execute(insert(staging), rows)
+        return
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    columns = ["line"] + STAGED_COLUMNS
+    for row in rows:
+        writer.writerow([_csv_cell(row[name]) for name in columns])
+    buffer.seek(0)
+    with db.connection().connection.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {staging.name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv, NULL '\\N')", buffer
+        )
+
+
+def _merge_staging(db: Session, now: datetime) -> Dict[str, int]:
+    """Upsert the staged rows into cfps with one statement
+
+    When a dedup_key appears more than once in the upload, the last row
+    wins. Existing rows are only rewritten when their content changed or
+    they had been withdrawn. Every row written gets updated_at = now.
+    """
+    latest = select(*[staging.c[name] for name in STAGED_COLUMNS]).where(
+        staging.c.line.in_(select(func.max(staging.c.line)).group_by(staging.c.dedup_key))
+    )
+    distinct = db.execute(select(func.count()).select_from(latest.subquery())).scalar()
+    existing = db.execute(
+        select(func.count()).select_from(CFP).where(CFP.dedup_key.in_(select(staging.c.dedup_key)))
+    ).scalar()
+
+    statement = dialect_insert(db)(CFP).from_select(
+        STAGED_COLUMNS + ["created_at", "updated_at"],
+        latest.add_columns(literal(now).label("created_at"), literal(now).label("updated_at"))
+    )
+    statement = statement.on_conflict_do_update(
+        index_elements=[CFP.dedup_key],
+        set_={
+            **{name: statement.excluded[name] for name in STAGED_COLUMNS if name != "dedup_key"},
+            "withdrawn_at": None,
+            "updated_at": now,
+        },
+        where=or_(
+            CFP.content_hash.is_distinct_from(statement.excluded.content_hash),
+            CFP.withdrawn_at.isnot(None)
+        )
+    )
+    written = db.execute(statement).rowcount
+    inserted = distinct - existing
+    return {"inserted": inserted, "updated": written - inserted, "unchanged": distinct - written}
+
+
+def import_cfps(
+    db: Session,
+    records: Iterable[Record],
+    chunk_size: int = Config.BULK_IMPORT_CHUNK_SIZE,
+    max_errors: int = Config.BULK_IMPORT_MAX_ERRORS
+) -> Dict[str, Any]:
+    """Validate and load a stream of CFP rows, then merge them into cfps.
+
+    Rows are validated against CFPSchema a chunk at a time and appended to
+    a temporary staging table (with COPY on Postgres), so memory is bounded
+    by the chunk size rather than the upload. Once the input is exhausted,
+    a single INSERT ... ON CONFLICT merges the staged rows by dedup_key.
+    The import is one transaction; invalid rows are reported and skipped.
+
+    Rows are not stamped with an ingestion generation, so they should use
+    their own source names: sweep_unseen_cfps withdraws rows of an adapter's
+    source that its last run did not see.
+
+    Args:
+        db: Database session; committed on success
+        records: (line number, row, parse error) records from iter_ndjson_records or iter_csv_records
+        chunk_size: Rows validated and staged at a time
+        max_errors: Maximum number of row errors returned; all are counted
+
+    Returns:
+        Dict[str, Any]: Counts of received, inserted, updated, unchanged and
+        rejected rows, plus the first row errors
+    """
+    result = {"received": 0, "inserted": 0, "updated": 0, "unchanged": 0, "rejected": 0, "errors": []}
+
+    def reject(line: int, error: str):
+        result["rejected"] += 1
+        if len(result["errors"]) < max_errors:
+            result["errors"].append({"line": line, "error": error})
+
+    with tracing.span("storage.bulk_import") as span:
+        connection = db.connection()
+        staging.drop(connection, checkfirst=True)
+        staging.create(connection)
+
+        chunk = []
+        for line, row, error in records:
+            result["received"] += 1
+            if error is None:
+                try:
+                    chunk.append(_staged_row(line, row))
+                except ValidationError as e:
+                    error = "; ".join(
+                        f"{'.'.join(str(part) for part in detail['loc'])}: {detail['msg']}" for detail in e.errors()
+                    )
+            if error is not None:
+                reject(line, error)
+            if len(chunk) >= chunk_size:
+                _load_staging(db, chunk)
+                chunk = []
+        if chunk:
+            _load_staging(db, chunk)
+
+        now = datetime.utcnow()
+        result.update(_merge_staging(db, now))
+        version = bump_dataset_version(db)
+        # Rows the merge wrote are exactly those stamped with its timestamp
+        record_changes_from_select(db, version, select(
+            CFP.id, case((CFP.created_at == now, "insert"), else_="update")
+        ).where(CFP.dedup_key.in_(select(staging.c.dedup_key)), CFP.updated_at == now))
+        staging.drop(connection)
+        db.commit()
+        span.set_attributes(**{key: value for key, value in result.items() if key != "errors"})
+
+    dataset_version.set(version)
+    logger.info(
+        f"Bulk imported {result['received']} CFP rows: {result['inserted']} inserted, "
+        f"{result['updated']} updated, {result['unchanged']} unchanged, {result['rejected']} rejected"
+    )
+    return result
@@ -0,0 +1,295 @@
+import hashlib
+import json
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from ..config import Config
+from ..ingestion.resolution import DATE_TOLERANCE_DAYS, dedup_key_name, year_dedup_key
+from ..models.cfp import CFP, CFPArchive, CFPSchema
+from ..utils import metrics
+from ..utils.profiling import profile
+
+logger = logging.getLogger(__name__)
+
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Unsupported type in CFP data: {type(value).__name__}")
+
+
+def compute_content_hash(cfp_data: Dict[str, Any]) -> str:
+    """Stable fingerprint of a CFP's content
+
+    Keys are sorted and dates serialized as ISO strings, so the same record
+    always hashes the same way regardless of field order or source.
+    """
+    payload = json.dumps(cfp_data, sort_keys=True, default=_json_default, separators=(",", ":"))
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def dialect_insert(db: Session):
+    """The insert() of the session's dialect, which supports ON CONFLICT"""
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        return postgresql.insert
+    if dialect == "sqlite":
+        return sqlite.insert
+    raise RuntimeError(f"Upserts are not supported on {dialect} databases")
+
+
+def _upsert(db: Session, rows: List[Dict[str, Any]], generation: Optional[int]) -> Dict[str, int]:
+    """Insert or overwrite rows by dedup_key with batched INSERT ... ON CONFLICT statements
+
+    Rows are grouped by the fields they set, so fields a source left unset
+    keep their stored values on update (and their defaults on insert).
+
+    Returns:
+        Dict[str, int]: Id of each row written, by dedup_key
+    """
+    now = datetime.utcnow()
+    groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+    for row in rows:
+        groups.setdefault(tuple(sorted(row)), []).append(
+            {**row, "seen_generation": generation, "withdrawn_at": None, "created_at": now, "updated_at": now}
+        )
+
+    insert = dialect_insert(db)
+    ids = {}
+    for fields, group in groups.items():
+        statement = insert(CFP)
+        statement = statement.on_conflict_do_update(
+            index_elements=[CFP.dedup_key],
+            set_={
+                **{name: statement.excluded[name] for name in fields if name != "dedup_key"},
+                "seen_generation": statement.excluded.seen_generation,
+                "withdrawn_at": None,
+                "updated_at": now,
+            }
+        ).returning(CFP.id, CFP.dedup_key)
+        for cfp_id, key in db.execute(statement, group):
+            ids[key] = cfp_id
+    return ids
+
+
+def _dates_agree(cfp_data: Dict[str, Any], row: CFP) -> bool:
+    """Whether a stored row's start date or deadline is within the resolution tolerance of a record's"""
+    for field in ("conference_start_date", "submission_deadline"):
+        new, stored = cfp_data.get(field), getattr(row, field)
+        if new and stored and abs(new - stored) <= timedelta(days=DATE_TOLERANCE_DAYS):
+            return True
+    return False
+
+
+def _load_existing(db: Session, batch: List[Dict[str, Any]]) -> Dict[str, CFP]:
+    """Load the stored rows matching a batch, with one query plus one for new keys
+
+    Rows are matched on dedup_key, then on the name|year key of rows stored
+    before keys carried the event date, then on the exact conference name
+    for rows stored before dedup keys existed. Records still unmatched then
+    take a row of the same normalized name whose start date or deadline
+    agrees with theirs, as the date in a key changes when a source adds
+    the start date or the organisers move the event. A row is matched at
+    most once.
+    """
+    keys = [cfp_data["dedup_key"] for cfp_data in batch]
+    year_keys = [year_dedup_key(key) for key in keys]
+    names = [cfp_data["conference_name"] for cfp_data in batch]
+    # Earlier batches may have upserted rows this session already holds
+    rows = db.query(CFP).filter(or_(
+        CFP.dedup_key.in_(keys + year_keys),
+        and_(CFP.dedup_key.is_(None), CFP.conference_name.in_(names))
+    )).populate_existing().all()
+
+    existing = {}
+    legacy = {}
+    for row in rows:
+        if row.dedup_key:
+            existing[row.dedup_key] = row
+        else:
+            legacy[(row.conference_name, row.submission_deadline)] = row
+
+    matched = {}
+    for cfp_data in batch:
+        key = cfp_data["dedup_key"]
+        row = existing.get(key)
+        if row is None and year_dedup_key(key) != key:
+            row = existing.pop(year_dedup_key(key), None)
+        if row is None:
+            row = legacy.pop((cfp_data["conference_name"], cfp_data.get("submission_deadline")), None)
+        if row is not None:
+            matched[key] = row
+
+    unmatched = [
+        cfp_data for cfp_data in batch
+        if cfp_data["dedup_key"] not in matched and dedup_key_name(cfp_data["dedup_key"])
+    ]
+    if unmatched:
+        names = {dedup_key_name(cfp_data["dedup_key"]) for cfp_data in unmatched}
+        taken = {row.id for row in matched.values()}
+        candidates: Dict[str, List[CFP]] = {}
+        # Rows keyed like another record of the batch are that record's match
+        for row in db.query(CFP).filter(
+            or_(*[CFP.dedup_key.like(f"{name}|%") for name in names]),
+            CFP.dedup_key.notin_(keys)
+        ).order_by(CFP.id).populate_existing():
+            candidates.setdefault(dedup_key_name(row.dedup_key), []).append(row)
+        for cfp_data in unmatched:
+            for row in candidates.get(dedup_key_name(cfp_data["dedup_key"]), []):
+                if row.id not in taken and _dates_agree(cfp_data, row):
+                    matched[cfp_data["dedup_key"]] = row
+                    taken.add(row.id)
+                    break
+    return matched
+
+
+def _archived_keys(db: Session, batch: List[Dict[str, Any]]) -> Set[str]:
+    """The dedup_keys of a batch that were already moved to cfps_archive"""
+    keys = [cfp_data["dedup_key"] for cfp_data in batch]
+    return set(db.scalars(select(CFPArchive.dedup_key).where(CFPArchive.dedup_key.in_(keys))))
+
+
+def _ended_before(cfp_data: Dict[str, Any], cutoff: datetime) -> bool:
+    """Whether a record's event ended before the cutoff, as archival.expired_condition decides it"""
+    ended = (
+        cfp_data.get("conference_end_date") or cfp_data.get("conference_start_date")
+        or cfp_data.get("submission_deadline")
+    )
+    return ended is not None and ended < cutoff
+
+
+def store_cfps(
+    db: Session,
+    cfps: List[CFPSchema],
+    generation: Optional[int] = None,
+    batch_size: int = Config.INGESTION_BATCH_SIZE,
+    changes: Optional[List[Tuple[int, str]]] = None
+) -> Dict[str, int]:
+    """Insert new CFPs and update changed ones, skipping unchanged rows.
+
+    Each batch is looked up with one query and written with batched
+    INSERT ... ON CONFLICT (dedup_key) statements on Postgres and SQLite.
+    Every row seen is stamped with the run generation (and un-withdrawn if
+    it reappeared) so sweep_unseen_cfps can find the rows a source dropped.
+    Records of events already archived, or old enough to be, are not
+    inserted: sources keep listing past events, and inserting them again
+    would bring archived events back as new CFPs.
+
+    Args:
+        db: Database session; the caller is responsible for committing
+        cfps: Resolved CFPs, each carrying a dedup_key
+        generation: Id of the current ingestion run, if any
+        batch_size: Number of CFPs looked up with a single query
+        changes: If given, (id, "insert" or "update") of every row written is appended to it
+
+    Returns:
+        Dict[str, int]: Counts of inserted, updated and unchanged rows
+    """
+    stats = {"inserted": 0, "updated": 0, "unchanged": 0}
+    archive_cutoff = datetime.utcnow() - timedelta(days=Config.ARCHIVE_AFTER_DAYS)
+    skipped = 0
+
+    with profile("storage"):
+        for start in range(0, len(cfps), batch_size):
+            batch_start = time.perf_counter()
+            batch_stats = dict.fromkeys(stats, 0)
+            batch = []
+            for cfp_schema in cfps[start:start + batch_size]:
+                cfp_data = cfp_schema.model_dump(exclude_unset=True)
+                cfp_data["content_hash"] = compute_content_hash(cfp_data)
+                batch.append(cfp_data)
+
+            existing = _load_existing(db, batch)
+            archived = _archived_keys(db, batch)
+            unchanged_ids = []
+            # Rows to upsert by dedup_key, with whether they are new; a later
+            # duplicate within the run replaces the pending row
+            pending: Dict[str, Tuple[Dict[str, Any], str]] = {}
+            legacy = []
+            for cfp_data in batch:
+                key = cfp_data["dedup_key"]
+                existing_cfp = existing.get(key)
+                if key in pending:
+                    previous, kind = pending[key]
+                    if previous["content_hash"] == cfp_data["content_hash"]:
+                        batch_stats["unchanged"] += 1
+                    else:
+                        pending[key] = (cfp_data, kind)
+                        batch_stats["updated"] += 1
+                elif existing_cfp is None:
+                    if key in archived or _ended_before(cfp_data, archive_cutoff):
+                        skipped += 1
+                        continue
+                    pending[key] = (cfp_data, "insert")
+                    batch_stats["inserted"] += 1
+                elif existing_cfp.content_hash == cfp_data["content_hash"]:
+                    unchanged_ids.append(existing_cfp.id)
+                    batch_stats["unchanged"] += 1
+                elif existing_cfp.dedup_key != key:
+                    # Rows stored without a key, or under a former one, get theirs here
+                    for field, value in cfp_data.items():
+                        setattr(existing_cfp, field, value)
+                    existing_cfp.seen_generation = generation
+                    existing_cfp.withdrawn_at = None
+                    legacy.append(existing_cfp)
+                    batch_stats["updated"] += 1
+                else:
+                    pending[key] = (cfp_data, "update")
+                    batch_stats["updated"] += 1
+
+            db.flush()
+            ids = _upsert(db, [cfp_data for cfp_data, _ in pending.values()], generation) if pending else {}
+            if changes is not None:
+                changes.extend((row.id, "update") for row in legacy)
+                changes.extend((ids[key], kind) for key, (_, kind) in pending.items() if key in ids)
+
+            if generation is not None and unchanged_ids:
+                # Only the bookkeeping columns change; keep updated_at as it was
+                db.execute(
+                    update(CFP)
+                    .where(CFP.id.in_(unchanged_ids))
+                    .values(seen_generation=generation, withdrawn_at=None, updated_at=CFP.updated_at)
+                    .execution_options(synchronize_session=False)
+                )
+
+            metrics.STORE_BATCH_SECONDS.observe(time.perf_counter() - batch_start)
+            for outcome, count in batch_stats.items():
+                stats[outcome] += count
+                metrics.STORE_ROWS.labels(outcome).inc(count)
+
+    if skipped:
+        logger.info(f"Skipped {skipped} CFPs of archived or long-past events")
+    return stats
+
+
+def sweep_unseen_cfps(db: Session, source: str, generation: int) -> int:
+    """Withdraw the active CFPs of a source that the given run did not see.
+
+    Runs as one set-based UPDATE; call it only after the source was fetched
+    completely, otherwise a partial fetch would withdraw live rows.
+
+    Args:
+        db: Database session; the caller is responsible for committing
+        source: Source name as stored in cfps.source
+        generation: Id of the ingestion run that just stored the source
+
+    Returns:
+        int: Number of rows withdrawn
+    """
+    result = db.execute(
+        update(CFP)
+        .where(
+            CFP.source == source,
+            CFP.withdrawn_at.is_(None),
+            or_(CFP.seen_generation.is_(None), CFP.seen_generation < generation)
+        )
+        .values(withdrawn_at=datetime.utcnow(), updated_at=CFP.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
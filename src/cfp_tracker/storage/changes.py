@@ -0,0 +1,115 @@
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import and_, delete, func, insert, literal, or_, select
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+from ..config import Config
+from ..models.cfp import CFP, CFPChange
+from .dataset_version import read_dataset_version
+from .queries import READ_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+# Position in the change log: (dataset version, cfp id)
+ChangeCursor = Tuple[int, int]
+
+
+def format_change_id(cursor: ChangeCursor) -> str:
+    return f"{cursor[0]}-{cursor[1]}"
+
+
+def parse_change_id(value: Optional[str]) -> Optional[ChangeCursor]:
+    """Cursor of a change id such as "42-1337", or None if it is not one"""
+    try:
+        version, cfp_id = (value or "").split("-")
+        return int(version), int(cfp_id)
+    except ValueError:
+        return None
+
+
+def _prune(db: Session, version: int):
+    db.execute(
+        delete(CFPChange)
+        .where(CFPChange.version <= version - Config.CFP_CHANGES_RETAIN_VERSIONS)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def record_changes(db: Session, version: int, changes: Iterable[Tuple[int, str]]):
+    """Log the CFPs inserted or updated at a dataset version.
+
+    Call within the transaction that bumped the version to `version`.
+
+    Args:
+        db: Database session; the caller is responsible for committing
+        version: Version returned by bump_dataset_version
+        changes: (cfp id, "insert" or "update") pairs; the first kind seen for an id wins
+    """
+    kinds: Dict[int, str] = {}
+    for cfp_id, kind in changes:
+        kinds.setdefault(cfp_id, kind)
+    if kinds:
+        db.execute(insert(CFPChange), [
+            {"version": version, "cfp_id": cfp_id, "kind": kind} for cfp_id, kind in kinds.items()
+        ])
+    _prune(db, version)
+
+
+def record_changes_from_select(db: Session, version: int, changes: Select):
+    """Log changes selected as (cfp_id, kind) rows with one INSERT ... SELECT"""
+    subquery = changes.subquery()
+    db.execute(insert(CFPChange).from_select(
+        ["version", "cfp_id", "kind"],
+        select(literal(version), *subquery.c)
+    ))
+    _prune(db, version)
+
+
+def latest_change(db: Session) -> ChangeCursor:
+    """Cursor of the newest logged change, (0, 0) when there is none"""
+    version = db.query(func.max(CFPChange.version)).scalar()
+    if version is None:
+        return 0, 0
+    return version, db.query(func.max(CFPChange.cfp_id)).filter(CFPChange.version == version).scalar()
+
+
+def is_retained(db: Session, after: ChangeCursor) -> bool:
+    """Whether every change after a cursor is still in the log"""
+    return after[0] >= read_dataset_version(db) - Config.CFP_CHANGES_RETAIN_VERSIONS
+
+
+def read_changes(db: Session, after: ChangeCursor, limit: int) -> List[Dict[str, Any]]:
+    """Changes logged after a cursor, in log order, with the current CFP rows.
+
+    CFPs archived since they changed are left out.
+
+    Args:
+        db: Database session
+        after: Cursor of the last change already seen
+        limit: Maximum number of changes returned
+
+    Returns:
+        List[Dict[str, Any]]: Changes with their id, version, kind and CFP row
+    """
+    table = CFP.__table__
+    query = (
+        select(CFPChange.version, CFPChange.cfp_id, CFPChange.kind, *[table.c[name] for name in READ_COLUMNS])
+        .join(table, table.c.id == CFPChange.cfp_id)
+        .where(or_(
+            CFPChange.version > after[0],
+            and_(CFPChange.version == after[0], CFPChange.cfp_id > after[1])
+        ))
+        .order_by(CFPChange.version, CFPChange.cfp_id)
+        .limit(limit)
+    )
+    changes = []
+    for row in db.execute(query).mappings():
+        changes.append({
+            "id": format_change_id((row["version"], row["cfp_id"])),
+            "cursor": (row["version"], row["cfp_id"]),
+            "kind": row["kind"],
+            "cfp": {name: row[name] for name in READ_COLUMNS},
+        })
+    return changes
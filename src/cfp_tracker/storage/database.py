@@ -1,15 +1,141 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import StaticPool
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 import os
+from typing import Callable, Optional, Tuple
 from dotenv import load_dotenv
 
+from ..config import Config
+from ..utils.metrics import InstrumentedQueuePool
+
 load_dotenv()
 
-SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_URL")
+# An embedded SQLite file when unset, for single-node deployments and tests
+SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///cfp_tracker.db")
+# Optional read replica for read-only sessions; the primary serves them when unset
+SQLALCHEMY_REPLICA_URL = os.getenv("DATABASE_REPLICA_URL")
+
+def pool_limits(budget: int, workers: int) -> Tuple[int, int]:
+    """Pool size and overflow of one worker's share of the connection budget.
+    
+    One connection per worker is kept back for the dataset version
+    listener, which holds its own connection outside the pool; a quarter
+    of the rest is overflow, opened only under load.
+    
+    Args:
+        budget: Postgres connections available to all API workers together
+        workers: Number of worker processes
+        
+    Returns:
+        Tuple[int, int]: pool_size and max_overflow for create_engine
+    """
+    share = max(budget // max(workers, 1) - 1, 1)
+    overflow = share // 4
+    return share - overflow, overflow
+
+# API_WORKERS is exported to the workers by the production launcher
+pool_size, max_overflow = pool_limits(Config.DB_CONNECTION_BUDGET, Config.API_WORKERS)
+if Config.DB_POOL_SIZE is not None:
+    pool_size = Config.DB_POOL_SIZE
+if Config.DB_MAX_OVERFLOW is not None:
+    max_overflow = Config.DB_MAX_OVERFLOW
+
+_engine: Optional[Engine] = None
+_replica_engine: Optional[Engine] = None
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Tune each new SQLite connection.
+    
+    WAL lets readers run alongside the single writer and, with
+    synchronous=NORMAL, only syncs at checkpoints. The busy timeout makes
+    a second writer wait for the lock instead of failing at once.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute(f"PRAGMA synchronous={Config.SQLITE_SYNCHRONOUS}")
+    cursor.execute(f"PRAGMA busy_timeout={Config.SQLITE_BUSY_TIMEOUT_MS}")
+    # A negative cache_size is in KiB
+    cursor.execute(f"PRAGMA cache_size=-{Config.SQLITE_CACHE_SIZE_MB * 1024}")
+    cursor.execute(f"PRAGMA mmap_size={Config.SQLITE_MMAP_SIZE_MB * 1024 * 1024}")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+def create_database_engine(url: str, name: str = "primary") -> Engine:
+    """Create an engine with the pool settings and, per backend, the connection tuning.
+    
+    Args:
+        url: Database URL; Postgres and SQLite are supported
+        name: Pool name used as the label of the pool metrics
+        
+    Returns:
+        Engine: The new engine
+    """
+    backend = make_url(url).get_backend_name()
+    if backend == "sqlite" and make_url(url).database in (None, "", ":memory:"):
+        # Every connection to :memory: would be a separate empty database
+        engine = create_engine(url, poolclass=StaticPool, connect_args={"check_same_thread": False})
+        event.listen(engine, "connect", _set_sqlite_pragmas)
+        return engine
+    
+    options = {
+        # The instrumented pool reports checkout waits and connections in use to /metrics
+        "poolclass": InstrumentedQueuePool,
+        "pool_logging_name": name,
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": Config.DB_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": Config.DB_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": Config.DB_POOL_PRE_PING,
+    }
+    if backend == "postgresql" and Config.DB_STATEMENT_TIMEOUT_MS > 0:
+        options["connect_args"] = {"options": f"-c statement_timeout={Config.DB_STATEMENT_TIMEOUT_MS}"}
+    engine = create_engine(url, **options)
+    if backend == "sqlite":
+        event.listen(engine, "connect", _set_sqlite_pragmas)
+    return engine
+
+def get_engine() -> Engine:
+    """The process-wide engine, created on first use rather than at import"""
+    global _engine
+    if _engine is None:
+        _engine = create_database_engine(SQLALCHEMY_DATABASE_URL, "primary")
+    return _engine
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def get_replica_engine() -> Engine:
+    """Engine for read-only sessions: the replica if one is configured, else the primary"""
+    global _replica_engine
+    if not SQLALCHEMY_REPLICA_URL:
+        return get_engine()
+    if _replica_engine is None:
+        _replica_engine = create_database_engine(SQLALCHEMY_REPLICA_URL, "replica")
+    return _replica_engine
+
+def dispose_engine():
+    """Close pooled connections, e.g. on shutdown; the next use creates new engines"""
+    global _engine, _replica_engine
+    for engine in (_engine, _replica_engine):
+        if engine is not None:
+            engine.dispose()
+    _engine = _replica_engine = None
+
+class _LazySessionmaker(sessionmaker):
+    """sessionmaker that binds to its engine when a session is made rather than at import"""
+    
+    def __init__(self, engine_getter: Callable[[], Engine], **kw):
+        super().__init__(**kw)
+        self._engine_getter = engine_getter
+    
+    def __call__(self, **local_kw):
+        engine = self._engine_getter()
+        if self.kw.get("bind") is not engine:
+            self.configure(bind=engine)
+        return super().__call__(**local_kw)
+
+SessionLocal = _LazySessionmaker(get_engine, autocommit=False, autoflush=False)
+# Sessions that only read; they may lag the primary when a replica is configured
+ReadSessionLocal = _LazySessionmaker(get_replica_engine, autocommit=False, autoflush=False)
 
 Base = declarative_base()
 
@@ -19,4 +145,12 @@ def get_db():
     try:
         yield db
     finally:
-        db.close() 
\ No newline at end of file
+        db.close()
+
+def get_read_db():
+    """Dependency for getting a read-only database session, on the replica if there is one"""
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
@@ -0,0 +1,172 @@
+import logging
+import select
+import threading
+import time
+from datetime import datetime
+from typing import Callable, List, Optional
+
+from sqlalchemy import text, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from ..config import Config
+from ..models.cfp import DatasetVersion
+
+logger = logging.getLogger(__name__)
+
+# Postgres channel announcing a new dataset version; the payload is the version
+DATASET_CHANNEL = "cfp_dataset_changed"
+
+
+def read_dataset_version(db: Session) -> int:
+    """Current version of the CFP dataset (0 before the first write)"""
+    return db.query(DatasetVersion.version).filter(DatasetVersion.id == 1).scalar() or 0
+
+
+def fresh_session(version: int, read_db: Session, db: Session) -> Session:
+    """The read-only session if it already sees a dataset version, else the primary session.
+
+    A replica lags the primary. A response built from a replica that has
+    not replayed a version yet would be cached under that version until
+    the next write, so such reads go to the primary instead.
+
+    Args:
+        version: Dataset version the result will be cached under
+        read_db: Session from ReadSessionLocal
+        db: Session on the primary, only used if the replica is behind
+
+    Returns:
+        Session: The session to read from
+    """
+    if read_db.get_bind() is db.get_bind() or read_dataset_version(read_db) >= version:
+        return read_db
+    logger.debug(f"Read replica is behind dataset version {version}, reading from the primary")
+    return db
+
+
+def bump_dataset_version(db: Session) -> int:
+    """Increment the dataset version within the caller's transaction.
+
+    On Postgres the new version is also announced on DATASET_CHANNEL; the
+    notification is only delivered once the transaction commits.
+
+    Args:
+        db: Database session; the caller is responsible for committing
+
+    Returns:
+        int: The new version
+    """
+    result = db.execute(
+        update(DatasetVersion)
+        .where(DatasetVersion.id == 1)
+        .values(version=DatasetVersion.version + 1, updated_at=datetime.utcnow())
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount == 0:
+        db.add(DatasetVersion(id=1, version=1))
+        db.flush()
+    version = read_dataset_version(db)
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(text("SELECT pg_notify(:channel, :payload)"), {"channel": DATASET_CHANNEL, "payload": str(version)})
+    return version
+
+
+class DatasetVersionWatcher:
+    """Tracks the dataset version seen by this process
+
+    Writers in this process report new versions directly. Writes made by
+    other workers and scripts arrive through LISTEN on Postgres, or by
+    polling on other databases. Callbacks run whenever the version changes.
+    """
+
+    def __init__(self):
+        self.version: Optional[int] = None
+        self._callbacks: List[Callable[[int], None]] = []
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def on_change(self, callback: Callable[[int], None]):
+        self._callbacks.append(callback)
+
+    def set(self, version: int):
+        with self._lock:
+            if version == self.version:
+                return
+            self.version = version
+        logger.info(f"CFP dataset version is now {version}")
+        for callback in self._callbacks:
+            try:
+                callback(version)
+            except Exception as e:
+                logger.error(f"Error handling dataset version change: {e}")
+
+    def current(self, db: Session) -> int:
+        """Known version, read from the database the first time"""
+        if self.version is None:
+            self.set(read_dataset_version(db))
+        return self.version
+
+    def start(self, engine: Engine, session_factory: Callable[[], Session]):
+        """Follow changes made by other processes in a background thread"""
+        if self._thread is not None:
+            return
+        target = self._listen if engine.dialect.name == "postgresql" else self._poll
+        self._thread = threading.Thread(
+            target=target, args=(engine, session_factory), name="dataset-version-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def _refresh(self, session_factory: Callable[[], Session]):
+        db = session_factory()
+        try:
+            self.set(read_dataset_version(db))
+        finally:
+            db.close()
+
+    def _poll(self, engine: Engine, session_factory: Callable[[], Session]):
+        while True:
+            try:
+                self._refresh(session_factory)
+            except Exception as e:
+                logger.error(f"Error polling dataset version: {e}")
+            time.sleep(Config.DATASET_VERSION_POLL_SECONDS)
+
+    def _listen(self, engine: Engine, session_factory: Callable[[], Session]):
+        while True:
+            connection = None
+            try:
+                # A dedicated connection, detached so it does not count against the pool
+                connection = engine.raw_connection()
+                connection.detach()
+                dbapi_connection = connection.driver_connection
+                dbapi_connection.autocommit = True
+                with dbapi_connection.cursor() as cursor:
+                    cursor.execute(f"LISTEN {DATASET_CHANNEL}")
+                # Catch up on anything missed while not listening
+                self._refresh(session_factory)
+
+                while True:
+                    ready, _, _ = select.select([dbapi_connection], [], [], Config.DATASET_VERSION_POLL_SECONDS * 6)
+                    if not ready:
+                        self._refresh(session_factory)
+                        continue
+                    dbapi_connection.poll()
+                    latest = None
+                    while dbapi_connection.notifies:
+                        notify = dbapi_connection.notifies.pop(0)
+                        latest = max(latest or 0, int(notify.payload))
+                    if latest is not None and latest > (self.version or 0):
+                        self.set(latest)
+            except Exception as e:
+                logger.error(f"Dataset version listener failed, reconnecting: {e}")
+                time.sleep(Config.DATASET_VERSION_POLL_SECONDS)
+            finally:
+                if connection is not None:
+                    try:
+                        connection.close()
+                    except Exception:
+                        pass
+
+
+# Shared by the API, the ingestion pipeline and archival in this process
+dataset_version = DatasetVersionWatcher()
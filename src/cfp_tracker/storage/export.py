@@ -0,0 +1,129 @@
+import csv
+import io
+import json
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterator, List
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ..config import Config
+from ..models.cfp import CFP, CFPArchive
+
+logger = logging.getLogger(__name__)
+
+# Public columns of the cfps table, in table order; the bookkeeping columns
+# (dedup_key, content_hash, seen_generation) are not exported
+EXPORT_COLUMNS = [
+    "id", "conference_name", "submission_deadline", "conference_start_date",
+    "conference_end_date", "location", "is_virtual", "topics", "submission_url",
+    "source", "source_url", "description", "provenance", "withdrawn_at",
+    "created_at", "updated_at",
+]
+EXPORT_FORMATS = ("ndjson", "csv", "parquet")
+
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Unsupported type in CFP export: {type(value).__name__}")
+
+
+def iter_cfp_batches(
+    db: Session,
+    include_archived: bool = False,
+    include_withdrawn: bool = False,
+    batch_size: int = Config.EXPORT_BATCH_SIZE
+) -> Iterator[List[Dict[str, Any]]]:
+    """Stream CFP rows in batches without loading the table into memory
+
+    Uses yield_per, which reads through a server-side cursor on Postgres,
+    so memory stays constant however many rows are exported. Rows come in
+    id order, and archived rows after all the active ones.
+
+    Args:
+        db: Database session
+        include_archived: Also export rows moved to cfps_archive
+        include_withdrawn: Also export rows their source stopped listing
+        batch_size: Rows fetched from the cursor at a time
+
+    Yields:
+        List[Dict[str, Any]]: One batch of rows keyed by column name
+    """
+    models = [CFP, CFPArchive] if include_archived else [CFP]
+    for model in models:
+        table = model.__table__
+        query = select(*[table.c[name] for name in EXPORT_COLUMNS]).order_by(table.c.id)
+        if not include_withdrawn:
+            query = query.where(table.c.withdrawn_at.is_(None))
+        result = db.execute(query.execution_options(yield_per=batch_size))
+        for partition in result.mappings().partitions():
+            yield [dict(row) for row in partition]
+
+
+def iter_ndjson(batches: Iterator[List[Dict[str, Any]]]) -> Iterator[bytes]:
+    """Encode batches as newline-delimited JSON, one chunk per batch"""
+    for batch in batches:
+        yield "".join(
+            json.dumps(row, default=_json_default, separators=(",", ":")) + "\n" for row in batch
+        ).encode("utf-8")
+
+
+def iter_csv(batches: Iterator[List[Dict[str, Any]]]) -> Iterator[bytes]:
+    """Encode batches as CSV with a header row; list and JSON columns are JSON-encoded"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    yield buffer.getvalue().encode("utf-8")
+    buffer.seek(0)
+    buffer.truncate()
+    for batch in batches:
+        for row in batch:
+            writer.writerow([
+                json.dumps(value) if isinstance(value, (list, dict)) else
+                value.isoformat() if isinstance(value, datetime) else value
+                for value in (row[name] for name in EXPORT_COLUMNS)
+            ])
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+
+
+def write_parquet(batches: Iterator[List[Dict[str, Any]]], path: str) -> int:
+    """Write batches to a Parquet file, one row group per batch.
+
+    Needs the optional pyarrow dependency. topics is stored as a list of
+    strings and provenance as a JSON string.
+
+    Args:
+        batches: Batches from iter_cfp_batches
+        path: Output file
+
+    Returns:
+        int: Number of rows written
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise RuntimeError("Parquet export needs pyarrow: pip install pyarrow")
+
+    types = {
+        "Integer": pa.int64(), "String": pa.string(), "Text": pa.string(), "DateTime": pa.timestamp("us"),
+        "Boolean": pa.bool_(), "JSON": pa.string(), "JSONEncodedList": pa.list_(pa.string()),
+    }
+    schema = pa.schema([
+        (name, types[type(CFP.__table__.c[name].type).__name__]) for name in EXPORT_COLUMNS
+    ])
+
+    rows = 0
+    with pq.ParquetWriter(path, schema, compression="zstd") as writer:
+        for batch in batches:
+            for row in batch:
+                if row["provenance"] is not None:
+                    row["provenance"] = json.dumps(row["provenance"])
+            writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+            rows += len(batch)
+    logger.info(f"Wrote {rows} CFPs to {path}")
+    return rows
@@ -0,0 +1,87 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import Text, select, type_coerce, union_all
+from sqlalchemy.orm import Session
+
+from ..models.cfp import CFP, CFPArchive
+
+# Columns returned by CFP read queries
+READ_COLUMNS = [
+    "id", "conference_name", "submission_deadline", "conference_start_date",
+    "conference_end_date", "location", "is_virtual", "topics", "submission_url",
+    "source", "source_url", "description", "provenance", "created_at", "updated_at",
+]
+
+
+def _filtered_select(model, source, topic, deadline_from, deadline_to):
+    table = model.__table__
+    query = select(*[table.c[name] for name in READ_COLUMNS]).where(table.c.withdrawn_at.is_(None))
+    if source:
+        query = query.where(table.c.source == source)
+    if topic:
+        # topics is a JSON-encoded list of strings; match on the raw text
+        query = query.where(type_coerce(table.c.topics, Text).contains(f'"{topic}"'))
+    if deadline_from:
+        query = query.where(table.c.submission_deadline >= deadline_from)
+    if deadline_to:
+        query = query.where(table.c.submission_deadline <= deadline_to)
+    return query
+
+
+def list_cfps(
+    db: Session,
+    source: Optional[str] = None,
+    topic: Optional[str] = None,
+    deadline_from: Optional[datetime] = None,
+    deadline_to: Optional[datetime] = None,
+    include_archived: bool = False,
+    limit: int = 100,
+    offset: int = 0
+) -> List[Dict[str, Any]]:
+    """List active CFPs ordered by submission deadline.
+
+    Args:
+        db: Database session
+        source: Only CFPs from this source
+        topic: Only CFPs tagged with this topic
+        deadline_from: Only CFPs whose deadline is on or after this time
+        deadline_to: Only CFPs whose deadline is on or before this time
+        include_archived: Also search CFPs moved to cfps_archive
+        limit: Maximum number of CFPs returned
+        offset: Number of CFPs skipped
+
+    Returns:
+        List[Dict[str, Any]]: One dict per CFP
+    """
+    query = _filtered_select(CFP, source, topic, deadline_from, deadline_to)
+    if include_archived:
+        archived = _filtered_select(CFPArchive, source, topic, deadline_from, deadline_to)
+        combined = union_all(query, archived).subquery()
+        query = select(combined).order_by(combined.c.submission_deadline, combined.c.id)
+    else:
+        query = query.order_by(CFP.submission_deadline, CFP.id)
+
+    rows = db.execute(query.limit(limit).offset(offset)).mappings().all()
+    return [dict(row) for row in rows]
+
+
+def list_calendar_cfps(
+    db: Session,
+    source: Optional[str] = None,
+    topic: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """All active CFPs with a deadline or conference dates, for calendar feeds.
+
+    Args:
+        db: Database session
+        source: Only CFPs from this source
+        topic: Only CFPs tagged with this topic
+
+    Returns:
+        List[Dict[str, Any]]: One dict per CFP, in id order
+    """
+    query = _filtered_select(CFP, source, topic, None, None).where(
+        (CFP.submission_deadline.isnot(None)) | (CFP.conference_start_date.isnot(None))
+    )
+    return [dict(row) for row in db.execute(query.order_by(CFP.id)).mappings()]
@@ -0,0 +1,254 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ..config import Config
+from ..models.cfp import CFP
+from .dataset_version import read_dataset_version
+from .queries import READ_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _deadline_key(value: datetime) -> float:
+    """Seconds since the epoch of a naive UTC datetime, used as the sort key"""
+    return (value - _EPOCH).total_seconds()
+
+
+class OpenCFP:
+    """Compact row of the read model, holding the READ_COLUMNS of one CFP"""
+
+    __slots__ = tuple(READ_COLUMNS)
+
+    def __init__(self, row: Dict[str, Any]):
+        for name in READ_COLUMNS:
+            setattr(self, name, row[name])
+        # Sources and topics repeat across thousands of rows
+        self.source = sys.intern(self.source)
+        self.topics = [sys.intern(topic) for topic in self.topics or []]
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in READ_COLUMNS}
+
+
+class _DeadlineIndex:
+    """Row positions sorted by deadline, with the deadlines alongside for bisect"""
+
+    __slots__ = ("deadlines", "positions")
+
+    def __init__(self, all_deadlines: array, positions: Iterable[int]):
+        self.positions = array("l", positions)
+        self.deadlines = array("d", (all_deadlines[p] for p in self.positions))
+
+    def window(self, deadline_from: Optional[datetime], deadline_to: Optional[datetime]) -> array:
+        start = bisect_left(self.deadlines, _deadline_key(deadline_from)) if deadline_from else 0
+        end = bisect_right(self.deadlines, _deadline_key(deadline_to)) if deadline_to else len(self.deadlines)
+        return self.positions[start:end]
+
+
+class OpenCFPSnapshot:
+    """Immutable snapshot of the CFPs open at `cutoff`
+
+    Rows are kept in (submission_deadline, id) order, the order list_cfps
+    returns, with secondary deadline indexes per topic and per source.
+    `version` is the dataset version read before the rows, so the rows are
+    at least that recent.
+    """
+
+    def __init__(self, rows: List[OpenCFP], cutoff: datetime, version: int = 0):
+        self.cutoff = cutoff
+        self.version = version
+        self.built_at = time.monotonic()
+        self.rows = sorted(rows, key=lambda row: (row.submission_deadline, row.id))
+        deadlines = array("d", (_deadline_key(row.submission_deadline) for row in self.rows))
+
+        topic_positions: Dict[str, List[int]] = defaultdict(list)
+        source_positions: Dict[str, List[int]] = defaultdict(list)
+        for position, row in enumerate(self.rows):
+            for topic in set(row.topics):
+                topic_positions[topic].append(position)
+            source_positions[row.source].append(position)
+
+        self.all = _DeadlineIndex(deadlines, range(len(self.rows)))
+        self.by_topic = {topic: _DeadlineIndex(deadlines, p) for topic, p in topic_positions.items()}
+        self.by_source = {source: _DeadlineIndex(deadlines, p) for source, p in source_positions.items()}
+
+    def query(
+        self,
+        source: Optional[str] = None,
+        topic: Optional[str] = None,
+        deadline_from: Optional[datetime] = None,
+        deadline_to: Optional[datetime] = None,
+        limit: int = 100,
+        offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """Same filters and order as list_cfps, answered from memory"""
+        indexes = []
+        if topic is not None:
+            indexes.append(self.by_topic.get(topic))
+        if source is not None:
+            indexes.append(self.by_source.get(source))
+        if None in indexes:
+            return []
+        # Walk the narrowest index and filter on the other field
+        index = min(indexes, key=lambda i: len(i.positions)) if indexes else self.all
+
+        window = index.window(deadline_from, deadline_to)
+        if len(indexes) < 2:
+            # The index alone answers the query, so paging is a slice
+            return [self.rows[position].as_dict() for position in window[offset:offset + limit]]
+
+        results = []
+        skipped = 0
+        for position in window:
+            row = self.rows[position]
+            if source is not None and row.source != source:
+                continue
+            if topic is not None and topic not in row.topics:
+                continue
+            if skipped < offset:
+                skipped += 1
+                continue
+            results.append(row.as_dict())
+            if len(results) >= limit:
+                break
+        return results
+
+    def memory_bytes(self) -> int:
+        """Approximate memory held by the snapshot, shared objects counted once"""
+        seen = set()
+
+        def size(value) -> int:
+            if id(value) in seen:
+                return 0
+            seen.add(id(value))
+            total = sys.getsizeof(value)
+            if isinstance(value, list):
+                total += sum(size(item) for item in value)
+            elif isinstance(value, dict):
+                total += sum(size(k) + size(v) for k, v in value.items())
+            return total
+
+        total = size(self.rows)
+        for row in self.rows:
+            total += size(row) + sum(size(getattr(row, name)) for name in READ_COLUMNS)
+        for index in [self.all, *self.by_topic.values(), *self.by_source.values()]:
+            total += sys.getsizeof(index) + sys.getsizeof(index.positions) + sys.getsizeof(index.deadlines)
+        return total
+
+
+class OpenCFPReadModel:
+    """Process-wide holder of the current snapshot
+
+    Snapshots are rebuilt from the database and swapped in whole, so readers
+    never see a half-built one and need no lock.
+    """
+
+    def __init__(self):
+        self._snapshot: Optional[OpenCFPSnapshot] = None
+        self._refresh_lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._snapshot is not None
+
+    def refresh(self, db: Session) -> OpenCFPSnapshot:
+        """Rebuild the snapshot from the active CFPs whose deadline has not passed"""
+        with self._refresh_lock:
+            start = time.perf_counter()
+            cutoff = datetime.utcnow()
+            version = read_dataset_version(db)
+            table = CFP.__table__
+            query = select(*[table.c[name] for name in READ_COLUMNS]).where(
+                table.c.withdrawn_at.is_(None),
+                table.c.submission_deadline >= cutoff
+            )
+            rows = [OpenCFP(row) for row in db.execute(query).mappings()]
+            self._snapshot = OpenCFPSnapshot(rows, cutoff, version)
+            logger.info(f"Rebuilt open CFP read model: {len(rows)} CFPs in {time.perf_counter() - start:.3f}s")
+            return self._snapshot
+
+    def refresh_if_loaded(self, db: Session):
+        """Rebuild after a write, unless this process never serves from the model"""
+        if self.loaded:
+            self.refresh(db)
+
+    def snapshot_for(self, deadline_from: Optional[datetime], include_archived: bool = False) -> Optional[OpenCFPSnapshot]:
+        """The current snapshot if a query only asks for CFPs it holds, else None
+
+        The snapshot holds CFPs with a deadline at or after its cutoff, so only
+        queries starting at or after the cutoff can be answered from it.
+        Snapshots older than the maximum age are not trusted. Callers keep the
+        snapshot they got, so a rebuild swapped in meanwhile cannot mix the
+        rows of one version with the version of another.
+        """
+        snapshot = self._snapshot
+        if (
+            snapshot is not None
+            and not include_archived
+            and deadline_from is not None
+            and deadline_from >= snapshot.cutoff
+            and time.monotonic() - snapshot.built_at <= Config.READ_MODEL_MAX_AGE_SECONDS
+        ):
+            return snapshot
+        return None
+
+    def can_serve(self, deadline_from: Optional[datetime], include_archived: bool = False) -> bool:
+        """Whether a query only asks for CFPs the snapshot holds"""
+        return self.snapshot_for(deadline_from, include_archived) is not None
+
+    def query(self, **filters) -> List[Dict[str, Any]]:
+        return self._snapshot.query(**filters)
+
+    def stats(self) -> Dict[str, Any]:
+        """Size and age of the current snapshot"""
+        snapshot = self._snapshot
+        if snapshot is None:
+            return {"loaded": False}
+        memory = snapshot.memory_bytes()
+        rows = len(snapshot.rows)
+        return {
+            "loaded": True,
+            "cfps": rows,
+            "topics": len(snapshot.by_topic),
+            "sources": len(snapshot.by_source),
+            "cutoff": snapshot.cutoff.isoformat(),
+            "dataset_version": snapshot.version,
+            "age_seconds": round(time.monotonic() - snapshot.built_at, 1),
+            "memory_bytes": memory,
+            "memory_bytes_per_10k_cfps": round(memory * 10_000 / rows) if rows else 0,
+        }
+
+
+# Shared by the API and the ingestion pipeline of this process
+open_cfps = OpenCFPReadModel()
+
+
+def _refresh_with_session(session_factory: Callable[[], Session]):
+    db = session_factory()
+    try:
+        open_cfps.refresh(db)
+    finally:
+        db.close()
+
+
+async def refresh_periodically(session_factory: Callable[[], Session], interval_seconds: int):
+    """Keep the read model current, including writes made by other processes"""
+    while True:
+        try:
+            await asyncio.to_thread(_refresh_with_session, session_factory)
+        except Exception as e:
+            logger.error(f"Error refreshing open CFP read model: {e}")
+        await asyncio.sleep(interval_seconds)
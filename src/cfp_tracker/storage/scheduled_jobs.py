@@ -0,0 +1,178 @@
+import hashlib
+import logging
+from datetime import datetime, timedelta
+from typing import Callable, List, Optional
+
+from sqlalchemy import func, or_, select, update
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from ..models.cfp import ScheduledJob
+
+logger = logging.getLogger(__name__)
+
+
+def advisory_lock_key(name: str) -> int:
+    """Stable signed 64-bit Postgres advisory lock key of a job name"""
+    digest = hashlib.blake2b(f"cfp-tracker-job:{name}".encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+def ensure_job(db: Session, name: str, schedule: str, next_run_at: datetime) -> ScheduledJob:
+    """The state row of a job, created, or rescheduled when its schedule changed.
+
+    Args:
+        db: Database session; committed when the row is written
+        name: Job name
+        schedule: Cron expression the job runs on
+        next_run_at: First run of a new or rescheduled job
+
+    Returns:
+        ScheduledJob: The job's current state
+    """
+    job = db.get(ScheduledJob, name, populate_existing=True)
+    if job is None:
+        db.add(ScheduledJob(name=name, schedule=schedule, next_run_at=next_run_at))
+        try:
+            db.commit()
+        except IntegrityError:
+            # Another node created it first
+            db.rollback()
+        return db.get(ScheduledJob, name, populate_existing=True)
+    if job.schedule != schedule:
+        logger.info(f"Job {name} rescheduled from '{job.schedule}' to '{schedule}', next run at {next_run_at}")
+        job.schedule = schedule
+        job.next_run_at = next_run_at
+        db.commit()
+        db.refresh(job)
+    return job
+
+
+def list_jobs(db: Session) -> List[ScheduledJob]:
+    return db.query(ScheduledJob).order_by(ScheduledJob.name).all()
+
+
+def record_job_start(db: Session, name: str, node: str, started_at: datetime):
+    db.execute(
+        update(ScheduledJob)
+        .where(ScheduledJob.name == name)
+        .values(last_started_at=started_at, last_status="running", last_error=None, last_node=node)
+    )
+    db.commit()
+
+
+def record_job_result(
+    db: Session,
+    name: str,
+    finished_at: datetime,
+    status: str,
+    error: Optional[str],
+    next_run_at: datetime
+):
+    db.execute(
+        update(ScheduledJob)
+        .where(ScheduledJob.name == name)
+        .values(last_finished_at=finished_at, last_status=status, last_error=error, next_run_at=next_run_at)
+    )
+    db.commit()
+
+
+def read_job_watermark(db: Session, name: str) -> Optional[datetime]:
+    """How far the job's last successful run got, or None before its first one"""
+    return db.query(ScheduledJob.watermark).filter(ScheduledJob.name == name).scalar()
+
+
+def record_job_watermark(db: Session, name: str, watermark: datetime):
+    db.execute(update(ScheduledJob).where(ScheduledJob.name == name).values(watermark=watermark))
+    db.commit()
+
+
+class JobLock:
+    """A job's cross-node lock, held until release()
+
+    On Postgres this is a session-level advisory lock on a connection kept
+    open while the job runs, so it is also released if the node dies.
+    Elsewhere it is a lease on the job's row that expires after its TTL.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        connection: Optional[Connection] = None,
+        session_factory: Optional[Callable[[], Session]] = None,
+        owner: Optional[str] = None
+    ):
+        self.name = name
+        self._connection = connection
+        self._session_factory = session_factory
+        self._owner = owner
+
+    def release(self):
+        if self._connection is not None:
+            try:
+                self._connection.execute(select(func.pg_advisory_unlock(advisory_lock_key(self.name))))
+            finally:
+                self._connection.close()
+            return
+        db = self._session_factory()
+        try:
+            db.execute(
+                update(ScheduledJob)
+                .where(ScheduledJob.name == self.name, ScheduledJob.locked_by == self._owner)
+                .values(locked_by=None, locked_until=None)
+            )
+            db.commit()
+        finally:
+            db.close()
+
+
+def try_lock_job(
+    session_factory: Callable[[], Session],
+    name: str,
+    owner: str,
+    ttl_seconds: int
+) -> Optional[JobLock]:
+    """Take a job's cross-node lock without waiting.
+
+    Args:
+        session_factory: Creates sessions on the shared database
+        name: Job name; its state row must exist
+        owner: Identifies this node in the lease
+        ttl_seconds: How long the lease lasts without Postgres; longer than the job runs
+
+    Returns:
+        Optional[JobLock]: The lock, or None if another node holds it
+    """
+    db = session_factory()
+    try:
+        engine = db.get_bind()
+        if engine.dialect.name == "postgresql":
+            connection = engine.connect()
+            try:
+                acquired = connection.execute(select(func.pg_try_advisory_lock(advisory_lock_key(name)))).scalar()
+                # Session-level locks outlive the transaction
+                connection.commit()
+            except Exception:
+                connection.close()
+                raise
+            if not acquired:
+                connection.close()
+                return None
+            return JobLock(name, connection=connection)
+
+        now = datetime.utcnow()
+        result = db.execute(
+            update(ScheduledJob)
+            .where(
+                ScheduledJob.name == name,
+                or_(ScheduledJob.locked_until.is_(None), ScheduledJob.locked_until < now)
+            )
+            .values(locked_by=owner, locked_until=now + timedelta(seconds=ttl_seconds))
+        )
+        db.commit()
+        if result.rowcount != 1:
+            return None
+        return JobLock(name, session_factory=session_factory, owner=owner)
+    finally:
+        db.close()
@@ -0,0 +1,19 @@
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from ..models.cfp import SourcePoll
+
+
+def list_source_polls(db: Session, source: Optional[str] = None) -> List[SourcePoll]:
+    """Polling state of every source, or of the categories of one source"""
+    query = db.query(SourcePoll)
+    if source is not None:
+        query = query.filter(SourcePoll.source == source)
+    return query.order_by(SourcePoll.key).all()
+
+
+def next_poll_times(db: Session) -> Dict[str, datetime]:
+    """When each known source is next due, by poll key"""
+    return dict(db.query(SourcePoll.key, SourcePoll.next_poll_at).all())
@@ -0,0 +1,154 @@
+"""Prometheus metrics for ingestion, storage, notifications and the API.
+
+Metrics live in the default prometheus_client registry. Under several
+uvicorn workers set PROMETHEUS_MULTIPROC_DIR to an empty directory shared by
+the workers before they start: every worker then writes its samples to
+memory-mapped files there and /metrics aggregates them, whichever worker
+answers the scrape.
+"""
+import logging
+import os
+import time
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, CollectorRegistry, Counter, Gauge, Histogram, REGISTRY, generate_latest, multiprocess
+)
+from sqlalchemy.pool import QueuePool
+
+# Source fetches take seconds to minutes, single requests and DB work far less
+FETCH_BUCKETS = (0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+FAST_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+ADAPTER_FETCH_SECONDS = Histogram(
+    "cfp_adapter_fetch_seconds", "Duration of a full fetch of one source", ["source"], buckets=FETCH_BUCKETS
+)
+ADAPTER_REQUEST_SECONDS = Histogram(
+    "cfp_adapter_request_seconds", "Duration of a single HTTP request to a source", ["source"],
+    buckets=FAST_BUCKETS
+)
+ADAPTER_REQUESTS = Counter(
+    "cfp_adapter_requests_total", "HTTP requests made to sources, by response status", ["source", "status"]
+)
+ADAPTER_RESPONSE_BYTES = Counter(
+    "cfp_adapter_response_bytes_total", "Bytes of response bodies received from sources", ["source"]
+)
+ADAPTER_PARSED = Counter(
+    "cfp_adapter_parsed_total", "Raw records parsed into CFPs, by outcome", ["source", "outcome"]
+)
+
+STORE_BATCH_SECONDS = Histogram(
+    "cfp_store_batch_seconds", "Duration of storing one batch of CFPs", buckets=FAST_BUCKETS
+)
+STORE_ROWS = Counter("cfp_store_rows_total", "CFPs stored, by outcome", ["outcome"])
+DB_POOL_WAIT_SECONDS = Histogram(
+    "cfp_db_pool_checkout_wait_seconds", "Time spent waiting to check a connection out of the pool", ["pool"],
+    buckets=FAST_BUCKETS
+)
+# Gauges are summed over the live worker processes under PROMETHEUS_MULTIPROC_DIR
+DB_POOL_IN_USE = Gauge(
+    "cfp_db_pool_connections_in_use", "Connections checked out of the pool", ["pool"], multiprocess_mode="livesum"
+)
+DB_POOL_WAITING = Gauge(
+    "cfp_db_pool_checkouts_waiting", "Checkouts waiting for a pooled connection", ["pool"],
+    multiprocess_mode="livesum"
+)
+DB_POOL_CAPACITY = Gauge(
+    "cfp_db_pool_capacity", "Pool size plus overflow: the most connections the pool opens", ["pool"],
+    multiprocess_mode="livesum"
+)
+
+SLACK_POST_SECONDS = Histogram(
+    "cfp_slack_post_seconds", "Duration of a Slack webhook post", buckets=FAST_BUCKETS
+)
+SLACK_POSTS = Counter("cfp_slack_posts_total", "Slack webhook posts, by response status", ["status"])
+
+SCHEDULER_JOB_SECONDS = Histogram(
+    "cfp_scheduler_job_seconds", "Duration of a scheduled job run", ["job"], buckets=FETCH_BUCKETS
+)
+SCHEDULER_RUNS = Counter("cfp_scheduler_runs_total", "Scheduled job runs, by outcome", ["job", "status"])
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "cfp_http_request_seconds", "API request duration by route template", ["method", "route", "status"],
+    buckets=FAST_BUCKETS
+)
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that reports checkout waits and connections in use
+
+    Samples are labelled with the pool's logging name (create_engine's
+    pool_logging_name), which is kept when the pool is recreated.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._label = self._orig_logging_name or "primary"
+        DB_POOL_CAPACITY.labels(self._label).set(self.size() + self._max_overflow)
+
+    def _do_get(self):
+        waiting = DB_POOL_WAITING.labels(self._label)
+        waiting.inc()
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            waiting.dec()
+            DB_POOL_WAIT_SECONDS.labels(self._label).observe(time.perf_counter() - start)
+            DB_POOL_IN_USE.labels(self._label).set(self.checkedout())
+
+    def _do_return_conn(self, record):
+        try:
+            super()._do_return_conn(record)
+        finally:
+            DB_POOL_IN_USE.labels(self._label).set(self.checkedout())
+
+
+# SQLAlchemy keeps its own pool loggers at WARNING; this subclass logs under
+# this module instead, where pool lifecycle messages would reach the INFO log
+logging.getLogger(f"{__name__}.{InstrumentedQueuePool.__name__}").setLevel(logging.WARNING)
+
+
+class MetricsMiddleware:
+    """ASGI middleware timing API requests per route template
+
+    Routes are labelled by their template ("/api/v1/cfps/{id}") rather than
+    the raw path so label cardinality stays bounded.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = {"code": 500}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # The router stores the matched route in the scope
+            route = scope.get("route")
+            HTTP_REQUEST_SECONDS.labels(
+                scope["method"], getattr(route, "path", "unmatched"), str(status["code"])
+            ).observe(time.perf_counter() - start)
+
+
+def render_metrics():
+    """Exposition of all metrics, aggregated across workers in multiprocess mode
+
+    Returns:
+        Tuple[bytes, str]: Response body and content type
+    """
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
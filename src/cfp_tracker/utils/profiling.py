@@ -0,0 +1,158 @@
+"""Opt-in cProfile hooks around ingestion, storage, notifications and requests.
+
+Code marks a section with `with profile("storage"):`. A section is profiled
+when it is listed in CFP_PROFILE, when it was armed through the profiling
+admin endpoint, or, for API requests, when the request asks for it with an
+X-Profile header or a profile=1 query parameter (PROFILE_REQUESTS_ON_DEMAND).
+Each profile is written to PROFILE_DIR as a timestamped .prof file for
+snakeviz/pstats, next to a .txt summary of the top functions.
+
+When nothing is enabled a hook is a dictionary lookup returning a shared
+no-op context manager.
+"""
+import cProfile
+import io
+import logging
+import os
+import pstats
+import re
+import threading
+import time
+from contextlib import nullcontext
+from datetime import datetime
+from typing import Dict, List
+from urllib.parse import parse_qs
+
+from ..config import Config
+
+logger = logging.getLogger(__name__)
+
+SECTIONS = ("ingestion", "adapters", "storage", "slack", "requests")
+
+_enabled = frozenset(s.strip() for s in Config.PROFILE_SECTIONS.split(",") if s.strip())
+# Sections armed through the admin endpoint, with the number of runs left
+_armed: Dict[str, int] = {}
+_lock = threading.Lock()
+# Only one profiler can be active per thread; nested sections run unprofiled
+_local = threading.local()
+_NOOP = nullcontext()
+_UNSAFE_CHARS = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+class _Profiled:
+    def __init__(self, section: str, label: str):
+        self.section = section
+        self.label = label
+        self.profiler = cProfile.Profile()
+
+    def __enter__(self):
+        _local.active = True
+        self.started = time.perf_counter()
+        self.profiler.enable()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.profiler.disable()
+        _local.active = False
+        try:
+            write_profile(self.profiler, self.section, self.label, time.perf_counter() - self.started)
+        except OSError as e:
+            logger.error(f"Could not write {self.section} profile: {e}")
+        return False
+
+
+def profile(section: str, label: str = "", force: bool = False):
+    """Context manager profiling a section if profiling is enabled for it
+
+    Args:
+        section: One of SECTIONS
+        label: Extra detail for the file name, such as the source or route
+        force: Profile regardless of configuration (used for on-demand requests)
+    """
+    if not (force or _enabled or _armed):
+        return _NOOP
+    if getattr(_local, "active", False):
+        return _NOOP
+    if not force and section not in _enabled:
+        with _lock:
+            runs = _armed.get(section)
+            if not runs:
+                return _NOOP
+            if runs == 1:
+                del _armed[section]
+            else:
+                _armed[section] = runs - 1
+    return _Profiled(section, label)
+
+
+def arm(section: str, runs: int = 1):
+    """Profile the next runs of a section in this process"""
+    if section not in SECTIONS:
+        raise ValueError(f"Unknown profiling section '{section}'")
+    with _lock:
+        _armed[section] = _armed.get(section, 0) + runs
+
+
+def armed_sections() -> Dict[str, int]:
+    with _lock:
+        return dict(_armed)
+
+
+def enabled_sections() -> List[str]:
+    return sorted(_enabled)
+
+
+def write_profile(profiler: cProfile.Profile, section: str, label: str, elapsed: float) -> str:
+    """Write the raw profile and its top-N summary; returns the .prof path"""
+    os.makedirs(Config.PROFILE_DIR, exist_ok=True)
+    name = "-".join(part for part in (
+        datetime.utcnow().strftime("%Y%m%dT%H%M%S%fZ"), section, _UNSAFE_CHARS.sub("_", label).strip("_")
+    ) if part)
+    base_path = os.path.join(Config.PROFILE_DIR, f"{name}-{os.getpid()}")
+    profiler.dump_stats(f"{base_path}.prof")
+
+    summary = io.StringIO()
+    summary.write(f"{section} {label} took {elapsed:.3f}s\n\n")
+    stats = pstats.Stats(profiler, stream=summary)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(Config.PROFILE_TOP_N)
+    with open(f"{base_path}.txt", "w") as f:
+        f.write(summary.getvalue())
+
+    logger.info(f"Wrote {section} profile ({elapsed:.2f}s) to {base_path}.prof")
+    return f"{base_path}.prof"
+
+
+def list_profiles(limit: int = 50) -> List[str]:
+    """Most recent profile files, newest first"""
+    if not os.path.isdir(Config.PROFILE_DIR):
+        return []
+    names = sorted((n for n in os.listdir(Config.PROFILE_DIR) if n.endswith(".prof")), reverse=True)
+    return names[:limit]
+
+
+def _requested(scope) -> bool:
+    for name, value in scope.get("headers", ()):
+        if name == b"x-profile":
+            return value not in (b"", b"0", b"false")
+    query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+    return query.get("profile", ["0"])[0] not in ("", "0", "false")
+
+
+class ProfilingMiddleware:
+    """ASGI middleware profiling API requests
+
+    Requests are profiled when the requests section is enabled or armed, or
+    on demand when PROFILE_REQUESTS_ON_DEMAND is set. The event loop is
+    shared, so a profile also contains work of concurrent requests.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        force = Config.PROFILE_REQUESTS_ON_DEMAND and _requested(scope)
+        with profile("requests", f"{scope['method']} {scope['path']}", force=force):
+            await self.app(scope, receive, send)
@@ -0,0 +1,229 @@
+"""Lightweight tracing spans for the ingestion pipeline and the API.
+
+`with span("storage.store", records=n) as s:` opens a span as a child of the
+current one; the current span lives in a context variable, so it follows
+asyncio tasks, and SpanContext values can be passed on explicitly where the
+context is lost (FastAPI background tasks, threads). Finished spans go to
+the configured exporter: a JSONL file by default (TRACE_FILE), or any
+callable named in TRACE_EXPORTER as "package.module:factory" returning an
+object with export(span_dict) and shutdown(). Tracing is off unless
+TRACE_ENABLED is set, in which case span() costs one check and returns a
+shared no-op span.
+
+Every span also counts the SQL statements executed while it is current;
+counts roll up into the parent when a span ends.
+"""
+import atexit
+import importlib
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from contextvars import ContextVar
+from typing import Any, Dict, NamedTuple, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from ..config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class SpanContext(NamedTuple):
+    """Identifiers needed to continue a trace elsewhere"""
+    trace_id: str
+    span_id: str
+
+
+class Span:
+    """A timed operation with attributes"""
+
+    __slots__ = ("name", "trace_id", "span_id", "parent", "attributes", "start_ns", "_start_perf", "error", "_token")
+
+    def __init__(self, name: str, trace_id: str, parent: Optional[SpanContext], attributes: Dict[str, Any]):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent = parent
+        self.attributes = attributes
+        self.error: Optional[str] = None
+        self._token = None
+
+    @property
+    def context(self) -> SpanContext:
+        return SpanContext(self.trace_id, self.span_id)
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def set_attributes(self, **attributes: Any):
+        self.attributes.update(attributes)
+
+    def increment(self, key: str, amount: int = 1):
+        self.attributes[key] = self.attributes.get(key, 0) + amount
+
+    def __enter__(self) -> "Span":
+        self._token = _current_span.set(self)
+        self.start_ns = time.time_ns()
+        self._start_perf = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        duration_ns = time.perf_counter_ns() - self._start_perf
+        _current_span.reset(self._token)
+        if exc is not None:
+            self.error = f"{exc_type.__name__}: {exc}"
+        # Roll statement counts up so every span reports its whole subtree
+        statements = self.attributes.get("db.statements")
+        parent = _current_span.get()
+        if statements and parent is not None and self.parent is not None and parent.span_id == self.parent.span_id:
+            parent.increment("db.statements", statements)
+        _export({
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent.span_id if self.parent else None,
+            "name": self.name,
+            "start_us": self.start_ns // 1000,
+            "duration_us": duration_ns // 1000,
+            "attributes": self.attributes,
+            "error": self.error,
+        })
+        return False
+
+
+class _NoopSpan:
+    """Stands in for every span while tracing is disabled"""
+
+    context = None
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+    def set_attributes(self, **attributes: Any):
+        pass
+
+    def increment(self, key: str, amount: int = 1):
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+class JsonlFileExporter:
+    """Appends one JSON object per finished span to a file"""
+
+    def __init__(self, path: str):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "a", buffering=1024 * 1024)
+        self._lock = threading.Lock()
+
+    def export(self, span: Dict[str, Any]):
+        line = json.dumps(span, default=str) + "\n"
+        with self._lock:
+            self._file.write(line)
+            # Flush at the end of each trace so a crash loses at most one
+            if span["parent_id"] is None:
+                self._file.flush()
+
+    def shutdown(self):
+        with self._lock:
+            self._file.close()
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("cfp_tracker_current_span", default=None)
+_NOOP = _NoopSpan()
+_exporter = None
+
+
+def _load_exporter():
+    if Config.TRACE_EXPORTER == "jsonl":
+        return JsonlFileExporter(Config.TRACE_FILE)
+    module_name, _, factory = Config.TRACE_EXPORTER.partition(":")
+    return getattr(importlib.import_module(module_name), factory)()
+
+
+def set_exporter(exporter):
+    """Replace the exporter; None disables tracing"""
+    global _exporter
+    if _exporter is not None:
+        _exporter.shutdown()
+    _exporter = exporter
+
+
+def _export(span: Dict[str, Any]):
+    try:
+        _exporter.export(span)
+    except Exception as e:
+        logger.error(f"Could not export span {span['name']}: {e}")
+
+
+def span(name: str, parent: Optional[SpanContext] = None, **attributes: Any):
+    """Start a span as a child of the current span, or of an explicit parent
+
+    Args:
+        name: Dotted span name, such as "adapter.parse"
+        parent: Context captured with current_context() in another task or
+            thread; defaults to the current span
+        **attributes: Initial span attributes
+    """
+    if _exporter is None:
+        return _NOOP
+    if parent is None:
+        current = _current_span.get()
+        parent = current.context if current is not None else None
+    trace_id = parent.trace_id if parent else uuid.uuid4().hex
+    return Span(name, trace_id, parent, attributes)
+
+
+def current_span():
+    """The active span, or a no-op span outside any trace"""
+    return _current_span.get() or _NOOP
+
+
+def current_context() -> Optional[SpanContext]:
+    """Context of the active span, for continuing the trace in background work"""
+    current = _current_span.get()
+    return current.context if current is not None else None
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _count_statement(conn, cursor, statement, parameters, context, executemany):
+    current = _current_span.get()
+    if current is not None:
+        current.increment("db.statements")
+
+
+class TracingMiddleware:
+    """ASGI middleware opening a span per API request"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or _exporter is None:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                request_span.set_attribute("http.status", message["status"])
+            await send(message)
+
+        with span("http.request", method=scope["method"], path=scope["path"]) as request_span:
+            await self.app(scope, receive, send_wrapper)
+            route = scope.get("route")
+            if route is not None:
+                request_span.set_attribute("http.route", route.path)
+
+
+if Config.TRACE_ENABLED:
+    set_exporter(_load_exporter())
+    atexit.register(set_exporter, None)
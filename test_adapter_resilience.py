@@ -0,0 +1,45 @@
+"""Adapter retries, deadlines and circuit breaking against the local stub server"""
+import asyncio
+
+from benchmarks.stub_server import FaultProfile, StubSourceServer, point_adapters_at
+from src.cfp_tracker.config import Config
+from src.cfp_tracker.ingestion.manager import CFPIngestionManager
+
+
+def fetch_with_faults(faults_by_source, runs=1, deadline=5.0) -> CFPIngestionManager:
+    """Run fetch_all_cfps against a stub server injecting the given faults"""
+
+    async def run():
+        server = StubSourceServer(cfps=400, faults_by_source=faults_by_source)
+        base_url = await server.start()
+        manager = CFPIngestionManager()
+        point_adapters_at(manager, base_url)
+        for adapter in manager.adapters.values():
+            adapter.fetch_deadline_seconds = deadline
+            adapter.request_timeout_seconds = 1.0
+        try:
+            for _ in range(runs):
+                await manager.fetch_all_cfps()
+        finally:
+            await server.stop()
+        return manager
+
+    return asyncio.run(run())
+
+
+def test_transient_errors_are_retried():
+    manager = fetch_with_faults({"dev_events": FaultProfile(fail_first=2)})
+    assert manager.get_adapter("dev_events").fetch_complete
+
+
+def test_hung_source_is_cut_off_without_holding_up_the_others():
+    manager = fetch_with_faults({"dev_events": FaultProfile(hang_rate=1.0)}, deadline=2.0)
+    assert manager.get_adapter_status("dev_events")["last_error"]
+    assert manager.get_adapter("confs.tech").last_fetch_count > 0
+
+
+def test_circuit_opens_after_persistent_failures():
+    manager = fetch_with_faults(
+        {"github_events": FaultProfile(error_rate=1.0)}, runs=Config.CIRCUIT_FAILURE_THRESHOLD + 1
+    )
+    assert manager.get_adapter_status("github_events")["circuit"]["state"] == "open"
@@ -0,0 +1,77 @@
+"""Archiving past events and keeping them out of later ingestion runs"""
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.cfp_tracker.ingestion.resolution import resolve_duplicates
+from src.cfp_tracker.models.cfp import CFP, Base, CFPArchive, CFPSchema
+from src.cfp_tracker.storage.archival import archive_expired_cfps
+from src.cfp_tracker.storage.cfp_store import store_cfps
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def past_event(days_ago: int, name: str = "PyCon US 2026") -> CFPSchema:
+    ended = datetime.utcnow().replace(microsecond=0) - timedelta(days=days_ago)
+    return CFPSchema(
+        conference_name=name,
+        submission_deadline=ended - timedelta(days=90),
+        conference_start_date=ended - timedelta(days=2),
+        conference_end_date=ended,
+        location="Long Beach, CA",
+        submission_url="https://example.com/cfp",
+        source="tech-conferences",
+        source_url="https://confs.tech",
+    )
+
+
+def store(db, cfps):
+    stats = store_cfps(db, resolve_duplicates(cfps))
+    db.commit()
+    return stats
+
+
+def counts(db):
+    return db.scalar(select(func.count()).select_from(CFP)), db.scalar(select(func.count()).select_from(CFPArchive))
+
+
+def test_store_archive_cycle_settles(db):
+    # Ended yesterday: stored, then archived by a run archiving everything past
+    event = past_event(days_ago=1)
+    assert store(db, [event])["inserted"] == 1
+    assert archive_expired_cfps(db, older_than_days=0) == 1
+
+    # The source still lists it; the next runs neither re-insert nor re-archive it
+    for _ in range(2):
+        assert store(db, [event])["inserted"] == 0
+        assert archive_expired_cfps(db, older_than_days=0) == 0
+    assert counts(db) == (0, 1)
+
+
+def test_long_past_events_are_not_inserted(db):
+    stats = store(db, [past_event(days_ago=400), past_event(days_ago=-30, name="EuroPython")])
+    assert stats["inserted"] == 1
+    assert [row.conference_name for row in db.query(CFP)] == ["EuroPython"]
+
+
+def test_archiving_an_archived_event_again_keeps_one_row(db):
+    event = past_event(days_ago=1)
+    store(db, [event])
+    archive_expired_cfps(db, older_than_days=0)
+    # A row left over from before stores skipped archived events, reusing the archived id
+    stored = resolve_duplicates([event])[0]
+    db.add(CFP(id=1, **stored.model_dump()))
+    db.commit()
+
+    assert archive_expired_cfps(db, older_than_days=0) == 1
+    assert counts(db) == (0, 1)
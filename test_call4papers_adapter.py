@@ -0,0 +1,149 @@
+"""Paginated, windowed Call4Papers fetching against the local stub server"""
+import asyncio
+from datetime import datetime, timedelta
+
+from benchmarks.stub_server import FaultProfile, StubSourceServer
+from src.cfp_tracker.ingestion import call4papers_adapter
+from src.cfp_tracker.ingestion.call4papers_adapter import Call4PapersAdapter
+from src.cfp_tracker.ingestion.snapshots import ReplayRun, SnapshotStore
+
+
+def stub_adapter(base_url: str) -> Call4PapersAdapter:
+    adapter = Call4PapersAdapter()
+    adapter.api_url = f"{base_url}/api/v1/cfp"
+    adapter.request_timeout_seconds = 2.0
+    # Small pages, so every window spans several
+    adapter.page_size = 10
+    return adapter
+
+
+def fetch(faults=None, pagination="pages", sequential=False):
+    """Fetch from a stub of 2000 CFPs, a quarter of them (500) on Call4Papers
+
+    Returns the adapter, the source URLs fetched and the expected URLs.
+    """
+
+    async def run():
+        server = StubSourceServer(cfps=2000, faults_by_source={"call4papers": faults or FaultProfile()},
+                                  call4papers_pagination=pagination)
+        base_url = await server.start()
+        adapter = stub_adapter(base_url)
+        if sequential:
+            # One window, one page in flight
+            adapter.max_concurrent_requests = 1
+            adapter.window_days = adapter.lookahead_days + 1
+        try:
+            cfps = await adapter.get_cfps()
+        finally:
+            await server.stop()
+        return adapter, server, cfps
+
+    adapter, server, cfps = asyncio.run(run())
+    today = datetime.utcnow().date()
+    first, last = today.strftime("%Y-%m-%d"), (today + timedelta(days=adapter.lookahead_days)).strftime("%Y-%m-%d")
+    expected = sorted(
+        record["source_url"] for record in server.call4papers_records
+        if first <= record["submission_deadline"] <= last
+    )
+    return adapter, [cfp.source_url for cfp in cfps], expected
+
+
+def test_sequential_paging_fetches_every_open_cfp_once():
+    adapter, urls, expected = fetch(sequential=True)
+    assert adapter.fetch_complete
+    assert len(expected) > 5 * adapter.page_size
+    assert sorted(urls) == expected
+
+
+def test_concurrent_windows_are_merged_without_duplicates():
+    adapter, urls, expected = fetch()
+    assert adapter.fetch_complete
+    assert sorted(urls) == expected
+
+
+def test_cursors_are_followed_to_the_end():
+    adapter, urls, expected = fetch(pagination="cursor")
+    assert adapter.fetch_complete
+    assert sorted(urls) == expected
+
+
+def test_failed_pages_are_retried():
+    adapter, urls, expected = fetch(FaultProfile(error_rate=0.2))
+    assert adapter.fetch_complete
+    assert sorted(urls) == expected
+
+
+def test_missing_pages_leave_the_fetch_incomplete():
+    adapter, _, _ = fetch(FaultProfile(error_rate=1.0))
+    assert not adapter.fetch_complete
+
+
+class FiveDaysLater(datetime):
+    @classmethod
+    def utcnow(cls):
+        return datetime.utcnow() + timedelta(days=5)
+
+
+def record(store: SnapshotStore):
+    """Fetch from the stub while recording the payloads; returns the run, stub URL and source URLs"""
+
+    async def run():
+        server = StubSourceServer(cfps=2000)
+        base_url = await server.start()
+        adapter = stub_adapter(base_url)
+        adapter.snapshot_run = store.begin_run()
+        try:
+            cfps = await adapter.get_cfps()
+        finally:
+            await server.stop()
+        adapter.snapshot_run.close()
+        return adapter.snapshot_run.run_id, base_url, sorted(cfp.source_url for cfp in cfps)
+
+    return asyncio.run(run())
+
+
+def replay(replay_run: ReplayRun, base_url: str):
+    """Replay a recorded run in place of the stub it was recorded from"""
+    adapter = stub_adapter(base_url)
+    adapter.replay_run = replay_run
+    cfps = asyncio.run(adapter.get_cfps())
+    return adapter, sorted(cfp.source_url for cfp in cfps)
+
+
+def test_replay_on_a_later_day_requests_the_recorded_windows(tmp_path, monkeypatch):
+    store = SnapshotStore(str(tmp_path))
+    run_id, base_url, recorded_urls = record(store)
+    monkeypatch.setattr(call4papers_adapter, "datetime", FiveDaysLater)
+
+    adapter, urls = replay(store.load_run(run_id), base_url)
+    assert adapter.fetch_complete
+    assert urls == recorded_urls
+
+
+def test_replay_missing_a_page_is_incomplete(tmp_path):
+    store = SnapshotStore(str(tmp_path))
+    run_id, base_url, _ = record(store)
+    entries = store.load_run(run_id).entries
+    dropped = next(i for i, entry in enumerate(entries) if entry["params"].get("page") == 2)
+
+    adapter, _ = replay(ReplayRun(store, run_id, entries[:dropped] + entries[dropped + 1:]), base_url)
+    assert not adapter.fetch_complete
+
+
+def test_stub_serves_every_recorded_page(tmp_path):
+    store = SnapshotStore(str(tmp_path))
+    _, _, recorded_urls = record(store)
+
+    async def run():
+        server = StubSourceServer.from_snapshot(str(tmp_path))
+        base_url = await server.start()
+        adapter = stub_adapter(base_url)
+        try:
+            cfps = await adapter.get_cfps()
+        finally:
+            await server.stop()
+        return adapter, sorted(cfp.source_url for cfp in cfps)
+
+    adapter, urls = asyncio.run(run())
+    assert adapter.fetch_complete
+    assert urls == recorded_urls
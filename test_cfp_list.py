@@ -0,0 +1,59 @@
+"""The CFP list endpoint, from the read model and from the database"""
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.cfp_tracker.api.endpoints import cfps as cfps_endpoint
+from src.cfp_tracker.api.response_cache import ResponseCache
+from src.cfp_tracker.models.cfp import CFP, Base
+from src.cfp_tracker.storage.dataset_version import DatasetVersionWatcher
+from src.cfp_tracker.storage.read_model import OpenCFPReadModel
+
+NOW = datetime.utcnow().replace(microsecond=0)
+
+
+@pytest.fixture
+def db(monkeypatch):
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    for name, days in (("Past", -5), ("Soon", 5), ("Later", 20)):
+        session.add(CFP(conference_name=name, submission_deadline=NOW + timedelta(days=days),
+                        submission_url="https://example.com/cfp", source="test"))
+    session.commit()
+    # Fresh per-process state, so tests do not see each other's snapshots or cached responses
+    monkeypatch.setattr(cfps_endpoint, "open_cfps", OpenCFPReadModel())
+    monkeypatch.setattr(cfps_endpoint, "response_cache", ResponseCache(100, 2**20, 60))
+    monkeypatch.setattr(cfps_endpoint, "dataset_version", DatasetVersionWatcher())
+    yield session
+    session.close()
+
+
+def list_names(db, **params):
+    params = {"limit": 100, "offset": 0, "if_none_match": None, **params}
+    response = cfps_endpoint.get_cfps(read_db=db, db=db, **params)
+    assert response.status_code == 200
+    return [cfp["conference_name"] for cfp in json.loads(response.body)]
+
+
+@pytest.mark.parametrize("read_model_loaded", [True, False])
+@pytest.mark.parametrize("open_only", [True, False])
+def test_timezone_aware_deadlines_are_compared_as_utc(db, read_model_loaded, open_only):
+    if read_model_loaded:
+        cfps_endpoint.open_cfps.refresh(db)
+    # 10 days from now in UTC, written as 02:00 in UTC+02:00
+    deadline_to = (NOW + timedelta(days=10)).replace(tzinfo=timezone.utc).astimezone(timezone(timedelta(hours=2)))
+
+    names = list_names(db, deadline_from=datetime.now(timezone.utc), deadline_to=deadline_to, open_only=open_only)
+    assert names == ["Soon"]
+
+
+def test_timezone_aware_and_naive_utc_bounds_agree(db):
+    cfps_endpoint.open_cfps.refresh(db)
+    aware = list_names(db, deadline_from=(NOW - timedelta(days=10)).replace(tzinfo=timezone.utc))
+    naive = list_names(db, deadline_from=NOW - timedelta(days=10))
+    assert aware == naive == ["Past", "Soon", "Later"]
@@ -0,0 +1,64 @@
+"""Storing resolved CFPs across runs whose keys change"""
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.cfp_tracker.ingestion.pipeline import store_ingested_cfps
+from src.cfp_tracker.models.cfp import CFP, Base, CFPSchema
+
+SOURCE = "tech-conferences"
+
+
+class CompletedSources:
+    """Stands in for the ingestion manager: every source was fetched completely"""
+
+    def get_completed_sources(self):
+        return [SOURCE]
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def pycon(**dates) -> CFPSchema:
+    fields = {"submission_deadline": datetime(2026, 12, 1), "conference_start_date": None,
+              "conference_end_date": None, **dates}
+    return CFPSchema(conference_name="PyCon US 2027", location="Long Beach, CA",
+                     submission_url="https://example.com/cfp", source=SOURCE, source_url="https://confs.tech",
+                     **fields)
+
+
+def store(db, cfp):
+    return store_ingested_cfps(db, CompletedSources(), [cfp])
+
+
+@pytest.mark.parametrize("first, second", [
+    # The source adds the start date, so the key date moves from the deadline to it
+    ({}, {"conference_start_date": datetime(2027, 5, 14)}),
+    # The organisers move the event; the deadline stays
+    ({"conference_start_date": datetime(2027, 5, 14)}, {"conference_start_date": datetime(2027, 6, 4)}),
+])
+def test_event_keeps_its_row_when_its_key_date_changes(db, first, second):
+    assert store(db, pycon(**first))["inserted"] == 1
+    row = db.query(CFP).one()
+    row_id, created_at = row.id, row.created_at
+
+    stats = store(db, pycon(**second))
+    assert (stats["inserted"], stats["updated"], stats["withdrawn"]) == (0, 1, 0)
+    row = db.query(CFP).one()
+    assert (row.id, row.created_at, row.withdrawn_at) == (row_id, created_at, None)
+    assert row.dedup_key == f"pycon us|{second['conference_start_date']:%Y-%m-%d}"
+
+
+def test_next_edition_gets_its_own_row(db):
+    store(db, pycon())
+    stats = store(db, pycon(submission_deadline=datetime(2027, 12, 1)))
+    assert (stats["inserted"], stats["withdrawn"]) == (1, 1)
@@ -0,0 +1,41 @@
+"""Fan-out of CFP changes to server-sent event clients"""
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from src.cfp_tracker.api.cfp_stream import CFPStreamBroadcaster, StreamClient
+from src.cfp_tracker.api.endpoints import cfps as cfps_endpoint
+
+NOW = datetime.utcnow().replace(microsecond=0)
+
+
+def change(deadline: datetime) -> dict:
+    cfp = {"id": 1, "source": "test", "topics": [], "submission_deadline": deadline}
+    return {"kind": "insert", "id": "2-1", "cursor": (2, 1), "cfp": cfp}
+
+
+def test_stream_filters_are_compared_as_naive_utc(monkeypatch):
+    clients = []
+    monkeypatch.setattr(
+        cfps_endpoint, "stream_events", lambda request, broadcaster, client, resume: clients.append(client) or iter(())
+    )
+    asyncio.run(cfps_endpoint.stream_cfps(
+        request=None, source=None, topic=None,
+        deadline_from=datetime.now(timezone.utc), deadline_to=(NOW + timedelta(days=10)).replace(tzinfo=timezone.utc),
+        last_event_id="1-1"
+    ))
+
+    client = clients[0]
+    assert client.matches(change(NOW + timedelta(days=5))["cfp"])
+    assert not client.matches(change(NOW + timedelta(days=20))["cfp"])
+
+
+def test_a_failing_client_does_not_starve_the_others():
+    broadcaster = CFPStreamBroadcaster()
+    # Filters that cannot be compared with the stored naive dates
+    failing = StreamClient((1, 1), deadline_from=datetime.now(timezone.utc))
+    healthy = StreamClient((1, 1))
+    # A list rather than the set, so the failing client goes first
+    broadcaster._clients = [failing, healthy]
+
+    broadcaster._publish([change(NOW + timedelta(days=5))])
+    assert healthy.queue.qsize() == 1
@@ -0,0 +1,140 @@
+"""The streaming events README parser against READMEs of both formats it reads"""
+import asyncio
+import base64
+import json
+import random
+import re
+
+import pytest
+
+from benchmarks.stub_server import StubSourceServer, render_agenda_readme, synthetic_events
+from src.cfp_tracker.ingestion import base_adapter
+from src.cfp_tracker.ingestion.github_events_adapter import GitHubEventsAdapter
+from src.cfp_tracker.ingestion.markdown_events import iter_markdown_events
+
+FIXTURE = """# Developers Conferences Agenda
+
+* 1: [Before Any Year](https://early.example) - Online <a href="https://early.example/cfp"><img alt="CFP Early" src="https://img.shields.io/static/v1?label=CFP&message=until%2001-January-2025&color=red"></a>
+
+## 2025
+
+### January
+
+* 8-10: [CodeMash](https://www.codemash.org/) - Sandusky, Ohio (USA) <a href="https://sessionize.com/codemash-2025"><img alt="CFP CodeMash" src="https://img.shields.io/static/v1?label=CFP&message=until%2001-September-2024&color=red"></a>
+* 16: [No CFP Conf](https://nocfp.example) - Paris (France)
+* ~~20: [Cancelled Conf](https://gone.example) - Online <a href="https://gone.example/cfp"><img alt="CFP Gone" src="https://img.shields.io/static/v1?label=CFP&message=until%2001-December-2024&color=red"></a>~~
+* 30-2: [Month Span](https://span.example) - Online <a href="https://span.example/cfp"><img alt="CFP Span" src="https://img.shields.io/static/v1?label=CFP&message=until%2010-December-2024&color=green"></a>
+
+### December
+
+| Date | Name | Location | CFP |
+|---|---|---|---|
+| 30/12-02/01 | [Year Span](https://nye.example) | Lyon (France) | <a href="https://nye.example/cfp"><img alt="CFP NYE" src="https://img.shields.io/static/v1?label=CFP&message=until%2001-October-2025&color=green"></a> |
+"""
+
+FIXTURE_EXPECTED = [
+    ("CodeMash", "2025-01-08", "2025-01-10", "Sandusky, Ohio (USA)", "https://sessionize.com/codemash-2025", "2024-09-01"),
+    ("Month Span", "2025-01-30", "2025-02-02", "Online", "https://span.example/cfp", "2024-12-10"),
+    ("Year Span", "2025-12-30", "2026-01-02", "Lyon (France)", "https://nye.example/cfp", "2025-10-01"),
+]
+
+
+def legacy_parse(content: str):
+    """The adapter's former parser: one multi-line regex over the whole file"""
+    pattern = r"### (.+?)\n- Date: (.+?)\n- CFP: (.+?)\n"
+    return [
+        {"name": match.group(1), "date": match.group(2), "cfp_url": match.group(3)}
+        for match in re.finditer(pattern, content, re.MULTILINE)
+    ]
+
+
+def legacy_readme(rng: random.Random, count: int) -> str:
+    blocks = []
+    for i in range(count):
+        block = f"### Legacy Conf {i}\n- Date: 2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}\n"
+        # Blocks without a CFP line, and stray text, must be ignored by both
+        if rng.random() < 0.9:
+            block += f"- CFP: https://legacy.example/{i}/cfp\n"
+        if rng.random() < 0.2:
+            block += "Some notes about the event\n"
+        blocks.append(block)
+    return "# Events\n\n" + "\n".join(blocks)
+
+
+class RecordedEnvelope:
+    """Stands in for a replay run recorded when the README came base64-encoded"""
+
+    def __init__(self, content: str):
+        self.body = json.dumps({"content": base64.b64encode(content.encode("utf-8")).decode("ascii"),
+                                "encoding": "base64"})
+
+    def lookup(self, source, url, params):
+        return 200, self.body
+
+
+async def fetch_readme(adapter: GitHubEventsAdapter, base_url: str):
+    adapter.api_url = base_url
+    async with adapter._client_session() as session:
+        return await adapter._fetch_markdown_events(session, f"{base_url}/repos/o/r/contents/README.md", "README.md")
+
+
+def legacy_corpus():
+    rng = random.Random(11)
+    return [legacy_readme(rng, size) for size in (0, 1, 10, 500)]
+
+
+@pytest.mark.parametrize("content", legacy_corpus())
+def test_legacy_format_matches_the_former_regex_parser(content):
+    assert list(iter_markdown_events(content.splitlines())) == legacy_parse(content)
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_agenda_readme_parses_back_to_its_events(seed):
+    events = synthetic_events(1500, seed=seed)
+    parsed = list(iter_markdown_events(render_agenda_readme(events).splitlines()))
+    expected = sorted(
+        (e["name"], e["start"].strftime("%Y-%m-%d"), e["end"].strftime("%Y-%m-%d"),
+         f"{e['city']} ({e['country']})", f"{e['url']}/cfp", e["deadline"].strftime("%Y-%m-%d"))
+        for e in events
+    )
+    got = sorted((r["name"], r["date"], r["end_date"], r["location"], r["cfp_url"], r["cfp_deadline"]) for r in parsed)
+    assert got == expected
+
+
+def test_fixture_corner_cases():
+    parsed = list(iter_markdown_events(FIXTURE.splitlines()))
+    got = [(r["name"], r["date"], r["end_date"], r["location"], r["cfp_url"], r["cfp_deadline"]) for r in parsed]
+    assert got == FIXTURE_EXPECTED
+
+
+@pytest.fixture
+def agenda_readme():
+    events = synthetic_events(2000, seed=7)
+    for event in events[::3]:
+        # Multi-byte characters, split across chunks when streamed
+        event["name"] = f"Café Zürich Conf N{event['index']}"
+    return render_agenda_readme(events)
+
+
+def test_streaming_in_tiny_chunks_gives_the_same_events(agenda_readme, monkeypatch):
+    monkeypatch.setattr(base_adapter, "STREAM_CHUNK_BYTES", 7)
+
+    async def run():
+        server = StubSourceServer(cfps=8)
+        server.github_files["README.md"] = agenda_readme
+        base_url = await server.start()
+        try:
+            return await fetch_readme(GitHubEventsAdapter(), base_url)
+        finally:
+            await server.stop()
+
+    whole = list(iter_markdown_events(agenda_readme.splitlines()))
+    assert len(whole) == 2000
+    assert asyncio.run(run()) == whole
+
+
+def test_recorded_base64_payloads_still_parse(agenda_readme):
+    adapter = GitHubEventsAdapter()
+    adapter.replay_run = RecordedEnvelope(agenda_readme)
+    replayed = asyncio.run(fetch_readme(adapter, "http://recorded.invalid"))
+    assert replayed == list(iter_markdown_events(agenda_readme.splitlines()))
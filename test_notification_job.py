@@ -0,0 +1,73 @@
+"""The scheduled notification job's window across runs"""
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.cfp_tracker.config import Config
+from src.cfp_tracker.models.cfp import CFP, Base
+from src.cfp_tracker.notifications.slack_adapter import SlackAdapter
+from src.cfp_tracker.scheduler import jobs
+from src.cfp_tracker.storage.scheduled_jobs import ensure_job, record_job_watermark
+
+
+@pytest.fixture
+def session_factory(monkeypatch):
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    db = factory()
+    ensure_job(db, jobs.NOTIFICATIONS_JOB, "0 9 * * *", datetime.utcnow())
+    db.close()
+    monkeypatch.setattr(jobs, "SessionLocal", factory)
+    return factory
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    """Names of the CFPs posted to Slack, one list per post"""
+    posts = []
+    monkeypatch.setattr(Config, "SLACK_WEBHOOK_URL", "https://hooks.slack.invalid/services/T/B/X")
+    monkeypatch.setattr(
+        SlackAdapter, "post_cfps", lambda self, cfps: posts.append(sorted(cfp.conference_name for cfp in cfps)) or True
+    )
+    return posts
+
+
+def add_cfp(session_factory, name: str, created_at: datetime = None):
+    db = session_factory()
+    db.add(CFP(conference_name=name, submission_url="https://example.com/cfp", source="test",
+               created_at=created_at or datetime.utcnow()))
+    db.commit()
+    db.close()
+
+
+def test_each_cfp_is_notified_once(session_factory, sent):
+    add_cfp(session_factory, "Earlier", datetime.utcnow() - timedelta(hours=2))
+    jobs._notify()
+    jobs._notify()
+    add_cfp(session_factory, "Today")
+    jobs._notify()
+    assert sent == [["Earlier"], ["Today"]]
+
+
+def test_cfps_added_during_an_outage_are_notified(session_factory, sent):
+    db = session_factory()
+    record_job_watermark(db, jobs.NOTIFICATIONS_JOB, datetime.utcnow() - timedelta(days=3))
+    db.close()
+    add_cfp(session_factory, "Two days ago", datetime.utcnow() - timedelta(days=2))
+    jobs._notify()
+    assert sent == [["Two days ago"]]
+
+
+def test_failed_send_is_retried_by_the_next_run(session_factory, sent, monkeypatch):
+    add_cfp(session_factory, "Today")
+    post_cfps = SlackAdapter.post_cfps
+    monkeypatch.setattr(SlackAdapter, "post_cfps", lambda self, cfps: False)
+    with pytest.raises(RuntimeError):
+        jobs._notify()
+    monkeypatch.setattr(SlackAdapter, "post_cfps", post_cfps)
+    jobs._notify()
+    assert sent == [["Today"]]